@@ -1,5 +1,6 @@
 """Configuration management for AutoJournalSummarizer."""
 
 from .settings import Settings, get_settings
+from .tenants import TenantProfile, load_tenants
 
-__all__ = ["Settings", "get_settings"]
+__all__ = ["Settings", "get_settings", "TenantProfile", "load_tenants"]
@@ -2,6 +2,7 @@
 
 from functools import lru_cache
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -20,10 +21,45 @@ class Settings(BaseSettings):
     # ArXiv settings
     arxiv_category: str = Field(default="cs.LG", description="ArXiv category to search")
     arxiv_max_results: int = Field(default=50, description="Maximum papers to retrieve")
+    arxiv_cache_ttl: float = Field(
+        default=3600.0, description="arXiv API response cache TTL (s), 0 disables"
+    )
+    arxiv_cache_max_age_days: float = Field(
+        default=7.0, description="Days a stale arXiv response is kept for revalidation"
+    )
+    arxiv_feed_precheck: bool = Field(
+        default=True,
+        description="Skip runs when the category feed announces no new papers",
+    )
+    arxiv_feed_url: str = Field(
+        default="https://rss.arxiv.org/atom/{category}",
+        description="Announcement feed polled before the API query",
+    )
+    daemon_interval_minutes: float = Field(
+        default=10.0, description="Minutes between feed polls in daemon mode"
+    )
 
     # OpenAI settings
     openai_api_key: str | None = Field(default=None, description="OpenAI API key")
     default_model: str = Field(default="gpt-4o", description="Default OpenAI model")
+    filter_model: str = Field(
+        default="gpt-4o-mini", description="OpenAI model used for filtering"
+    )
+    filter_verdict_cache: bool = Field(
+        default=True, description="Reuse filter verdicts for already-judged papers"
+    )
+    summary_models: list[str] = Field(
+        default_factory=lambda: ["gpt-4o-mini", "gpt-4o"],
+        description="Summarization models, tried in order until one passes checks",
+    )
+    openai_hedge_percentile: float | None = Field(
+        default=None,
+        description="Latency percentile of recent calls after which a slow "
+        "request is duplicated; unset disables hedging",
+    )
+    openai_hedge_max_extra_usd: float = Field(
+        default=0.5, description="Cap on the estimated cost of duplicates per run"
+    )
 
     # Discord settings
     discord_webhook_url: str | None = Field(
@@ -42,10 +78,159 @@ class Settings(BaseSettings):
         default="papers", description="Google Drive folder name"
     )
 
+    # PDF extraction settings
+    pdf_max_file_mb: int = Field(
+        default=50, description="Maximum PDF file size to parse (MiB)"
+    )
+    pdf_max_pages: int | None = Field(
+        default=None, description="Maximum number of PDF pages to extract"
+    )
+    pdf_max_chars: int | None = Field(
+        default=None, description="Maximum number of characters to extract"
+    )
+    pdf_max_tokens: int | None = Field(
+        default=None, description="Maximum number of estimated tokens to extract"
+    )
+
+    download_per_host: int = Field(
+        default=2, description="Maximum concurrent PDF downloads per host"
+    )
+    download_stall_timeout: float = Field(
+        default=30.0, description="Seconds without data before a download resumes"
+    )
+    download_retries: int = Field(
+        default=3, description="Resumption attempts for a broken PDF download"
+    )
+    pdf_prefetch_papers: int = Field(
+        default=6,
+        description="Likely candidates downloaded while filtering, 0 disables",
+    )
+
+    # Paper text source settings
+    text_source: Literal["pdf", "latex", "html"] = Field(
+        default="pdf",
+        description="Where to read paper text from (falls back to the PDF)",
+    )
+    text_preprocessors: list[str] = Field(
+        default_factory=lambda: [
+            "page_artifacts",
+            "dehyphenate",
+            "references",
+            "appendix",
+            "captions",
+            "math_residue",
+            "whitespace",
+        ],
+        description="Cleanup steps applied to paper text before summarization",
+    )
+    source_timeout: float = Field(
+        default=60.0, description="Timeout for fetching LaTeX/HTML sources (s)"
+    )
+
+    # Async workflow settings
+    http_timeout: float = Field(
+        default=120.0, description="Timeout for async HTTP requests (s)"
+    )
+    async_max_papers_in_flight: int = Field(
+        default=24, description="Maximum papers processed concurrently"
+    )
+    async_download_concurrency: int = Field(
+        default=4, description="Maximum concurrent PDF downloads from arXiv"
+    )
+    async_openai_concurrency: int = Field(
+        default=8, description="Maximum concurrent OpenAI requests"
+    )
+    async_discord_concurrency: int = Field(
+        default=1, description="Maximum concurrent Discord webhook posts"
+    )
+    async_upload_concurrency: int = Field(
+        default=4, description="Maximum concurrent Google Drive/Zotero uploads"
+    )
+    async_pdf_workers: int = Field(
+        default=2, description="Worker processes for PDF text extraction"
+    )
+
+    # Distributed queue settings
+    queue_visibility_timeout: float = Field(
+        default=900.0, description="Job lease duration before it is reclaimed (s)"
+    )
+    queue_max_attempts: int = Field(
+        default=3, description="Leases allowed before a job is dead-lettered"
+    )
+    queue_retry_delay: float = Field(
+        default=60.0, description="Delay before a failed job is retried (s)"
+    )
+    queue_poll_interval: float = Field(
+        default=5.0, description="Worker polling interval when the queue is empty"
+    )
+
+    # Backfill settings
+    backfill_harvest_concurrency: int = Field(
+        default=4, description="Windows harvested concurrently during backfill"
+    )
+    backfill_max_results_per_window: int = Field(
+        default=2000, description="Maximum papers retrieved per backfill window"
+    )
+
+    # Usage and budget settings
+    daily_budget_usd: float | None = Field(
+        default=None, description="Daily OpenAI budget (USD); excess papers deferred"
+    )
+    openai_prices: dict[str, list[float]] = Field(
+        default_factory=dict,
+        description="USD per 1M input/output tokens, overriding built-in prices",
+    )
+
+    # Deadline settings
+    run_deadline_minutes: float | None = Field(
+        default=None, description="Wall-clock limit of a production run (minutes)"
+    )
+    deadline_reserve_minutes: float = Field(
+        default=5.0,
+        description="No new papers are started with less time than this left",
+    )
+    stage_timeouts: dict[str, float] = Field(
+        default_factory=lambda: {
+            "retrieve": 300.0,
+            "filter": 300.0,
+            "download": 300.0,
+            "source_text": 120.0,
+            "summarize": 600.0,
+            "discord": 60.0,
+            "gdrive": 300.0,
+            "zotero": 120.0,
+        },
+        description="Time budget of each external call per stage (s)",
+    )
+
+    # Search index settings
+    search_index: bool = Field(
+        default=True, description="Index processed papers for full-text search"
+    )
+
+    # Profiling settings
+    profile: bool = Field(
+        default=False, description="Write CPU and memory profiles per workflow stage"
+    )
+    profile_top_allocations: int = Field(
+        default=25, description="Allocation sites reported per profiled stage"
+    )
+
+    # Record/replay settings
+    cassette_mode: Literal["off", "record", "replay"] = Field(
+        default="off", description="Record or replay external interactions"
+    )
+    cassette_name: str = Field(
+        default="default", description="Cassette name (or path) under data/cassettes"
+    )
+
     # File paths
     base_dir: Path = Field(
         default_factory=lambda: Path.cwd(), description="Base directory"
     )
+    keywords_path: Path | None = Field(
+        default=None, description="Keywords file overriding the default location"
+    )
 
     @property
     def filter_prompt_file(self) -> Path:
@@ -65,8 +250,65 @@ class Settings(BaseSettings):
     @property
     def keywords_file(self) -> Path:
         """Path to keywords file."""
+        if self.keywords_path is not None:
+            return self.keywords_path
         return self.base_dir / "settings" / "keywords.txt"
 
+    @property
+    def tenants_file(self) -> Path:
+        """Path to multi-tenant profiles file."""
+        return self.base_dir / "settings" / "tenants.json"
+
+    @property
+    def data_dir(self) -> Path:
+        """Directory for local state such as queues and caches."""
+        return self.base_dir / "data"
+
+    @property
+    def arxiv_cache_dir(self) -> Path:
+        """Directory of cached arXiv API responses."""
+        return self.data_dir / "arxiv_cache"
+
+    @property
+    def feed_state_file(self) -> Path:
+        """Path to the validators and IDs of the last processed feed."""
+        return self.data_dir / "feed_state.json"
+
+    @property
+    def verdict_db_file(self) -> Path:
+        """Path to the filter verdict cache database."""
+        return self.data_dir / "verdicts.sqlite3"
+
+    @property
+    def search_index_file(self) -> Path:
+        """Path to the full-text search index database."""
+        return self.data_dir / "search.sqlite3"
+
+    @property
+    def profiles_dir(self) -> Path:
+        """Directory holding per-run profiling reports."""
+        return self.data_dir / "profiles"
+
+    @property
+    def usage_db_file(self) -> Path:
+        """Path to the OpenAI usage database."""
+        return self.data_dir / "usage.sqlite3"
+
+    @property
+    def deferred_papers_file(self) -> Path:
+        """Path to papers deferred to the next run by the budget."""
+        return self.data_dir / "deferred_papers.json"
+
+    @property
+    def cassette_dir(self) -> Path:
+        """Directory of the record/replay cassette."""
+        return self.data_dir / "cassettes" / self.cassette_name
+
+    @property
+    def queue_db_file(self) -> Path:
+        """Path to the distributed job queue database."""
+        return self.data_dir / "queue.sqlite3"
+
     @property
     def google_auth_settings_file(self) -> Path:
         """Path to Google auth settings file."""
@@ -92,6 +334,7 @@ class Settings(BaseSettings):
         directories = [
             self.base_dir / "prompts",
             self.base_dir / "settings",
+            self.data_dir,
         ]
         for directory in directories:
             directory.mkdir(parents=True, exist_ok=True)
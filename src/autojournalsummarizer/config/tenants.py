@@ -0,0 +1,70 @@
+"""Tenant profiles for fanning out one arXiv harvest to several teams."""
+
+import json
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from .settings import Settings
+
+
+class TenantProfile(BaseModel):
+    """Per-team overrides applied on top of the base settings.
+
+    Fields left unset inherit the value from the base settings, so a tenant
+    only needs to declare what differs from the default deployment.
+    """
+
+    name: str = Field(description="Unique tenant name")
+    keywords_file: Path | None = Field(
+        default=None, description="Keywords file (relative to base_dir)"
+    )
+    discord_webhook_url: str | None = Field(
+        default=None, description="Discord webhook URL for notifications"
+    )
+    zotero_api_key: str | None = Field(default=None, description="Zotero API key")
+    zotero_library_id: str | None = Field(default=None, description="Zotero library ID")
+    zotero_collection_name: str | None = Field(
+        default=None, description="Zotero collection name"
+    )
+    google_folder_name: str | None = Field(
+        default=None, description="Google Drive folder name"
+    )
+
+    def apply(self, settings: Settings) -> Settings:
+        """Derive the tenant's settings from the base settings.
+
+        Args:
+            settings: Base application settings.
+
+        Returns:
+            Copy of the settings with this tenant's overrides applied.
+        """
+        overrides = self.model_dump(exclude={"name"}, exclude_none=True)
+        if self.keywords_file is not None:
+            overrides.pop("keywords_file")
+            overrides["keywords_path"] = settings.base_dir / self.keywords_file
+        return settings.model_copy(update=overrides)
+
+
+def load_tenants(settings: Settings) -> list[TenantProfile]:
+    """Load tenant profiles from the tenants file.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        List of tenant profiles.
+
+    Raises:
+        FileNotFoundError: If the tenants file does not exist.
+        ValueError: If tenant names are not unique.
+    """
+    data = json.loads(settings.tenants_file.read_text())
+    tenants = [TenantProfile.model_validate(entry) for entry in data]
+
+    names = [tenant.name for tenant in tenants]
+    if len(names) != len(set(names)):
+        raise ValueError(f"Duplicate tenant names in {settings.tenants_file}")
+
+    return tenants
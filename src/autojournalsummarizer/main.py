@@ -1,43 +1,351 @@
 import argparse
+import asyncio
+import logging
+import os
+import time
+from datetime import date
 
-from .config import get_settings
+import schedule
+
+from .config import Settings, get_settings, load_tenants
 from .logging_config import setup_logging
-from .services import ServiceFactory, WorkflowService
+from .services import (
+    AsyncWorkflowService,
+    BackfillService,
+    CoordinatorService,
+    MultiTenantWorkflowService,
+    SearchIndex,
+    ServiceFactory,
+    WorkerService,
+    WorkflowService,
+    create_job_queue,
+    get_cassette,
+    get_download_manager,
+    reset_request_hedger,
+    reset_stage_profiler,
+    reset_usage_tracker,
+)
+
+
+def create_workflow_service(
+    settings: Settings, logger: logging.Logger, multi_tenant: bool = False
+) -> WorkflowService:
+    """Create the synchronous workflow service for the selected mode."""
+    service_factory = ServiceFactory(settings, logger)
+
+    if multi_tenant:
+        return MultiTenantWorkflowService(
+            settings, service_factory, logger, load_tenants(settings)
+        )
+
+    return WorkflowService(settings, service_factory, logger)
+
 
+def reset_run_state(settings: Settings) -> None:
+    """Reset the process-wide per-run services before a daemon run.
 
-def main(num_papers: int, model: str) -> None:
+    The usage tracker (run ID), the stage profiler (report directory) and the
+    request hedger (extra-spend cap) are recreated, and the download stats
+    start from zero, so each run is reported and capped on its own.
+    """
+    reset_usage_tracker(settings)
+    reset_stage_profiler(settings)
+    reset_request_hedger(settings)
+    get_download_manager(settings).reset_stats()
+
+
+def main(
+    num_papers: int,
+    model: str | None,
+    use_async: bool = False,
+    multi_tenant: bool = False,
+) -> None:
     """Run the production workflow for paper processing."""
     settings = get_settings()
     logger = setup_logging(settings, test_mode=False)
 
-    service_factory = ServiceFactory(settings, logger)
-    workflow_service = WorkflowService(settings, service_factory, logger)
+    if use_async:
+        service_factory = ServiceFactory(settings, logger)
+        async_workflow_service = AsyncWorkflowService(settings, service_factory, logger)
+        asyncio.run(
+            async_workflow_service.run_production_workflow_async(num_papers, model)
+        )
+        return
+
+    workflow_service = create_workflow_service(settings, logger, multi_tenant)
 
     workflow_service.run_production_workflow(num_papers, model)
 
 
-def test(num_papers: int, model: str) -> None:
+def daemon(
+    num_papers: int,
+    model: str | None,
+    interval_minutes: float | None = None,
+    use_async: bool = False,
+    multi_tenant: bool = False,
+) -> None:
+    """Run the production workflow repeatedly on a fixed interval.
+
+    Each run first polls the arXiv announcement feed, so runs without new
+    papers end after a single conditional request.
+    """
+    settings = get_settings()
+    logger = setup_logging(settings, test_mode=False)
+    interval = interval_minutes or settings.daemon_interval_minutes
+    if use_async:
+        service_factory = ServiceFactory(settings, logger)
+        async_workflow_service = AsyncWorkflowService(settings, service_factory, logger)
+
+        def run_once() -> None:
+            asyncio.run(
+                async_workflow_service.run_production_workflow_async(num_papers, model)
+            )
+
+    else:
+        workflow_service = create_workflow_service(settings, logger, multi_tenant)
+
+        def run_once() -> None:
+            workflow_service.run_production_workflow(num_papers, model)
+
+    def run() -> None:
+        try:
+            reset_run_state(settings)
+            run_once()
+        except Exception:
+            # The workflow logged the failure; keep polling
+            logger.exception("Scheduled run failed")
+        finally:
+            # Keep what a recording daemon has seen so far
+            cassette = get_cassette(settings)
+            if cassette is not None:
+                cassette.flush()
+
+    logger.info("Daemon started, polling every %s minutes", interval)
+    run()
+    schedule.every(round(interval * 60)).seconds.do(run)
+    while True:
+        schedule.run_pending()
+        time.sleep(1)
+
+
+def test(
+    num_papers: int,
+    model: str | None,
+    use_async: bool = False,
+    multi_tenant: bool = False,
+) -> None:
     """Run the test workflow for paper processing."""
     print("Test mode")
     settings = get_settings()
     logger = setup_logging(settings, test_mode=True)
 
-    service_factory = ServiceFactory(settings, logger)
-    workflow_service = WorkflowService(settings, service_factory, logger)
+    if use_async:
+        service_factory = ServiceFactory(settings, logger)
+        async_workflow_service = AsyncWorkflowService(settings, service_factory, logger)
+        asyncio.run(async_workflow_service.run_test_workflow_async(num_papers, model))
+        return
+
+    workflow_service = create_workflow_service(settings, logger, multi_tenant)
 
     workflow_service.run_test_workflow(num_papers, model)
 
 
+def coordinator(num_papers: int, model: str | None) -> None:
+    """Harvest and filter papers, then enqueue them for workers."""
+    settings = get_settings()
+    logger = setup_logging(settings, test_mode=False)
+
+    service_factory = ServiceFactory(settings, logger)
+    coordinator_service = CoordinatorService(
+        settings, service_factory, logger, create_job_queue(settings)
+    )
+
+    coordinator_service.run_coordinator(num_papers, model)
+
+
+def worker(worker_id: str | None = None, drain: bool = False) -> None:
+    """Process queued paper jobs."""
+    settings = get_settings()
+    logger = setup_logging(settings, test_mode=False)
+
+    service_factory = ServiceFactory(settings, logger)
+    worker_service = WorkerService(
+        settings, service_factory, logger, create_job_queue(settings), worker_id
+    )
+
+    worker_service.run_worker(drain=drain)
+
+
+def backfill(
+    start: date,
+    end: date,
+    num_papers: int,
+    model: str | None,
+    window_days: int = 1,
+    name: str | None = None,
+) -> None:
+    """Process a historical date range without moving the watermark."""
+    settings = get_settings()
+    logger = setup_logging(settings, test_mode=False)
+
+    service_factory = ServiceFactory(settings, logger)
+    backfill_service = BackfillService(
+        settings,
+        service_factory,
+        logger,
+        name or f"{settings.arxiv_category}_{start.isoformat()}_{end.isoformat()}",
+    )
+
+    backfill_service.run_backfill(start, end, num_papers, model, window_days)
+
+
+def search(query: str, limit: int = 10) -> None:
+    """Search processed papers in the local full-text index."""
+    settings = get_settings()
+    if not settings.search_index_file.exists():
+        print("Search index not found; it is built as papers are processed.")
+        return
+
+    started = time.perf_counter()
+    hits = SearchIndex(settings.search_index_file).search(query, limit)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    for rank, hit in enumerate(hits, start=1):
+        print(f"{rank}. {hit.title} ({hit.arxiv_id}, {hit.published[:10]})")
+        if hit.japanese_title:
+            print(f"   {hit.japanese_title}")
+        print(f"   {hit.snippet}")
+        print(f"   {hit.pdf_url}")
+    print(f"{len(hits)} results in {elapsed_ms:.1f} ms")
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--num_papers", type=int, default=20)
-    parser.add_argument("--model", type=str, default="gpt-4o")
+    parser.add_argument(
+        "--model",
+        type=str,
+        default=None,
+        help="Use one model for every stage instead of FILTER_MODEL/SUMMARY_MODELS",
+    )
     parser.add_argument("--test", action="store_true", default=False)
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        default=False,
+        help="Process papers concurrently with the asyncio workflow",
+    )
+    parser.add_argument(
+        "--tenants",
+        dest="multi_tenant",
+        action="store_true",
+        default=False,
+        help="Fan out one harvest to the tenants in settings/tenants.json",
+    )
+    parser.add_argument(
+        "--coordinator",
+        action="store_true",
+        default=False,
+        help="Harvest and filter papers and enqueue them for workers",
+    )
+    parser.add_argument(
+        "--worker",
+        action="store_true",
+        default=False,
+        help="Process paper jobs from the queue",
+    )
+    parser.add_argument("--worker_id", type=str, default=None)
+    parser.add_argument(
+        "--drain",
+        action="store_true",
+        default=False,
+        help="Stop the worker once the queue is empty",
+    )
+    parser.add_argument(
+        "--backfill",
+        nargs=2,
+        type=date.fromisoformat,
+        metavar=("START", "END"),
+        default=None,
+        help="Backfill papers submitted between two dates (YYYY-MM-DD)",
+    )
+    parser.add_argument("--window_days", type=int, default=1)
+    parser.add_argument("--backfill_name", type=str, default=None)
+    cassette_group = parser.add_mutually_exclusive_group()
+    cassette_group.add_argument(
+        "--record",
+        metavar="CASSETTE",
+        default=None,
+        help="Record all external interactions into a cassette",
+    )
+    cassette_group.add_argument(
+        "--replay",
+        metavar="CASSETTE",
+        default=None,
+        help="Serve external interactions from a cassette without network access",
+    )
+    parser.add_argument(
+        "--search",
+        metavar="QUERY",
+        default=None,
+        help="Search processed papers in the local full-text index",
+    )
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=False,
+        help="Write CPU and memory profiles of each stage to data/profiles",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        default=False,
+        help="Keep running and poll for new announcements on an interval",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=None,
+        help="Minutes between polls in daemon mode (DAEMON_INTERVAL_MINUTES)",
+    )
     args = parser.parse_args()
     num_papers = args.num_papers
     model = args.model
 
-    if args.test:
-        test(num_papers, model)
+    if args.use_async and args.multi_tenant:
+        parser.error("--async and --tenants cannot be combined")
+
+    # Settings are read from the environment, so the flags override it there
+    if args.record:
+        os.environ["CASSETTE_MODE"] = "record"
+        os.environ["CASSETTE_NAME"] = args.record
+    elif args.replay:
+        os.environ["CASSETTE_MODE"] = "replay"
+        os.environ["CASSETTE_NAME"] = args.replay
+
+    if args.profile:
+        os.environ["PROFILE"] = "true"
+
+    if args.search is not None:
+        search(args.search, args.limit)
+    elif args.backfill:
+        backfill(
+            args.backfill[0],
+            args.backfill[1],
+            num_papers,
+            model,
+            args.window_days,
+            args.backfill_name,
+        )
+    elif args.coordinator:
+        coordinator(num_papers, model)
+    elif args.worker:
+        worker(args.worker_id, args.drain)
+    elif args.daemon:
+        daemon(num_papers, model, args.interval, args.use_async, args.multi_tenant)
+    elif args.test:
+        test(num_papers, model, args.use_async, args.multi_tenant)
     else:
-        main(num_papers, model)
+        main(num_papers, model, args.use_async, args.multi_tenant)
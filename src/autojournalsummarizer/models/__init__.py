@@ -1,5 +1,5 @@
 """Data models for AutoJournalSummarizer."""
 
-from .paper import Keyword, Paper, Papers, PaperSummary
+from .paper import Keyword, Paper, PaperRecord, Papers, PaperSummary
 
-__all__ = ["Paper", "Papers", "Keyword", "PaperSummary"]
+__all__ = ["Paper", "PaperRecord", "Papers", "Keyword", "PaperSummary"]
@@ -1,7 +1,14 @@
 """Paper-related data models for structured data handling."""
 
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
 from pydantic import BaseModel, Field
 
+ARXIV_ABS_URL = "http://arxiv.org/abs/"
+
 
 class Paper(BaseModel):
     """Represents a filtered paper from arXiv search results."""
@@ -36,3 +43,80 @@ class PaperSummary(BaseModel):
     valid: str = Field(description="How the effectiveness was validated")
     discussion: str = Field(description="Limitations, challenges, or future work")
     keywords: list[Keyword] = Field(description="Key technical terms with explanations")
+
+
+@dataclass(frozen=True, slots=True)
+class PaperRecord:
+    """Compact arXiv paper metadata carried through the pipeline.
+
+    Built once from an ``arxiv.Result`` at retrieval time, keeping only the
+    fields the pipeline reads, so the full feed objects (links, categories,
+    author objects) can be freed right away.
+    """
+
+    short_id: str
+    title: str
+    published: datetime
+    authors: tuple[str, ...]
+    pdf_url: str
+    summary: str = ""
+    doi: str | None = None
+
+    @classmethod
+    def from_result(cls, result: Any) -> "PaperRecord":
+        """Build a record from an ``arxiv.Result``."""
+        return cls(
+            short_id=result.get_short_id(),
+            title=result.title,
+            published=result.published,
+            authors=tuple(author.name for author in result.authors),
+            pdf_url=result.pdf_url,
+            summary=result.summary,
+            doi=result.doi,
+        )
+
+    @property
+    def entry_id(self) -> str:
+        """URL of the paper's abstract page."""
+        return ARXIV_ABS_URL + self.short_id
+
+    @property
+    def arxiv_id(self) -> str:
+        """arXiv identifier without the version suffix."""
+        return re.sub(r"v[0-9]+$", "", self.short_id)
+
+    @property
+    def first_author(self) -> str:
+        """Name of the first author, or an empty string."""
+        return self.authors[0] if self.authors else ""
+
+    @property
+    def pdf_filename(self) -> str:
+        """File name used for the downloaded PDF (as ``arxiv.Result``)."""
+        title = re.sub(r"[^\w]", "_", self.title or "UNTITLED")
+        return f"{self.short_id.replace('/', '_')}.{title}.pdf"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize into a JSON-compatible dict."""
+        return {
+            "short_id": self.short_id,
+            "title": self.title,
+            "published": self.published.isoformat(),
+            "authors": list(self.authors),
+            "pdf_url": self.pdf_url,
+            "summary": self.summary,
+            "doi": self.doi,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PaperRecord":
+        """Rebuild a record serialized with :meth:`to_dict`."""
+        return cls(
+            short_id=data["short_id"],
+            title=data["title"],
+            published=datetime.fromisoformat(data["published"]),
+            authors=tuple(data["authors"]),
+            pdf_url=data["pdf_url"],
+            summary=data.get("summary", ""),
+            doi=data.get("doi"),
+        )
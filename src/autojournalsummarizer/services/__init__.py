@@ -1,21 +1,103 @@
 """Service layer modules for AutoJournalSummarizer."""
 
-from .arxiv import ArxivService
+from .arxiv import ArxivService, PoliteArxivClient
+from .async_workflow import AsyncWorkflowService
+from .backfill import BackfillService
+from .cassette import Cassette, CassetteMissError, get_cassette
+from .distributed import CoordinatorService, WorkerService, create_job_queue
+from .downloads import (
+    DownloadCancelledError,
+    DownloadManager,
+    PdfValidationError,
+    get_download_manager,
+)
 from .factory import ServiceFactory
+from .hedging import RequestHedger, get_request_hedger, reset_request_hedger
 from .integrations import DiscordService, GoogleDriveService, ZoteroService
+from .job_queue import Job, JobQueue, LeaseLostError
+from .multi_tenant import MultiTenantWorkflowService
 from .openai_service import OpenAIService
-from .utils import extract_text_from_pdf, get_last_published_datetime, update_log
+from .prefetch import PdfPrefetcher, rank_prefetch_candidates
+from .preprocess import PREPROCESSORS, preprocess_text, preprocessor
+from .profiling import StageProfiler, get_stage_profiler, reset_stage_profiler
+from .response_cache import ResponseCache
+from .search_index import SearchHit, SearchIndex, get_search_index
+from .source_text import (
+    ArxivSourceService,
+    extract_text_from_source_archive,
+    html_to_text,
+    latex_to_text,
+)
+from .usage import (
+    DeferredPapers,
+    UsageTracker,
+    get_usage_tracker,
+    reset_usage_tracker,
+)
+from .utils import (
+    PdfLimitError,
+    PdfTextStream,
+    extract_text_from_pdf,
+    get_last_published_datetime,
+    iter_pdf_text,
+    update_log,
+)
+from .verdict_cache import VerdictCache
 from .workflow import WorkflowService
 
 __all__ = [
     "ArxivService",
+    "PoliteArxivClient",
+    "ResponseCache",
+    "ArxivSourceService",
     "OpenAIService",
     "DiscordService",
     "GoogleDriveService",
     "ZoteroService",
     "ServiceFactory",
     "WorkflowService",
+    "AsyncWorkflowService",
+    "MultiTenantWorkflowService",
+    "BackfillService",
+    "Cassette",
+    "CassetteMissError",
+    "get_cassette",
+    "CoordinatorService",
+    "WorkerService",
+    "Job",
+    "JobQueue",
+    "LeaseLostError",
+    "create_job_queue",
+    "UsageTracker",
+    "DeferredPapers",
+    "get_usage_tracker",
+    "reset_usage_tracker",
+    "RequestHedger",
+    "get_request_hedger",
+    "reset_request_hedger",
+    "VerdictCache",
+    "SearchIndex",
+    "SearchHit",
+    "get_search_index",
+    "PREPROCESSORS",
+    "preprocess_text",
+    "preprocessor",
+    "PdfPrefetcher",
+    "rank_prefetch_candidates",
+    "StageProfiler",
+    "get_stage_profiler",
+    "reset_stage_profiler",
+    "DownloadManager",
+    "DownloadCancelledError",
+    "PdfValidationError",
+    "get_download_manager",
+    "PdfLimitError",
+    "PdfTextStream",
     "extract_text_from_pdf",
+    "extract_text_from_source_archive",
+    "html_to_text",
+    "latex_to_text",
+    "iter_pdf_text",
     "get_last_published_datetime",
     "update_log",
 ]
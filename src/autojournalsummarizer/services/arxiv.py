@@ -1,10 +1,176 @@
 """arXiv paper retrieval service."""
 
-from datetime import datetime, timezone
+import logging
+import math
+import threading
+from datetime import datetime, timedelta, timezone
 
 import arxiv  # type: ignore
+import feedparser  # type: ignore
+import requests
 
 from ..config import Settings
+from ..models import PaperRecord
+from .cassette import Cassette, get_cassette
+from .rate_limit import RateLimiter
+from .response_cache import CachedResponse, ResponseCache
+
+logger = logging.getLogger(__name__)
+
+# arXiv API terms of use ask for no more than one request every three seconds
+ARXIV_REQUEST_INTERVAL = 3.0
+
+ARXIV_DATETIME_FORMAT = "%Y%m%d%H%M%S"
+
+ARXIV_USER_AGENT = (
+    "autojournalsummarizer (+https://github.com/pkohei/autojournalsummarizer)"
+)
+
+# The API rejects pages larger than this
+ARXIV_MAX_PAGE_SIZE = 2000
+
+_rate_limiter_lock = threading.Lock()
+_rate_limiter: RateLimiter | None = None
+
+
+def get_arxiv_rate_limiter() -> RateLimiter:
+    """Process-wide limiter shared by every arXiv API request."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter(ARXIV_REQUEST_INTERVAL)
+        return _rate_limiter
+
+
+class PoliteArxivClient(arxiv.Client):
+    """arXiv client with a shared rate limit and an on-disk response cache.
+
+    Every feed request (including extra pages and retries) waits for a slot
+    from a process-wide ``RateLimiter``. Successful non-empty feeds are
+    cached by normalized URL: fresh entries are served from disk, and stale
+    entries are revalidated with ``If-None-Match``/``If-Modified-Since`` when
+    the server supplied validators. With a cassette, feeds are recorded or
+    replayed without any network access.
+
+    The client overrides the private ``_format_url`` and ``_parse_feed``
+    hooks of ``arxiv.Client``, so the ``arxiv`` dependency is pinned to the
+    minor version they were written against.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: RateLimiter,
+        cache: ResponseCache | None = None,
+        cassette: Cassette | None = None,
+        page_size: int = 1000,
+        num_retries: int = 3,
+        timeout: float = 60.0,
+    ) -> None:
+        """Initialize PoliteArxivClient.
+
+        Args:
+            rate_limiter: Limiter shared by all arXiv requests.
+            cache: Response cache, or None to disable caching.
+            cassette: Cassette to record feeds to or replay them from.
+            page_size: Maximum results fetched per request.
+            num_retries: Retries of a failing feed request.
+            timeout: Request timeout in seconds.
+        """
+        super().__init__(
+            page_size=page_size, delay_seconds=0.0, num_retries=num_retries
+        )
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.cassette = cassette
+        self.timeout = timeout
+
+    def _format_url(self, search: arxiv.Search, start: int, page_size: int) -> str:
+        """Don't request more entries than the search still needs."""
+        if search.max_results is not None:
+            page_size = max(1, min(page_size, search.max_results - start))
+        url: str = super()._format_url(search, start, page_size)
+        return url
+
+    def _parse_feed(
+        self, url: str, first_page: bool = True, _try_index: int = 0
+    ) -> feedparser.FeedParserDict:
+        """Serve a feed from the cassette, the cache or the API."""
+        if self.cassette is not None and self.cassette.replaying:
+            return feedparser.parse(self.cassette.lookup_url("arxiv", url))
+
+        feed, body = self._load_feed(url, first_page, _try_index)
+        if self.cassette is not None:
+            self.cassette.record_url("arxiv", url, body)
+        return feed
+
+    def _load_feed(
+        self, url: str, first_page: bool, try_index: int
+    ) -> tuple[feedparser.FeedParserDict, str]:
+        """Serve a feed from the cache or fetch it, retrying on failure."""
+        cached = self.cache.get(url) if self.cache is not None else None
+        if self.cache is not None and cached is not None:
+            if cached.is_fresh(self.cache.ttl):
+                self.cache.hits += 1
+                logger.info("Serving arXiv feed from cache: %s", url)
+                return feedparser.parse(cached.body), cached.body
+        if self.cache is not None:
+            self.cache.misses += 1
+
+        while True:
+            try:
+                return self._fetch_feed(url, first_page, try_index, cached)
+            except (
+                arxiv.HTTPError,
+                arxiv.UnexpectedEmptyPageError,
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+            ) as err:
+                if try_index >= self.num_retries:
+                    raise
+                logger.debug("Got error (try %d): %s", try_index, err)
+                try_index += 1
+
+    def _fetch_feed(
+        self,
+        url: str,
+        first_page: bool,
+        try_index: int,
+        cached: CachedResponse | None,
+    ) -> tuple[feedparser.FeedParserDict, str]:
+        """Fetch and validate a single feed page."""
+        self.rate_limiter.acquire()
+
+        headers = {"user-agent": ARXIV_USER_AGENT}
+        if cached is not None:
+            headers.update(cached.conditional_headers())
+
+        logger.info("Requesting arXiv page (try %d): %s", try_index, url)
+        response = self._session.get(url, headers=headers, timeout=self.timeout)
+
+        if response.status_code == 304 and cached is not None:
+            assert self.cache is not None
+            self.cache.revalidations += 1
+            body = cached.body
+        elif response.status_code != 200:
+            raise arxiv.HTTPError(url, try_index, response.status_code)
+        else:
+            body = response.text
+
+        feed = feedparser.parse(body)
+        if len(feed.entries) == 0:
+            if not first_page:
+                raise arxiv.UnexpectedEmptyPageError(url, try_index, feed)
+            # arXiv occasionally returns spurious empty pages; never cache them
+            return feed, body
+
+        if self.cache is not None:
+            self.cache.put(
+                url,
+                body,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        return feed, body
 
 
 class ArxivService:
@@ -13,10 +179,39 @@ class ArxivService:
     def __init__(self, settings: Settings) -> None:
         """Initialize ArxivService with settings."""
         self.settings = settings
+        self.rate_limiter = get_arxiv_rate_limiter()
+        self.cache: ResponseCache | None = None
+        if settings.arxiv_cache_ttl > 0:
+            self.cache = ResponseCache(
+                settings.arxiv_cache_dir,
+                settings.arxiv_cache_ttl,
+                settings.arxiv_cache_max_age_days * 86400,
+            )
+        self.client = PoliteArxivClient(
+            self.rate_limiter,
+            cache=self.cache,
+            cassette=get_cassette(settings),
+            page_size=min(
+                ARXIV_MAX_PAGE_SIZE, self.settings.backfill_max_results_per_window
+            ),
+        )
+
+    def _query_end(self) -> str:
+        """Upper bound for open-ended date queries.
+
+        Rounded up to the next cache TTL boundary so that repeated runs
+        within the TTL issue an identical, cacheable query.
+        """
+        now = datetime.now(tz=timezone.utc)
+        ttl = self.settings.arxiv_cache_ttl
+        if ttl > 0:
+            bucket = math.ceil(now.timestamp() / ttl) * ttl
+            now = datetime.fromtimestamp(bucket, tz=timezone.utc)
+        return now.strftime(ARXIV_DATETIME_FORMAT)
 
     def retrieve_recent_papers(
         self, start_datetime: datetime | None = None
-    ) -> list[arxiv.Result]:
+    ) -> list[PaperRecord]:
         """Retrieve recent papers from arXiv.
 
         Args:
@@ -30,9 +225,9 @@ class ArxivService:
         if start_datetime is None:
             query = f"cat:{category}"
         else:
-            start_datetime_str = start_datetime.strftime("%Y%m%d%H%M%S")
-            now = datetime.now(tz=timezone.utc).strftime("%Y%m%d%H%M%S")
-            query = f"cat:{category} AND submittedDate:[{start_datetime_str} TO {now}]"
+            start_datetime_str = start_datetime.strftime(ARXIV_DATETIME_FORMAT)
+            end = self._query_end()
+            query = f"cat:{category} AND submittedDate:[{start_datetime_str} TO {end}]"
 
         search = arxiv.Search(
             query=query,
@@ -40,7 +235,38 @@ class ArxivService:
             sort_by=arxiv.SortCriterion.SubmittedDate,
         )
 
-        client = arxiv.Client()
-        papers = list(client.results(search))
+        papers = [PaperRecord.from_result(r) for r in self.client.results(search)]
+
+        return papers[::-1]  # Reverse to get oldest first
+
+    def retrieve_papers_in_window(
+        self, start_datetime: datetime, end_datetime: datetime
+    ) -> list[PaperRecord]:
+        """Retrieve all papers submitted within a time window.
+
+        Safe to call from several threads at once: requests from all windows
+        share the process-wide rate limiter.
+
+        Args:
+            start_datetime: Inclusive window start.
+            end_datetime: Exclusive window end.
+
+        Returns:
+            List of arXiv papers sorted by submission date (oldest first).
+        """
+        start = start_datetime.strftime(ARXIV_DATETIME_FORMAT)
+        # submittedDate ranges are inclusive on both ends
+        end = (end_datetime - timedelta(seconds=1)).strftime(ARXIV_DATETIME_FORMAT)
+        query = (
+            f"cat:{self.settings.arxiv_category} AND submittedDate:[{start} TO {end}]"
+        )
+
+        search = arxiv.Search(
+            query=query,
+            max_results=self.settings.backfill_max_results_per_window,
+            sort_by=arxiv.SortCriterion.SubmittedDate,
+        )
+
+        papers = [PaperRecord.from_result(r) for r in self.client.results(search)]
 
         return papers[::-1]  # Reverse to get oldest first
@@ -0,0 +1,531 @@
+"""Asynchronous workflow orchestration for the paper processing pipeline."""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime
+from tempfile import TemporaryDirectory
+from typing import Any
+
+import httpx
+from openai import AsyncOpenAI
+
+from ..logging_config import log_with_context
+from ..models import PaperRecord
+from .deadline import DeadlineReachedError, RunDeadline, StageTimeoutError
+from .utils import adownload_pdf, extract_pdf_text_for_settings, update_log
+from .workflow import RetryableError, WorkflowService, async_retry_on_failure
+
+
+class WatermarkTracker:
+    """Advance the last-processed watermark over out-of-order completions.
+
+    Papers finish in arbitrary order when processed concurrently, but the
+    watermark may only move past a paper once every earlier paper is done, so
+    that an interrupted run never skips unprocessed papers.
+    """
+
+    def __init__(self, papers: list[PaperRecord]) -> None:
+        """Initialize WatermarkTracker.
+
+        Args:
+            papers: Papers of the run, sorted oldest first.
+        """
+        self._published: list[datetime] = [paper.published for paper in papers]
+        self._done = [False] * len(papers)
+        self._next = 0
+
+    def mark_done(self, index: int) -> datetime | None:
+        """Mark a paper as done.
+
+        Args:
+            index: Index of the paper in the run.
+
+        Returns:
+            New watermark if it advanced, otherwise None.
+        """
+        self._done[index] = True
+        advanced = None
+        while self._next < len(self._done) and self._done[self._next]:
+            advanced = self._published[self._next]
+            self._next += 1
+        return advanced
+
+
+class AsyncWorkflowService(WorkflowService):
+    """Asyncio-based workflow that keeps many papers in flight at once.
+
+    Network calls go through async HTTP and OpenAI clients, each external
+    destination is guarded by its own semaphore, blocking SDKs (Google Drive,
+    Zotero) run in worker threads and PDF parsing runs in a process pool.
+    """
+
+    _http: httpx.AsyncClient
+    _openai: AsyncOpenAI
+    _pdf_executor: ProcessPoolExecutor
+    _semaphores: dict[str, asyncio.Semaphore]
+
+    @asynccontextmanager
+    async def _async_resources(self) -> AsyncIterator[None]:
+        """Create the clients, executor and semaphores used during a run."""
+        self._semaphores = {
+            "papers": asyncio.Semaphore(self.settings.async_max_papers_in_flight),
+            "arxiv": asyncio.Semaphore(self.settings.async_download_concurrency),
+            "openai": asyncio.Semaphore(self.settings.async_openai_concurrency),
+            "discord": asyncio.Semaphore(self.settings.async_discord_concurrency),
+            "gdrive": asyncio.Semaphore(self.settings.async_upload_concurrency),
+            "zotero": asyncio.Semaphore(self.settings.async_upload_concurrency),
+        }
+        self._openai = self.factory.get_openai_service().create_async_client()
+        self._pdf_executor = ProcessPoolExecutor(
+            max_workers=self.settings.async_pdf_workers
+        )
+        try:
+            async with httpx.AsyncClient(timeout=self.settings.http_timeout) as http:
+                self._http = http
+                yield
+        finally:
+            self._pdf_executor.shutdown(wait=False, cancel_futures=True)
+            await self._openai.close()
+
+    async def run_production_workflow_async(
+        self, num_papers: int, model: str | None
+    ) -> None:
+        """Run the complete production workflow asynchronously.
+
+        Args:
+            num_papers: Maximum number of papers to process.
+            model: OpenAI model for every stage, or None to route per stage.
+        """
+        try:
+            log_with_context(
+                self.logger,
+                logging.INFO,
+                "Starting async production workflow",
+                num_papers=num_papers,
+                model=model,
+            )
+            self._deadline = RunDeadline.from_settings(self.settings)
+
+            self._ensure_setup()
+            feed_check = await asyncio.to_thread(self._check_feed)
+            if self._no_new_announcements(feed_check):
+                self._acknowledge_feed(feed_check)
+                return
+            papers = await asyncio.to_thread(self._retrieve_papers)
+
+            async with self._async_resources():
+                if not papers:
+                    await self._ahandle_no_papers()
+                    # Papers deferred by an earlier run are still due
+                    if await self._aprocess_interesting_papers([], [], model):
+                        self._acknowledge_feed(feed_check)
+                    return
+
+                interesting_papers = await self._afilter_papers(
+                    papers, num_papers, model
+                )
+                await self._asend_summary_notification(papers, interesting_papers)
+                completed = await self._aprocess_interesting_papers(
+                    papers, interesting_papers, model
+                )
+            if completed:
+                self._acknowledge_feed(feed_check)
+            self._log_usage_report()
+
+            log_with_context(
+                self.logger,
+                logging.INFO,
+                "Async production workflow completed successfully",
+                total_papers=len(papers),
+                interesting_papers=len(interesting_papers),
+            )
+
+        except Exception as e:
+            log_with_context(
+                self.logger,
+                logging.ERROR,
+                "Async production workflow failed",
+                error=str(e),
+            )
+            raise
+        finally:
+            self._flush_search_index()
+            self._write_profile_report()
+
+    async def run_test_workflow_async(self, num_papers: int, model: str | None) -> None:
+        """Run the test workflow asynchronously (no notifications/uploads).
+
+        Args:
+            num_papers: Maximum number of papers to process.
+            model: OpenAI model for every stage, or None to route per stage.
+        """
+        try:
+            log_with_context(
+                self.logger,
+                logging.INFO,
+                "Starting async test workflow",
+                num_papers=num_papers,
+                model=model,
+            )
+            self._deadline = RunDeadline.from_settings(self.settings)
+
+            self._ensure_setup()
+            papers = await asyncio.to_thread(self._retrieve_papers)
+
+            if not papers:
+                self.logger.info("No papers found for testing")
+                return
+
+            async with self._async_resources():
+                interesting_papers = await self._afilter_papers(
+                    papers, num_papers, model
+                )
+
+                # Process only the first interesting paper in test mode
+                if interesting_papers:
+                    await self._aprocess_single_paper_for_test(
+                        interesting_papers[0], model
+                    )
+            self._log_usage_report()
+
+            log_with_context(
+                self.logger,
+                logging.INFO,
+                "Async test workflow completed successfully",
+                total_papers=len(papers),
+                interesting_papers=len(interesting_papers),
+            )
+
+        except Exception as e:
+            log_with_context(
+                self.logger, logging.ERROR, "Async test workflow failed", error=str(e)
+            )
+            raise
+        finally:
+            self._flush_search_index()
+            self._write_profile_report()
+
+    async def _ahandle_no_papers(self) -> None:
+        """Handle the case when no new papers are found."""
+        self.logger.info("No new papers found")
+        discord_service = self.factory.get_discord_service()
+        message = "本日の新着論文はありません。"
+        async with self._semaphores["discord"]:
+            await self._deadline.acall(
+                "discord", discord_service.asend_message(self._http, message)
+            )
+
+    @async_retry_on_failure(max_retries=2, delay=1.0)
+    async def _afilter_papers(
+        self, papers: list[PaperRecord], num_papers: int, model: str | None
+    ) -> list[PaperRecord]:
+        """Filter papers based on keywords using the async OpenAI client."""
+        try:
+            openai_service = self.factory.get_openai_service()
+            async with self._semaphores["openai"]:
+                interesting_papers = await self._deadline.acall(
+                    "filter",
+                    openai_service.afilter_interesting_papers(
+                        self._openai, papers, num_papers, model
+                    ),
+                )
+
+            log_with_context(
+                self.logger,
+                logging.INFO,
+                "Papers filtered successfully",
+                total=len(papers),
+                interesting=len(interesting_papers),
+            )
+
+            return interesting_papers
+
+        except Exception as e:
+            log_with_context(
+                self.logger, logging.WARNING, "Failed to filter papers", error=str(e)
+            )
+            raise RetryableError(f"Paper filtering failed: {e}") from e
+
+    async def _asend_summary_notification(
+        self, papers: list[PaperRecord], interesting_papers: list[PaperRecord]
+    ) -> None:
+        """Send summary notification to Discord."""
+        try:
+            discord_service = self.factory.get_discord_service()
+            message = (
+                f"新着論文：{len(papers)}本\n"
+                f"関心度の高い論文：{len(interesting_papers)}本"
+            )
+            async with self._semaphores["discord"]:
+                await self._deadline.acall(
+                    "discord", discord_service.asend_message(self._http, message)
+                )
+
+            self.logger.info("Summary notification sent successfully")
+
+        except Exception as e:
+            log_with_context(
+                self.logger,
+                logging.WARNING,
+                "Failed to send summary notification",
+                error=str(e),
+            )
+            # Don't raise - this is not critical
+
+    async def _aprocess_interesting_papers(
+        self,
+        all_papers: list[PaperRecord],
+        interesting_papers: list[PaperRecord],
+        model: str | None,
+    ) -> bool:
+        """Process all interesting papers concurrently.
+
+        Budget planning and deferral work as in the synchronous workflow; the
+        budget is re-checked as each paper starts, so it can be overshot by
+        at most the papers already in flight. Papers that could not start or
+        finish before the run deadline do not advance the watermark, and
+        deferred ones go back to the backlog.
+
+        Returns:
+            False if a paper could not be finished before the deadline.
+        """
+        backlog, selected_ids = self._plan_budget(interesting_papers, model)
+        watermark = WatermarkTracker(all_papers)
+        unfinished: list[PaperRecord] = []
+
+        def finish(index: int) -> None:
+            advanced = watermark.mark_done(index)
+            if advanced is not None:
+                update_log(self.settings, advanced)
+
+        async def process(index: int | None, paper: PaperRecord) -> None:
+            started = time.monotonic()
+            try:
+                if self._budget_exhausted():
+                    self._defer_paper(paper)
+                else:
+                    await self._aprocess_single_paper(paper, model)
+            except DeadlineReachedError:
+                if index is None:
+                    self._defer_paper(paper, "Run deadline close")
+                else:
+                    unfinished.append(paper)
+                return
+            except Exception as e:
+                log_with_context(
+                    self.logger,
+                    logging.ERROR,
+                    "Failed to process paper",
+                    paper_title=paper.title,
+                    error=str(e),
+                )
+                # Continue with other papers rather than failing entire workflow
+            self._deadline.record_paper(time.monotonic() - started)
+            if index is not None:
+                finish(index)
+
+        tasks = [asyncio.create_task(process(None, paper)) for paper in backlog]
+        for index, paper in enumerate(all_papers):
+            if paper.short_id not in selected_ids:
+                finish(index)
+                continue
+            tasks.append(asyncio.create_task(process(index, paper)))
+
+        await asyncio.gather(*tasks)
+        if unfinished:
+            self._log_deadline_stop(len(unfinished))
+        return not unfinished
+
+    async def _aprocess_single_paper(
+        self, paper: PaperRecord, model: str | None
+    ) -> None:
+        """Process a single paper through the complete pipeline.
+
+        After the download, the summary branch runs concurrently with the
+        Google Drive upload and the Zotero registration, as in the
+        synchronous workflow.
+        """
+        async with self._semaphores["papers"]:
+            if not self._deadline.allows_new_paper():
+                raise DeadlineReachedError("Run deadline close, paper not started")
+            with TemporaryDirectory() as dirpath:
+                try:
+                    pdf_path = await self._adownload_pdf(paper, dirpath)
+
+                    # Blocking upload SDKs run in worker threads
+                    gdrive_service = self.factory.get_gdrive_service()
+                    zotero_service = self.factory.get_zotero_service()
+                    await self._arun_paper_branches(
+                        paper,
+                        {
+                            "summary": self._asummarize_and_notify(
+                                paper, pdf_path, model
+                            ),
+                            "gdrive": self._ato_thread(
+                                "gdrive", gdrive_service.upload_pdf, pdf_path
+                            ),
+                            "zotero": self._ato_thread(
+                                "zotero", zotero_service.register_paper, paper, pdf_path
+                            ),
+                        },
+                    )
+
+                    log_with_context(
+                        self.logger,
+                        logging.INFO,
+                        "Paper processed successfully",
+                        paper_title=paper.title,
+                    )
+
+                except Exception as e:
+                    log_with_context(
+                        self.logger,
+                        logging.ERROR,
+                        "Paper processing failed",
+                        paper_title=paper.title,
+                        error=str(e),
+                    )
+                    raise
+
+    async def _asummarize_and_notify(
+        self, paper: PaperRecord, pdf_path: str, model: str | None
+    ) -> None:
+        """Summary branch: extract text, summarize and post to Discord."""
+        text = await self._aextract_text(paper, pdf_path)
+
+        openai_service = self.factory.get_openai_service()
+        async with self._semaphores["openai"]:
+            summary = await self._deadline.acall(
+                "summarize",
+                openai_service.asummarize_paper(self._openai, paper.title, text, model),
+            )
+        self._index_paper(paper, text, summary)
+
+        discord_service = self.factory.get_discord_service()
+        message = discord_service.make_paper_message(paper=paper, summary=summary)
+        async with self._semaphores["discord"]:
+            await self._deadline.acall(
+                "discord", discord_service.asend_message(self._http, message)
+            )
+
+    async def _ato_thread(
+        self, semaphore: str, func: Callable[..., Any], *args: Any
+    ) -> None:
+        """Run a blocking call in a worker thread within a concurrency limit.
+
+        The semaphore name doubles as the stage whose time budget applies.
+        """
+        async with self._semaphores[semaphore]:
+            await self._deadline.acall(semaphore, asyncio.to_thread(func, *args))
+
+    async def _arun_paper_branches(
+        self, paper: PaperRecord, branches: dict[str, Awaitable[None]]
+    ) -> None:
+        """Run independent stages of a paper concurrently.
+
+        Args:
+            paper: Paper the branches belong to.
+            branches: Branch name to the coroutine running the branch.
+
+        Raises:
+            WorkflowError: If any branch failed, after all branches finished.
+        """
+
+        async def timed(branch: Awaitable[None]) -> float:
+            start = time.perf_counter()
+            await branch
+            return time.perf_counter() - start
+
+        results = await asyncio.gather(
+            *(timed(branch) for branch in branches.values()), return_exceptions=True
+        )
+        self._check_paper_branches(paper, dict(zip(branches, results, strict=True)))
+
+    async def _aprocess_single_paper_for_test(
+        self, paper: PaperRecord, model: str | None
+    ) -> None:
+        """Process a single paper for testing (no external uploads)."""
+        with TemporaryDirectory() as dirpath:
+            try:
+                pdf_path = await self._adownload_pdf(paper, dirpath)
+                text = await self._aextract_text(paper, pdf_path)
+
+                # Generate summary
+                openai_service = self.factory.get_openai_service()
+                async with self._semaphores["openai"]:
+                    summary = await self._deadline.acall(
+                        "summarize",
+                        openai_service.asummarize_paper(
+                            self._openai, paper.title, text, model
+                        ),
+                    )
+
+                # Create message (but don't send)
+                discord_service = self.factory.get_discord_service()
+                message = discord_service.make_paper_message(
+                    paper=paper, summary=summary
+                )
+
+                print(message)  # Print instead of sending
+
+                log_with_context(
+                    self.logger,
+                    logging.INFO,
+                    "Test paper processed successfully",
+                    paper_title=paper.title,
+                )
+
+            except Exception as e:
+                log_with_context(
+                    self.logger,
+                    logging.ERROR,
+                    "Test paper processing failed",
+                    paper_title=paper.title,
+                    error=str(e),
+                )
+                raise
+
+    async def _adownload_pdf(self, paper: PaperRecord, dirpath: str) -> str:
+        """Download a paper's PDF within the arXiv concurrency limit."""
+        replayed = self._replay_pdf(paper, dirpath)
+        if replayed is not None:
+            return replayed
+
+        async with self._semaphores["arxiv"]:
+            pdf_path = await self._deadline.acall(
+                "download", adownload_pdf(self._http, paper, dirpath)
+            )
+        self._record_pdf(paper, pdf_path)
+        return pdf_path
+
+    async def _aextract_text(self, paper: PaperRecord, pdf_path: str) -> str:
+        """Extract paper text without blocking the event loop.
+
+        Source fetching and preprocessing run in a worker thread; PDF parsing
+        is CPU-bound and runs in the process pool.
+        """
+        if self.settings.text_source != "pdf":
+            try:
+                source_text = await self._deadline.acall(
+                    "source_text", asyncio.to_thread(self._extract_source_text, paper)
+                )
+            except DeadlineReachedError:
+                raise
+            except StageTimeoutError as e:
+                self._log_source_timeout(paper, e)
+                source_text = None
+            if source_text:
+                return await asyncio.to_thread(
+                    self._preprocess_text, paper, source_text
+                )
+
+        loop = asyncio.get_running_loop()
+        text, stream = await loop.run_in_executor(
+            self._pdf_executor, extract_pdf_text_for_settings, pdf_path, self.settings
+        )
+        self._log_pdf_truncation(paper, stream)
+        return await asyncio.to_thread(self._preprocess_text, paper, text)
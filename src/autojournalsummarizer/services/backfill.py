@@ -0,0 +1,308 @@
+"""Historical backfill over submittedDate windows."""
+
+import json
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from ..config import Settings
+from ..logging_config import log_with_context
+from ..models import PaperRecord
+from .factory import ServiceFactory
+from .workflow import BudgetExhaustedError, WorkflowService
+
+
+def split_windows(
+    start: date, end: date, window_days: int
+) -> list[tuple[datetime, datetime]]:
+    """Split a date range into consecutive UTC windows.
+
+    Args:
+        start: First day of the range (inclusive).
+        end: Last day of the range (inclusive).
+        window_days: Length of each window in days.
+
+    Returns:
+        List of ``(start, end)`` datetimes; each end is exclusive.
+    """
+    if window_days < 1:
+        raise ValueError("window_days must be at least 1")
+    if end < start:
+        raise ValueError("Backfill end date is before start date")
+
+    range_end = datetime(end.year, end.month, end.day, tzinfo=timezone.utc)
+    range_end += timedelta(days=1)
+    cursor = datetime(start.year, start.month, start.day, tzinfo=timezone.utc)
+
+    windows = []
+    while cursor < range_end:
+        window_end = min(cursor + timedelta(days=window_days), range_end)
+        windows.append((cursor, window_end))
+        cursor = window_end
+    return windows
+
+
+def window_key(window: tuple[datetime, datetime]) -> str:
+    """Stable identifier of a window used in the checkpoint file."""
+    return f"{window[0].isoformat()}/{window[1].isoformat()}"
+
+
+class BackfillCheckpoint:
+    """Persistent progress of a backfill run.
+
+    Records finished windows and the IDs of papers already pushed through the
+    pipeline, so an interrupted backfill resumes without repeating work.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize BackfillCheckpoint, loading existing progress.
+
+        Args:
+            path: Path to the checkpoint JSON file.
+        """
+        self.path = path
+        data: dict[str, Any] = {}
+        if path.exists():
+            data = json.loads(path.read_text())
+        self.completed_windows: set[str] = set(data.get("completed_windows", []))
+        self.processed_ids: set[str] = set(data.get("processed_ids", []))
+
+    def mark_paper(self, paper_id: str) -> None:
+        """Record a processed paper and persist."""
+        self.processed_ids.add(paper_id)
+        self.save()
+
+    def mark_window(self, key: str) -> None:
+        """Record a finished window and persist."""
+        self.completed_windows.add(key)
+        self.save()
+
+    def save(self) -> None:
+        """Atomically write the checkpoint to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "completed_windows": sorted(self.completed_windows),
+                    "processed_ids": sorted(self.processed_ids),
+                }
+            )
+        )
+        tmp_path.replace(self.path)
+
+
+class BackfillService(WorkflowService):
+    """Push a historical date range through the pipeline.
+
+    Windows are harvested concurrently (all arXiv requests share one rate
+    limiter) while finished harvests are filtered and processed as they
+    arrive. The production watermark (``last_date.txt``) is never touched;
+    progress lives in a per-backfill checkpoint instead.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        service_factory: ServiceFactory,
+        logger: logging.Logger,
+        name: str,
+    ) -> None:
+        """Initialize BackfillService.
+
+        Args:
+            settings: Application settings.
+            service_factory: Factory for service instances.
+            logger: Logger instance.
+            name: Backfill name, used for the checkpoint file.
+        """
+        super().__init__(settings, service_factory, logger)
+        self.name = name
+        self.checkpoint = BackfillCheckpoint(
+            settings.data_dir / "backfill" / f"{name}.json"
+        )
+
+    def run_backfill(
+        self,
+        start: date,
+        end: date,
+        num_papers: int,
+        model: str | None,
+        window_days: int = 1,
+    ) -> None:
+        """Run the backfill for an inclusive date range.
+
+        Args:
+            start: First day to backfill.
+            end: Last day to backfill.
+            num_papers: Maximum number of papers to process per window.
+            model: OpenAI model for every stage, or None to route per stage.
+            window_days: Length of each harvest window in days.
+        """
+        windows = [
+            window
+            for window in split_windows(start, end, window_days)
+            if window_key(window) not in self.checkpoint.completed_windows
+        ]
+        log_with_context(
+            self.logger,
+            logging.INFO,
+            "Starting backfill",
+            name=self.name,
+            start=start.isoformat(),
+            end=end.isoformat(),
+            pending_windows=len(windows),
+            completed_windows=len(self.checkpoint.completed_windows),
+        )
+        self._ensure_setup()
+
+        arxiv_service = self.factory.get_arxiv_service()
+        started = time.monotonic()
+        processed = 0
+        windows_done = 0
+        budget_exhausted = False
+
+        with ThreadPoolExecutor(
+            max_workers=self.settings.backfill_harvest_concurrency
+        ) as executor:
+            futures: dict[Future, tuple[datetime, datetime]] = {
+                executor.submit(
+                    arxiv_service.retrieve_papers_in_window, *window
+                ): window
+                for window in windows
+            }
+            for future in as_completed(futures):
+                window = futures[future]
+                try:
+                    papers = future.result()
+                    window_processed, failed = self._process_window(
+                        papers, num_papers, model
+                    )
+                    processed += window_processed
+                except BudgetExhaustedError as e:
+                    # Every later window would stop the same way
+                    log_with_context(
+                        self.logger,
+                        logging.WARNING,
+                        "Daily budget exhausted, backfill stopped",
+                        window=window_key(window),
+                        error=str(e),
+                    )
+                    budget_exhausted = True
+                    for pending in futures:
+                        pending.cancel()
+                    break
+                except Exception as e:
+                    # Leave the window unfinished so the next run retries it
+                    log_with_context(
+                        self.logger,
+                        logging.ERROR,
+                        "Backfill window failed",
+                        window=window_key(window),
+                        error=str(e),
+                    )
+                    continue
+
+                if failed:
+                    # Failed papers are retried when the backfill is resumed
+                    log_with_context(
+                        self.logger,
+                        logging.WARNING,
+                        "Backfill window incomplete",
+                        window=window_key(window),
+                        failed_papers=failed,
+                    )
+                    continue
+
+                self.checkpoint.mark_window(window_key(window))
+                windows_done += 1
+                self._log_progress(
+                    window, windows_done, len(windows), processed, started
+                )
+        self._flush_search_index()
+
+        log_with_context(
+            self.logger,
+            logging.INFO,
+            "Backfill completed",
+            name=self.name,
+            windows=windows_done,
+            failed_windows=len(windows) - windows_done,
+            papers_processed=processed,
+            budget_exhausted=budget_exhausted,
+            elapsed_s=round(time.monotonic() - started, 1),
+        )
+
+    def _process_window(
+        self, papers: list[PaperRecord], num_papers: int, model: str | None
+    ) -> tuple[int, int]:
+        """Filter and process one harvested window.
+
+        Papers are not deferred by the daily budget: once it is used up, the
+        window is left unfinished and its remaining papers are processed when
+        the backfill is resumed.
+
+        Returns:
+            Number of papers processed and number of papers that failed;
+            failed papers are not checkpointed, so a resume retries them.
+
+        Raises:
+            BudgetExhaustedError: If today's OpenAI budget is used up.
+        """
+        papers = [
+            paper
+            for paper in papers
+            if paper.short_id not in self.checkpoint.processed_ids
+        ]
+        if not papers:
+            return 0, 0
+
+        self._check_budget()
+        interesting_papers = self._filter_papers(papers, num_papers, model)
+
+        processed = failed = 0
+        for paper in interesting_papers:
+            self._check_budget()
+            try:
+                self._process_single_paper(paper, model)
+            except Exception as e:
+                log_with_context(
+                    self.logger,
+                    logging.ERROR,
+                    "Failed to process paper",
+                    paper_title=paper.title,
+                    error=str(e),
+                )
+                failed += 1
+                continue
+            processed += 1
+            self.checkpoint.mark_paper(paper.short_id)
+
+        return processed, failed
+
+    def _log_progress(
+        self,
+        window: tuple[datetime, datetime],
+        windows_done: int,
+        windows_total: int,
+        processed: int,
+        started: float,
+    ) -> None:
+        """Log backfill progress and throughput."""
+        elapsed = time.monotonic() - started
+        rate = windows_done / elapsed if elapsed > 0 else 0.0
+        remaining = windows_total - windows_done
+        log_with_context(
+            self.logger,
+            logging.INFO,
+            "Backfill progress",
+            window=window_key(window),
+            windows_done=windows_done,
+            windows_total=windows_total,
+            papers_processed=processed,
+            papers_per_min=round(processed / elapsed * 60, 2) if elapsed else 0.0,
+            eta_s=round(remaining / rate, 1) if rate else None,
+        )
@@ -0,0 +1,204 @@
+"""Record/replay of external interactions for offline, reproducible runs."""
+
+import atexit
+import gzip
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any
+
+from ..config import Settings
+from .response_cache import normalize_url
+
+logger = logging.getLogger(__name__)
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when a request was not recorded."""
+
+    pass
+
+
+def interaction_key(*parts: str) -> str:
+    """Short stable digest identifying a request by its content."""
+    digest = hashlib.sha256("\x00".join(parts).encode())
+    return digest.hexdigest()[:24]
+
+
+class Cassette:
+    """Recorded external interactions of a run.
+
+    A cassette is a directory holding ``interactions.json.gz`` (one entry per
+    arXiv feed, OpenAI parsed output or webhook response) and a ``blobs``
+    directory of content-addressed binary payloads such as PDFs, so a PDF
+    that appears twice is stored once.
+
+    In replay mode an interaction is matched by kind and key. arXiv queries
+    contain the current date, so for them alone a key that was not recorded
+    is served the next unused interaction instead, and the replayed run
+    follows the recorded one in order. Any other unrecorded request, such as
+    a changed OpenAI prompt, is a miss.
+
+    Recorded interactions are kept in memory and written by :meth:`flush`,
+    which runs at interpreter exit for the cassettes of :func:`get_cassette`.
+    """
+
+    ORDERED_KINDS = frozenset({"arxiv"})
+
+    def __init__(self, path: Path, mode: str) -> None:
+        """Initialize Cassette, loading existing interactions when replaying.
+
+        Args:
+            path: Cassette directory.
+            mode: ``"record"`` or ``"replay"``.
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._interactions: list[dict[str, Any]] = []
+        self._used: set[int] = set()
+        self._unsaved = False
+
+        if self.replaying:
+            if not self._index_file.exists():
+                raise FileNotFoundError(f"Cassette not found: {self._index_file}")
+            with gzip.open(self._index_file, "rt", encoding="utf-8") as fh:
+                self._interactions = json.load(fh)
+
+    @property
+    def replaying(self) -> bool:
+        """Whether interactions are served from the cassette."""
+        return self.mode == "replay"
+
+    @property
+    def recording(self) -> bool:
+        """Whether interactions are written to the cassette."""
+        return self.mode == "record"
+
+    @property
+    def _index_file(self) -> Path:
+        return self.path / "interactions.json.gz"
+
+    @property
+    def _blob_dir(self) -> Path:
+        return self.path / "blobs"
+
+    def record(self, kind: str, key: str, value: Any) -> None:
+        """Append an interaction, written by the next :meth:`flush`.
+
+        Args:
+            kind: Interaction kind (``"arxiv"``, ``"openai"``, ...).
+            key: Request identifier within the kind.
+            value: JSON-serializable response.
+        """
+        with self._lock:
+            self._interactions.append({"kind": kind, "key": key, "value": value})
+            self._unsaved = True
+
+    def lookup(self, kind: str, key: str) -> Any:
+        """Serve a recorded response.
+
+        Args:
+            kind: Interaction kind.
+            key: Request identifier within the kind.
+
+        Returns:
+            Recorded response value.
+
+        Raises:
+            CassetteMissError: If the request was not recorded, or for
+                :attr:`ORDERED_KINDS`, no unused interaction of the kind is
+                left.
+        """
+        with self._lock:
+            candidates = [
+                idx
+                for idx, interaction in enumerate(self._interactions)
+                if interaction["kind"] == kind and idx not in self._used
+            ]
+            if not candidates:
+                raise CassetteMissError(f"No recorded {kind} interaction for {key}")
+
+            exact = [idx for idx in candidates if self._interactions[idx]["key"] == key]
+            if exact:
+                idx = exact[0]
+            elif kind in self.ORDERED_KINDS:
+                idx = candidates[0]
+                logger.warning(
+                    "Cassette has no %s interaction for %s, serving the next one",
+                    kind,
+                    key,
+                )
+            else:
+                raise CassetteMissError(f"No recorded {kind} interaction for {key}")
+            self._used.add(idx)
+            return self._interactions[idx]["value"]
+
+    def record_url(self, kind: str, url: str, value: Any) -> None:
+        """Record a response keyed by its normalized request URL."""
+        self.record(kind, normalize_url(url), value)
+
+    def lookup_url(self, kind: str, url: str) -> Any:
+        """Serve a response recorded with :meth:`record_url`."""
+        return self.lookup(kind, normalize_url(url))
+
+    def record_blob(self, kind: str, key: str, data: bytes) -> None:
+        """Record a binary response stored outside the index."""
+        digest = hashlib.sha256(data).hexdigest()
+        self._blob_dir.mkdir(parents=True, exist_ok=True)
+        blob_path = self._blob_dir / digest
+        if not blob_path.exists():
+            tmp_path = blob_path.with_suffix(".tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(blob_path)
+        self.record(kind, key, {"blob": digest})
+
+    def lookup_blob(self, kind: str, key: str) -> bytes:
+        """Serve a binary response recorded with :meth:`record_blob`."""
+        digest: str = self.lookup(kind, key)["blob"]
+        return (self._blob_dir / digest).read_bytes()
+
+    def flush(self) -> None:
+        """Atomically write the interaction index if anything was recorded."""
+        with self._lock:
+            if not self._unsaved:
+                return
+            self._save()
+            self._unsaved = False
+
+    def _save(self) -> None:
+        """Atomically rewrite the interaction index."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._index_file.with_suffix(".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as fh:
+            json.dump(self._interactions, fh, ensure_ascii=False)
+        tmp_path.replace(self._index_file)
+
+
+_cassettes_lock = threading.Lock()
+_cassettes: dict[tuple[Path, str], Cassette] = {}
+
+
+def get_cassette(settings: Settings) -> Cassette | None:
+    """Process-wide cassette configured in settings, or None when disabled.
+
+    All services of a run share the same instance so that recorded
+    interactions end up in one cassette, in the order they happened. A
+    recording cassette is flushed at interpreter exit.
+    """
+    if settings.cassette_mode == "off":
+        return None
+
+    key = (settings.cassette_dir.resolve(), settings.cassette_mode)
+    with _cassettes_lock:
+        if key not in _cassettes:
+            cassette = Cassette(settings.cassette_dir, settings.cassette_mode)
+            if cassette.recording:
+                atexit.register(cassette.flush)
+            _cassettes[key] = cassette
+        return _cassettes[key]
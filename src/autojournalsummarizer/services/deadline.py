@@ -0,0 +1,160 @@
+"""Run-wide deadline and per-stage time budgets."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, TypeVar
+
+from ..config import Settings
+
+T = TypeVar("T")
+
+
+class StageTimeoutError(TimeoutError):
+    """Raised when a stage call exceeds its time budget or the run deadline."""
+
+    pass
+
+
+class DeadlineReachedError(StageTimeoutError):
+    """Raised once the run deadline is (nearly) up, or when it cuts a call.
+
+    Raised instead of starting work after the deadline, and instead of
+    :class:`StageTimeoutError` when the run deadline, not the stage budget,
+    ended a call.
+    """
+
+    pass
+
+
+class RunDeadline:
+    """Deadline of one workflow run and the time budgets of its stages.
+
+    Each external call gets the smaller of its stage budget and the time left
+    in the run. A call that runs over is abandoned in a daemon thread, so a
+    hung SDK cannot hold the run (or interpreter exit) hostage. New papers are
+    only started while more than the reserve, or the average duration of a
+    paper so far, is left, so papers in flight can finish before the deadline.
+
+    Threads cannot be killed, so an abandoned call keeps running in the
+    background and may still take effect: a timed-out Discord post, Drive
+    upload or Zotero registration can land after the paper was logged as
+    failed, and a timed-out OpenAI request is still billed. Stage budgets are
+    meant as a backstop for hung calls and should be well above the normal
+    duration of a stage.
+    """
+
+    def __init__(
+        self,
+        seconds: float | None,
+        stage_timeouts: dict[str, float] | None = None,
+        reserve: float = 0.0,
+    ) -> None:
+        """Initialize RunDeadline.
+
+        Args:
+            seconds: Time the run may take, or None for no deadline.
+            stage_timeouts: Time budget of each call per stage name.
+            reserve: Seconds kept free for papers in flight.
+        """
+        self.expires_at = None if seconds is None else time.monotonic() + seconds
+        self.stage_timeouts = stage_timeouts or {}
+        self.reserve = reserve
+        self._lock = threading.Lock()
+        self._paper_seconds: list[float] = []
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "RunDeadline":
+        """Start the deadline of a run as configured."""
+        minutes = settings.run_deadline_minutes
+        return cls(
+            None if minutes is None else minutes * 60,
+            settings.stage_timeouts,
+            settings.deadline_reserve_minutes * 60,
+        )
+
+    def remaining(self) -> float | None:
+        """Seconds left in the run, or None without a deadline."""
+        if self.expires_at is None:
+            return None
+        return self.expires_at - time.monotonic()
+
+    def timeout(self, stage: str) -> float | None:
+        """Time budget of the next call of a stage, or None if unlimited."""
+        budgets = [
+            budget
+            for budget in (self.stage_timeouts.get(stage), self.remaining())
+            if budget is not None
+        ]
+        return max(0.0, min(budgets)) if budgets else None
+
+    def _timeout_error(self, stage: str, timeout: float) -> StageTimeoutError:
+        """Error for a call that ran over, telling which budget ended it."""
+        message = f"{stage} did not finish within {timeout:.1f}s"
+        if timeout != self.stage_timeouts.get(stage):
+            return DeadlineReachedError(f"Run deadline reached: {message}")
+        return StageTimeoutError(message)
+
+    def call(self, stage: str, func: Callable[..., T], *args: Any) -> T:
+        """Call func within the time budget of a stage.
+
+        On timeout the call is abandoned, not stopped; see the class docstring.
+
+        Raises:
+            DeadlineReachedError: If the run deadline has passed or cut the
+                call.
+            StageTimeoutError: If the call runs over its stage budget.
+        """
+        timeout = self.timeout(stage)
+        if timeout is None:
+            return func(*args)
+        if timeout <= 0:
+            raise DeadlineReachedError(f"Run deadline reached before {stage}")
+
+        future: Future[T] = Future()
+
+        def target() -> None:
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(func(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=target, name=f"stage-{stage}", daemon=True).start()
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            raise self._timeout_error(stage, timeout) from None
+
+    async def acall(self, stage: str, awaitable: Awaitable[T]) -> T:
+        """Async variant of :meth:`call`; an overrunning call is cancelled."""
+        timeout = self.timeout(stage)
+        if timeout is None:
+            return await awaitable
+        if timeout <= 0:
+            if asyncio.iscoroutine(awaitable):
+                # Close the coroutine that will never run
+                awaitable.close()
+            raise DeadlineReachedError(f"Run deadline reached before {stage}")
+        try:
+            return await asyncio.wait_for(awaitable, timeout)
+        except asyncio.TimeoutError:
+            raise self._timeout_error(stage, timeout) from None
+
+    def record_paper(self, seconds: float) -> None:
+        """Record how long a paper took, to estimate the next ones."""
+        with self._lock:
+            self._paper_seconds.append(seconds)
+
+    def allows_new_paper(self) -> bool:
+        """Whether there is enough time left to start another paper."""
+        remaining = self.remaining()
+        if remaining is None:
+            return True
+        with self._lock:
+            durations = list(self._paper_seconds)
+        estimate = sum(durations) / len(durations) if durations else 0.0
+        return remaining > max(self.reserve, estimate)
@@ -0,0 +1,270 @@
+"""Coordinator/worker split of the workflow over a durable job queue."""
+
+import logging
+import os
+import socket
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from ..config import Settings
+from ..logging_config import log_with_context
+from ..models import PaperRecord
+from .factory import ServiceFactory
+from .job_queue import Job, JobQueue, LeaseLostError
+from .utils import update_log
+from .workflow import WorkflowService
+
+T = TypeVar("T")
+
+# Stages with external side effects, done at most once per job
+_SIDE_EFFECT_STAGES = {"discord", "gdrive", "zotero"}
+
+
+def create_job_queue(settings: Settings) -> JobQueue:
+    """Create the job queue configured in settings."""
+    return JobQueue(
+        settings.queue_db_file,
+        visibility_timeout=settings.queue_visibility_timeout,
+        max_attempts=settings.queue_max_attempts,
+        retry_delay=settings.queue_retry_delay,
+    )
+
+
+def default_worker_id() -> str:
+    """Worker identifier unique across hosts and processes."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class CoordinatorService(WorkflowService):
+    """Harvests and filters papers, then enqueues one job per paper."""
+
+    def __init__(
+        self,
+        settings: Settings,
+        service_factory: ServiceFactory,
+        logger: logging.Logger,
+        queue: JobQueue,
+    ) -> None:
+        """Initialize CoordinatorService.
+
+        Args:
+            settings: Application settings.
+            service_factory: Factory for service instances.
+            logger: Logger instance.
+            queue: Queue to publish per-paper jobs to.
+        """
+        super().__init__(settings, service_factory, logger)
+        self.queue = queue
+
+    def run_coordinator(self, num_papers: int, model: str | None) -> None:
+        """Harvest, filter and enqueue the interesting papers.
+
+        The watermark moves past every enqueued paper right away: the queue
+        is durable, so the papers are owned by the workers from then on.
+
+        Args:
+            num_papers: Maximum number of papers to enqueue.
+            model: OpenAI model the workers should use, or None to route per stage.
+        """
+        try:
+            log_with_context(
+                self.logger,
+                logging.INFO,
+                "Starting coordinator",
+                num_papers=num_papers,
+                model=model,
+            )
+
+            self._ensure_setup()
+            papers = self._retrieve_papers()
+
+            if not papers:
+                self._handle_no_papers()
+                return
+
+            interesting_papers = self._filter_papers(papers, num_papers, model)
+            self._send_summary_notification(papers, interesting_papers)
+
+            interesting_ids = {p.entry_id for p in interesting_papers}
+            enqueued = 0
+            for paper in papers:
+                if paper.entry_id in interesting_ids:
+                    enqueued += self._enqueue_paper(paper, model)
+                update_log(self.settings, paper.published)
+
+            log_with_context(
+                self.logger,
+                logging.INFO,
+                "Coordinator completed successfully",
+                total_papers=len(papers),
+                interesting_papers=len(interesting_papers),
+                enqueued=enqueued,
+                queue=self.queue.stats(),
+            )
+
+        except Exception as e:
+            log_with_context(
+                self.logger, logging.ERROR, "Coordinator failed", error=str(e)
+            )
+            raise
+
+    def _enqueue_paper(self, paper: PaperRecord, model: str | None) -> bool:
+        """Publish a paper job, skipping papers that are already queued."""
+        return self.queue.enqueue(
+            {"paper": paper.to_dict(), "model": model},
+            dedupe_key=paper.short_id,
+        )
+
+
+class WorkerService(WorkflowService):
+    """Leases paper jobs from the queue and runs the per-paper pipeline.
+
+    The Discord post, Drive upload and Zotero registration of a job are
+    recorded in the queue when they finish, so a retried job only repeats
+    the steps that failed. Once today's OpenAI budget is used up, no job is
+    leased; the jobs stay queued until the budget allows them again.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        service_factory: ServiceFactory,
+        logger: logging.Logger,
+        queue: JobQueue,
+        worker_id: str | None = None,
+    ) -> None:
+        """Initialize WorkerService.
+
+        Args:
+            settings: Application settings.
+            service_factory: Factory for service instances.
+            logger: Logger instance.
+            queue: Queue to lease jobs from.
+            worker_id: Worker identifier; defaults to ``host:pid``.
+        """
+        super().__init__(settings, service_factory, logger)
+        self.queue = queue
+        self.worker_id = worker_id or default_worker_id()
+        self._job: Job | None = None
+
+    def run_worker(self, drain: bool = False, max_jobs: int | None = None) -> int:
+        """Process jobs until stopped.
+
+        Args:
+            drain: Exit once no job is visible instead of polling forever.
+            max_jobs: Exit after processing this many jobs.
+
+        Returns:
+            Number of jobs processed.
+        """
+        log_with_context(
+            self.logger, logging.INFO, "Starting worker", worker_id=self.worker_id
+        )
+        self._ensure_setup()
+
+        processed = 0
+        while max_jobs is None or processed < max_jobs:
+            job = None if self._budget_exhausted() else self.queue.lease(self.worker_id)
+            if job is None:
+                if drain:
+                    break
+                time.sleep(self.settings.queue_poll_interval)
+                continue
+
+            self._run_job(job)
+            processed += 1
+
+        log_with_context(
+            self.logger,
+            logging.INFO,
+            "Worker stopped",
+            worker_id=self.worker_id,
+            processed=processed,
+        )
+        return processed
+
+    def _run_job(self, job: Job) -> None:
+        """Run a single leased job, renewing its lease while it runs."""
+        paper = PaperRecord.from_dict(job.payload["paper"])
+        stop_heartbeat = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(job, stop_heartbeat), daemon=True
+        )
+        heartbeat.start()
+
+        self._job = job
+        try:
+            self._process_single_paper(paper, job.payload["model"])
+        except Exception as e:
+            self._job = None
+            self._flush_search_index()
+            stop_heartbeat.set()
+            heartbeat.join()
+            try:
+                self.queue.fail(job, str(e))
+            except LeaseLostError:
+                self.logger.warning("Lease lost before recording failure")
+            log_with_context(
+                self.logger,
+                logging.ERROR,
+                "Job failed",
+                job_id=job.id,
+                attempts=job.attempts,
+                paper_title=paper.title,
+                error=str(e),
+            )
+            return
+
+        self._job = None
+        self._flush_search_index()
+        stop_heartbeat.set()
+        heartbeat.join()
+        try:
+            self.queue.complete(job)
+        except LeaseLostError:
+            # Another worker reclaimed the job; it will be processed again
+            self.logger.warning("Lease lost before completing job")
+            return
+
+        log_with_context(
+            self.logger,
+            logging.INFO,
+            "Job completed",
+            job_id=job.id,
+            paper_title=paper.title,
+        )
+
+    def _run_stage(self, name: str, func: Callable[..., T], *args: Any) -> T:
+        """Run a stage, skipping side effects an earlier attempt finished."""
+        job = self._job
+        if job is None or name not in _SIDE_EFFECT_STAGES:
+            return super()._run_stage(name, func, *args)
+        if name in job.completed_steps:
+            log_with_context(
+                self.logger,
+                logging.INFO,
+                "Skipping step finished by an earlier attempt",
+                job_id=job.id,
+                step=name,
+            )
+            # The results of side-effect stages are not used
+            return None  # type: ignore[return-value]
+
+        result = super()._run_stage(name, func, *args)
+        try:
+            self.queue.record_step(job, name)
+        except LeaseLostError:
+            self.logger.warning("Lease lost before recording step %s", name)
+        return result
+
+    def _heartbeat(self, job: Job, stop: threading.Event) -> None:
+        """Periodically extend the job lease until told to stop."""
+        interval = self.queue.visibility_timeout / 3
+        while not stop.wait(interval):
+            try:
+                self.queue.extend_lease(job)
+            except LeaseLostError:
+                self.logger.warning("Lease lost while processing job")
+                return
@@ -0,0 +1,246 @@
+"""Resumable, connection-pooled PDF downloads."""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..config import Settings
+from ..models import PaperRecord
+from .arxiv import ARXIV_USER_AGENT
+
+_CHUNK_SIZE = 1 << 16
+
+# Bytes at the end of a file searched for the %%EOF marker; writers may
+# append whitespace or incremental-update padding after it
+_EOF_SEARCH_BYTES = 2048
+
+# Transfer errors worth resuming after; HTTP errors are not retried
+_RESUMABLE_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+class DownloadCancelledError(Exception):
+    """Raised when a download is aborted through its cancel event."""
+
+    pass
+
+
+class PdfValidationError(ValueError):
+    """Raised when a downloaded file is not a complete PDF."""
+
+    pass
+
+
+def validate_pdf(path: Path) -> None:
+    """Check that a file starts with a PDF header and ends with %%EOF.
+
+    Raises:
+        PdfValidationError: If either marker is missing.
+    """
+    size = path.stat().st_size
+    with path.open("rb") as fh:
+        header = fh.read(5)
+        fh.seek(max(0, size - _EOF_SEARCH_BYTES))
+        tail = fh.read()
+    if header != b"%PDF-":
+        raise PdfValidationError(f"{path.name} is not a PDF (header {header!r})")
+    if b"%%EOF" not in tail:
+        raise PdfValidationError(f"{path.name} is truncated (no %%EOF marker)")
+
+
+class DownloadManager:
+    """Download files over pooled connections with per-host limits.
+
+    Interrupted or stalled transfers are retried with an HTTP Range request
+    that continues the partial ``.part`` file, so a broken transfer does not
+    start again from zero. Each host gets at most ``per_host`` concurrent
+    downloads, and byte and throughput metrics are kept across downloads.
+    """
+
+    def __init__(
+        self,
+        per_host: int = 2,
+        stall_timeout: float = 30.0,
+        timeout: float = 120.0,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+    ) -> None:
+        """Initialize DownloadManager.
+
+        Args:
+            per_host: Maximum concurrent downloads per host.
+            stall_timeout: Seconds without receiving data before a transfer
+                is considered stalled and resumed.
+            timeout: Overall limit for one attempt in seconds.
+            max_retries: Resumption attempts after a failed transfer.
+            retry_delay: Initial delay between attempts, doubled each time.
+        """
+        self.per_host = per_host
+        self.stall_timeout = stall_timeout
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
+        self._session = requests.Session()
+        self._session.headers["User-Agent"] = ARXIV_USER_AGENT
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=max(per_host, 1))
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        self._lock = threading.Lock()
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._metrics = {
+            "downloads": 0,
+            "failures": 0,
+            "resumes": 0,
+            "bytes": 0,
+            "seconds": 0.0,
+        }
+
+    def download_pdf(
+        self,
+        paper: PaperRecord,
+        dirpath: str,
+        cancel: threading.Event | None = None,
+    ) -> str:
+        """Download a paper's PDF.
+
+        Args:
+            paper: Paper record.
+            dirpath: Directory to write the PDF into.
+            cancel: Event that aborts the download between chunks when set.
+
+        Returns:
+            Path to the downloaded PDF, named like ``arxiv.Result.download_pdf``.
+        """
+        path = Path(dirpath) / paper.pdf_filename
+        return str(self.download(paper.pdf_url, path, cancel))
+
+    def download(
+        self, url: str, path: Path, cancel: threading.Event | None = None
+    ) -> Path:
+        """Download a URL to path, resuming after stalls and broken transfers.
+
+        Raises:
+            DownloadCancelledError: If ``cancel`` was set; the partial file is
+                removed.
+            PdfValidationError: If the result is not a complete PDF.
+            requests.RequestException: If the download still fails after all
+                retries, or the server answers with an HTTP error.
+        """
+        part = path.with_name(path.name + ".part")
+        started = time.monotonic()
+        try:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    with self._host_slot(url):
+                        self._fetch(url, part, cancel)
+                    break
+                except _RESUMABLE_ERRORS:
+                    if attempt == self.max_retries:
+                        raise
+                    time.sleep(self.retry_delay * (2**attempt))
+            validate_pdf(part)
+        except BaseException:
+            part.unlink(missing_ok=True)
+            self._count(failures=1)
+            raise
+
+        part.replace(path)
+        self._count(downloads=1, seconds=time.monotonic() - started)
+        return path
+
+    def reset_stats(self) -> None:
+        """Start counting from zero, keeping the connection pool."""
+        with self._lock:
+            for key, value in self._metrics.items():
+                self._metrics[key] = type(value)()
+
+    def stats(self) -> dict[str, Any]:
+        """Download counts, bytes transferred and average throughput."""
+        with self._lock:
+            metrics: dict[str, Any] = dict(self._metrics)
+        seconds = metrics["seconds"]
+        metrics["seconds"] = round(seconds, 2)
+        metrics["throughput_mib_s"] = (
+            round(metrics["bytes"] / 2**20 / seconds, 2) if seconds else None
+        )
+        return metrics
+
+    @contextmanager
+    def _host_slot(self, url: str) -> Iterator[None]:
+        """Hold one of the per-host download slots."""
+        host = urlsplit(url).netloc
+        with self._lock:
+            slot = self._host_slots.setdefault(
+                host, threading.BoundedSemaphore(self.per_host)
+            )
+        with slot:
+            yield
+
+    def _fetch(self, url: str, part: Path, cancel: threading.Event | None) -> None:
+        """Run one attempt, continuing the partial file if there is one."""
+        offset = part.stat().st_size if part.exists() else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        deadline = time.monotonic() + self.timeout
+
+        with self._session.get(
+            url, headers=headers, stream=True, timeout=self.stall_timeout
+        ) as response:
+            if offset and response.status_code == 416:
+                # The partial file already holds the whole body
+                return
+            response.raise_for_status()
+            if offset and response.status_code == 206:
+                self._count(resumes=1)
+                mode = "ab"
+            else:
+                # The server ignored the Range header; start over
+                mode = "wb"
+
+            with part.open(mode) as fh:
+                for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                    if cancel is not None and cancel.is_set():
+                        raise DownloadCancelledError(f"Download of {url} cancelled")
+                    fh.write(chunk)
+                    self._count(bytes=len(chunk))
+                    if time.monotonic() > deadline:
+                        raise requests.Timeout(f"Download of {url} took too long")
+
+    def _count(self, **increments: float) -> None:
+        with self._lock:
+            for key, value in increments.items():
+                self._metrics[key] += value
+
+
+_managers_lock = threading.Lock()
+_managers: dict[tuple[int, float, float, int], DownloadManager] = {}
+
+
+def get_download_manager(settings: Settings) -> DownloadManager:
+    """Process-wide download manager, so all downloads share one pool."""
+    key = (
+        settings.download_per_host,
+        settings.download_stall_timeout,
+        settings.http_timeout,
+        settings.download_retries,
+    )
+    with _managers_lock:
+        if key not in _managers:
+            _managers[key] = DownloadManager(
+                per_host=settings.download_per_host,
+                stall_timeout=settings.download_stall_timeout,
+                timeout=settings.http_timeout,
+                max_retries=settings.download_retries,
+            )
+        return _managers[key]
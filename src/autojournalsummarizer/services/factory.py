@@ -7,6 +7,7 @@ from ..config import Settings
 from .arxiv import ArxivService
 from .integrations import DiscordService, GoogleDriveService, ZoteroService
 from .openai_service import OpenAIService
+from .source_text import ArxivSourceService
 
 
 class ServiceFactory:
@@ -58,6 +59,13 @@ class ServiceFactory:
             self._services["zotero"] = ZoteroService(self.settings)
         return cast(ZoteroService, self._services["zotero"])
 
+    def get_source_service(self) -> ArxivSourceService:
+        """Get ArxivSourceService instance (singleton)."""
+        if "source" not in self._services:
+            self.logger.info("Initializing ArxivSourceService")
+            self._services["source"] = ArxivSourceService(self.settings)
+        return cast(ArxivSourceService, self._services["source"])
+
     def get_all_services(self) -> dict[str, Any]:
         """Get all initialized services."""
         return {
@@ -66,4 +74,5 @@ class ServiceFactory:
             "discord": self.get_discord_service(),
             "gdrive": self.get_gdrive_service(),
             "zotero": self.get_zotero_service(),
+            "source": self.get_source_service(),
         }
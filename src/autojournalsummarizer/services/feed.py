@@ -0,0 +1,113 @@
+"""Cheap change detection through the arXiv announcement feed."""
+
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+import feedparser  # type: ignore
+import requests
+
+from ..config import Settings
+from .arxiv import ARXIV_USER_AGENT
+
+logger = logging.getLogger(__name__)
+
+_ARXIV_ID_RE = re.compile(r"(\d{4}\.\d{4,5}|[a-z\-]+(?:\.[A-Z]{2})?/\d{7})")
+
+# Replacements of already announced papers are not new submissions
+_NEW_ANNOUNCE_TYPES = {"new", "cross"}
+
+
+@dataclass
+class FeedCheck:
+    """Result of polling the feed, acknowledged once the run succeeds."""
+
+    new_ids: list[str]
+    ids: list[str] = field(default_factory=list)
+    etag: str | None = None
+    last_modified: str | None = None
+    changed: bool = True
+
+
+class FeedWatcher:
+    """Poll the category's RSS/Atom feed with conditional GET.
+
+    The feed is fetched with the validators of the last processed poll, so an
+    unchanged feed costs a single ``304 Not Modified``. Announced IDs are
+    compared to the IDs seen by the last successful run. The state is only
+    written by :meth:`acknowledge`, so a failed run is retried on the next
+    poll.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        """Initialize FeedWatcher with settings."""
+        self.settings = settings
+        self.url = settings.arxiv_feed_url.format(category=settings.arxiv_category)
+        self.state_file = settings.feed_state_file
+
+    def check(self) -> FeedCheck:
+        """Fetch the feed and find announced IDs not seen before.
+
+        Raises:
+            requests.RequestException: If the feed cannot be fetched.
+        """
+        state = self._load_state()
+        headers = {"User-Agent": ARXIV_USER_AGENT}
+        if state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if state.get("last_modified"):
+            headers["If-Modified-Since"] = state["last_modified"]
+
+        response = requests.get(
+            self.url, headers=headers, timeout=self.settings.http_timeout
+        )
+        if response.status_code == 304:
+            return FeedCheck(new_ids=[], changed=False)
+        response.raise_for_status()
+
+        ids = announced_ids(feedparser.parse(response.content))
+        seen = set(state.get("ids", []))
+        return FeedCheck(
+            new_ids=[arxiv_id for arxiv_id in ids if arxiv_id not in seen],
+            ids=ids,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    def acknowledge(self, check: FeedCheck) -> None:
+        """Remember a processed feed so its IDs are not reported again."""
+        if not check.changed:
+            return
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            "url": self.url,
+            "etag": check.etag,
+            "last_modified": check.last_modified,
+            "ids": check.ids,
+        }
+        tmp_path = self.state_file.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(state))
+        tmp_path.replace(self.state_file)
+
+    def _load_state(self) -> dict[str, Any]:
+        """State of the last processed feed, empty if the URL changed."""
+        try:
+            state: dict[str, Any] = json.loads(self.state_file.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        return state if state.get("url") == self.url else {}
+
+
+def announced_ids(feed: feedparser.FeedParserDict) -> list[str]:
+    """Versionless arXiv IDs of new and cross-listed papers in a feed."""
+    ids = []
+    for entry in feed.entries:
+        announce_type = entry.get("arxiv_announce_type")
+        if announce_type is not None and announce_type not in _NEW_ANNOUNCE_TYPES:
+            continue
+        match = _ARXIV_ID_RE.search(entry.get("id", "") or entry.get("link", ""))
+        if match is not None:
+            ids.append(match.group(1))
+    return ids
@@ -0,0 +1,230 @@
+"""Hedged OpenAI requests to cut tail latency."""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Protocol, TypeVar
+
+from ..config import Settings
+from .usage import UsageTracker, get_usage_tracker
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Closeable(Protocol):
+    def close(self) -> None: ...
+
+
+ClientT = TypeVar("ClientT", bound=_Closeable)
+
+
+class RequestHedger:
+    """Send a duplicate request when the first one is unusually slow.
+
+    A request still running after the configured latency percentile of
+    recent calls (same stage and model) gets a duplicate. The first valid,
+    non-empty response wins and the other request is cancelled. Each
+    duplicate reserves the average cost of a call against a per-run cap on
+    extra spend; once the cap is reached, requests are no longer hedged.
+    """
+
+    def __init__(
+        self, tracker: UsageTracker, percentile: float, max_extra_usd: float
+    ) -> None:
+        """Initialize RequestHedger.
+
+        Args:
+            tracker: Usage tracker providing latency history and costs.
+            percentile: Latency percentile after which a duplicate is sent.
+            max_extra_usd: Cap on the estimated cost of duplicates per run.
+        """
+        self.tracker = tracker
+        self.percentile = percentile
+        self.max_extra_usd = max_extra_usd
+        self._lock = threading.Lock()
+        self._stats: dict[str, Any] = {
+            "requests": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "primary_wins": 0,
+            "extra_usd": 0.0,
+        }
+
+    def hedge(
+        self,
+        operation: str,
+        model: str,
+        make_client: Callable[[], ClientT],
+        request: Callable[[ClientT], T | None],
+    ) -> T | None:
+        """Run a blocking request, hedging it if it passes the threshold.
+
+        Every attempt gets its own client, so a losing attempt is cancelled
+        by closing its client.
+
+        Args:
+            operation: Pipeline stage the request belongs to.
+            model: Model name.
+            make_client: Factory for a fresh API client.
+            request: Performs the request with the given client.
+
+        Returns:
+            The first valid response, or None if no attempt produced one.
+
+        Raises:
+            Exception: The last error if every attempt failed.
+        """
+        delay = self._delay(operation, model)
+        if delay is None:
+            return request(make_client())
+
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="hedge")
+        clients: dict[Future[T | None], ClientT] = {}
+
+        def submit() -> Future[T | None]:
+            client = make_client()
+            future = executor.submit(request, client)
+            clients[future] = client
+            return future
+
+        primary = submit()
+        try:
+            done, pending = wait({primary}, timeout=delay)
+            if done:
+                # Fast enough: no duplicate; its error is raised as is
+                return primary.result()
+            if self._reserve(operation, model):
+                pending.add(submit())
+
+            error: BaseException | None = None
+            answered = False
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        error = e
+                        continue
+                    answered = True
+                    if result is not None:
+                        self._count_win(future is primary, len(clients))
+                        return result
+            if error is not None and not answered:
+                raise error
+            return None
+        finally:
+            for future, client in clients.items():
+                if not future.done():
+                    future.cancel()
+                    client.close()
+            executor.shutdown(wait=False)
+
+    async def ahedge(
+        self,
+        operation: str,
+        model: str,
+        request: Callable[[], Awaitable[T | None]],
+    ) -> T | None:
+        """Async variant of :meth:`hedge`; losing attempts are cancelled."""
+        delay = self._delay(operation, model)
+        if delay is None:
+            return await request()
+
+        primary = asyncio.ensure_future(request())
+        tasks = {primary}
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return primary.result()
+            if self._reserve(operation, model):
+                tasks.add(asyncio.ensure_future(request()))
+                pending = set(tasks)
+
+            error: BaseException | None = None
+            answered = False
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        error = e
+                        continue
+                    answered = True
+                    if result is not None:
+                        self._count_win(task is primary, len(tasks))
+                        return result
+            if error is not None and not answered:
+                raise error
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def stats(self) -> dict[str, Any]:
+        """Hedged requests of the run and how often the duplicate won."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["extra_usd"] = round(stats["extra_usd"], 4)
+        stats["hedge_win_rate"] = (
+            round(stats["hedge_wins"] / stats["hedged"], 3) if stats["hedged"] else None
+        )
+        return stats
+
+    def _delay(self, operation: str, model: str) -> float | None:
+        """Seconds to wait before hedging, or None without enough history."""
+        with self._lock:
+            self._stats["requests"] += 1
+        return self.tracker.latency_percentile(operation, model, self.percentile)
+
+    def _reserve(self, operation: str, model: str) -> bool:
+        """Reserve the estimated cost of a duplicate if the cap allows it."""
+        estimate = self.tracker.average_cost(operation, model)
+        with self._lock:
+            if self._stats["extra_usd"] + estimate > self.max_extra_usd:
+                logger.info("Hedging skipped: extra spend cap reached")
+                return False
+            self._stats["extra_usd"] += estimate
+            self._stats["hedged"] += 1
+        logger.info("Hedging slow %s request to %s", operation, model)
+        return True
+
+    def _count_win(self, primary: bool, attempts: int) -> None:
+        if attempts < 2:
+            return
+        with self._lock:
+            self._stats["primary_wins" if primary else "hedge_wins"] += 1
+
+
+_hedgers_lock = threading.Lock()
+_hedgers: dict[Path, RequestHedger] = {}
+
+
+def get_request_hedger(settings: Settings) -> RequestHedger | None:
+    """Process-wide request hedger, or None if hedging is disabled."""
+    if settings.openai_hedge_percentile is None:
+        return None
+
+    key = settings.usage_db_file.resolve()
+    with _hedgers_lock:
+        if key not in _hedgers:
+            _hedgers[key] = RequestHedger(
+                get_usage_tracker(settings),
+                settings.openai_hedge_percentile,
+                settings.openai_hedge_max_extra_usd,
+            )
+        return _hedgers[key]
+
+
+def reset_request_hedger(settings: Settings) -> None:
+    """Drop the process-wide hedger, resetting its stats and extra-spend cap."""
+    with _hedgers_lock:
+        _hedgers.pop(settings.usage_db_file.resolve(), None)
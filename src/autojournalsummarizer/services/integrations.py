@@ -4,14 +4,15 @@ import json
 import os
 import re
 
-import arxiv  # type: ignore
+import httpx
 import requests
 from pydrive2.auth import GoogleAuth  # type: ignore
 from pydrive2.drive import GoogleDrive  # type: ignore
 from pyzotero.zotero import Zotero  # type: ignore
 
 from ..config import Settings
-from ..models import PaperSummary
+from ..models import PaperRecord, PaperSummary
+from .cassette import get_cassette, interaction_key
 
 
 class DiscordService:
@@ -31,36 +32,79 @@ class DiscordService:
             print("DISCORD_WEBHOOK_URL not found, skipping Discord notification")
             return
 
-        headers = {"Content-Type": "application/json"}
-        data = {"content": message}
-        requests.post(
-            self.settings.discord_webhook_url, data=json.dumps(data), headers=headers
-        )
+        if not self._replay_webhook(message):
+            headers = {"Content-Type": "application/json"}
+            data = {"content": message}
+            response = requests.post(
+                self.settings.discord_webhook_url,
+                data=json.dumps(data),
+                headers=headers,
+            )
+            self._record_webhook(message, response.status_code)
+        self._print_sent_message(message)
+
+    async def asend_message(self, client: httpx.AsyncClient, message: str) -> None:
+        """Async variant of :meth:`send_message`.
+
+        Args:
+            client: Async HTTP client.
+            message: Message content to send.
+        """
+        if not self.settings.discord_webhook_url:
+            print("DISCORD_WEBHOOK_URL not found, skipping Discord notification")
+            return
+
+        if not self._replay_webhook(message):
+            response = await client.post(
+                self.settings.discord_webhook_url, json={"content": message}
+            )
+            self._record_webhook(message, response.status_code)
+        self._print_sent_message(message)
+
+    def _replay_webhook(self, message: str) -> bool:
+        """Consume a recorded webhook response instead of posting.
+
+        Returns:
+            True if the message was replayed and must not be sent.
+        """
+        cassette = get_cassette(self.settings)
+        if cassette is None or not cassette.replaying:
+            return False
+        cassette.lookup("discord", interaction_key(message))
+        return True
+
+    def _record_webhook(self, message: str, status_code: int) -> None:
+        """Record a webhook response when recording a cassette."""
+        cassette = get_cassette(self.settings)
+        if cassette is not None and cassette.recording:
+            cassette.record("discord", interaction_key(message), status_code)
+
+    @staticmethod
+    def _print_sent_message(message: str) -> None:
+        """Echo a sent message to stdout."""
         print("Send message")
         print("------------")
         print(message)
         print("------------")
 
     def make_paper_message(
-        self, paper: arxiv.Result, summary: PaperSummary | None
+        self, paper: PaperRecord, summary: PaperSummary | None
     ) -> str:
         """Create a formatted message for a paper summary.
 
         Args:
-            paper: arXiv paper object.
+            paper: Paper record.
             summary: Structured paper summary.
 
         Returns:
             Formatted message string for Discord.
         """
         if summary is None:
-            return (
-                f"# [{paper.title}]({paper.links[0].href})\n論文の要約に失敗しました。"
-            )
+            return f"# [{paper.title}]({paper.entry_id})\n論文の要約に失敗しました。"
 
         message = (
-            f"# [{summary.japanese_title}]({paper.links[0].href})\n"
-            f"第一著者：{paper.authors[0].name}\n"
+            f"# [{summary.japanese_title}]({paper.entry_id})\n"
+            f"第一著者：{paper.first_author}\n"
             f"日付：{paper.published.strftime('%Y-%m-%d %H:%M:%S')}\n"
             "## 一言で説明すると？\n"
             f"{summary.summary}\n"
@@ -92,6 +136,15 @@ class GoogleDriveService:
         Args:
             pdf_path: Path to the PDF file to upload.
         """
+        cassette = get_cassette(self.settings)
+        key = interaction_key(
+            self.settings.google_folder_name, os.path.basename(pdf_path)
+        )
+        if cassette is not None and cassette.replaying:
+            cassette.lookup("gdrive", key)
+            print("Upload to google drive (replayed):", os.path.basename(pdf_path))
+            return
+
         gauth = GoogleAuth(str(self.settings.google_auth_settings_file))
         gauth.ServiceAuth()
         drive = GoogleDrive(gauth)
@@ -107,6 +160,8 @@ class GoogleDriveService:
         )
         file.SetContentFile(pdf_path)
         file.Upload({"convert": False})
+        if cassette is not None and cassette.recording:
+            cassette.record("gdrive", key, file["id"])
         print("Upload to google drive:", os.path.basename(pdf_path))
 
 
@@ -117,17 +172,24 @@ class ZoteroService:
         """Initialize ZoteroService with settings."""
         self.settings = settings
 
-    def register_paper(self, paper: arxiv.Result, pdf_path: str) -> None:
+    def register_paper(self, paper: PaperRecord, pdf_path: str) -> None:
         """Register a paper in Zotero with PDF attachment.
 
         Args:
-            paper: arXiv paper object.
+            paper: Paper record.
             pdf_path: Path to the PDF file to attach.
         """
         if not self.settings.zotero_api_key or not self.settings.zotero_library_id:
             print("ZOTERO credentials not found, skipping Zotero registration")
             return
 
+        cassette = get_cassette(self.settings)
+        key = interaction_key(self.settings.zotero_collection_name, paper.entry_id)
+        if cassette is not None and cassette.replaying:
+            cassette.lookup("zotero", key)
+            print("Register to Zotero (replayed):", paper.title)
+            return
+
         zot = Zotero(
             library_id=self.settings.zotero_library_id,
             library_type="user",
@@ -141,9 +203,9 @@ class ZoteroService:
 
         for author in paper.authors:
             try:
-                first_name, last_name = author.name.split(maxsplit=1)
+                first_name, last_name = author.split(maxsplit=1)
             except ValueError:
-                first_name = author.name
+                first_name = author
                 last_name = ""
             item["creators"].append(
                 {
@@ -155,10 +217,10 @@ class ZoteroService:
 
         item["abstractNote"] = paper.summary
         item["repository"] = "arxiv"
-        item["archiveID"] = "arXiv:" + re.sub(r"v[0-9]+", "", paper.get_short_id())
+        item["archiveID"] = "arXiv:" + re.sub(r"v[0-9]+", "", paper.short_id)
         item["date"] = paper.published.strftime("%Y-%m-%d")
         item["DOI"] = paper.doi
-        item["url"] = re.sub(r"v[0-9]+", "", paper.links[0].href)
+        item["url"] = re.sub(r"v[0-9]+", "", paper.entry_id)
         item["libraryCatalog"] = "arXiv.org"
 
         # Find collection
@@ -183,5 +245,7 @@ class ZoteroService:
         attachment["path"] = pdf_filename
         attachment["contentType"] = "application/pdf"
         zot.create_items([attachment], parentid=item_id)
+        if cassette is not None and cassette.recording:
+            cassette.record("zotero", key, item_id)
 
         print("Register to Zotero:", paper.title)
@@ -0,0 +1,319 @@
+"""Durable lease-based work queue backed by SQLite."""
+
+import json
+import sqlite3
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    dedupe_key TEXT UNIQUE,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    lease_token TEXT,
+    lease_owner TEXT,
+    lease_expires REAL,
+    last_error TEXT,
+    completed_steps TEXT NOT NULL DEFAULT '[]',
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status_available ON jobs (status, available_at);
+"""
+
+
+class LeaseLostError(RuntimeError):
+    """Raised when a worker acts on a job whose lease it no longer holds."""
+
+    pass
+
+
+class Job:
+    """A leased unit of work."""
+
+    def __init__(
+        self,
+        job_id: int,
+        payload: dict[str, Any],
+        attempts: int,
+        lease_token: str,
+        completed_steps: set[str] | None = None,
+    ) -> None:
+        """Initialize Job.
+
+        Args:
+            job_id: Queue row ID.
+            payload: Decoded job payload.
+            attempts: Number of times the job has been leased, including now.
+            lease_token: Token proving ownership of the current lease.
+            completed_steps: Steps finished by earlier attempts of the job.
+        """
+        self.id = job_id
+        self.payload = payload
+        self.attempts = attempts
+        self.lease_token = lease_token
+        self.completed_steps = completed_steps or set()
+
+
+class JobQueue:
+    """SQLite work queue with leases, visibility timeouts and dead-lettering.
+
+    A leased job stays invisible to other workers until its lease expires.
+    Workers that crash simply stop renewing their lease, so the job becomes
+    visible again and is reclaimed by the next ``lease`` call. Jobs that have
+    been leased ``max_attempts`` times without completing are moved to the
+    ``dead`` status instead of being retried forever.
+
+    Workers record the side effects they finished with :meth:`record_step`,
+    so a retried job can skip them instead of repeating them.
+
+    Every state transition happens in a single ``BEGIN IMMEDIATE``
+    transaction. The database runs in WAL mode, which needs shared memory, so
+    all workers must run on the host that stores it; network file systems
+    are not supported.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        visibility_timeout: float = 900.0,
+        max_attempts: int = 3,
+        retry_delay: float = 60.0,
+    ) -> None:
+        """Initialize JobQueue.
+
+        Args:
+            db_path: Path to the SQLite database file.
+            visibility_timeout: Lease duration in seconds.
+            max_attempts: Leases allowed before a job is dead-lettered.
+            retry_delay: Delay before a failed job becomes visible again.
+        """
+        self.db_path = db_path
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection holding a write lock for the whole block."""
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for read-only queries, without a write lock."""
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def enqueue(self, payload: dict[str, Any], dedupe_key: str | None = None) -> bool:
+        """Add a job to the queue.
+
+        Args:
+            payload: JSON-serializable job payload.
+            dedupe_key: Optional key; a job with an existing key is not added.
+
+        Returns:
+            True if the job was added, False if it was a duplicate.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO jobs "
+                "(dedupe_key, payload, available_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (dedupe_key, json.dumps(payload), now, now, now),
+            )
+            return cursor.rowcount == 1
+
+    def lease(self, worker_id: str) -> Job | None:
+        """Lease the next visible job.
+
+        Pending jobs and jobs whose lease has expired are both visible.
+        Expired jobs that already used up their attempts are dead-lettered.
+
+        Args:
+            worker_id: Identifier of the leasing worker (for diagnostics).
+
+        Returns:
+            Leased job, or None if no job is currently visible.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'dead', updated_at = ?, "
+                "last_error = COALESCE(last_error, 'lease expired') "
+                "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, now, self.max_attempts),
+            )
+            row = conn.execute(
+                "SELECT id, payload, attempts, completed_steps FROM jobs "
+                "WHERE (status = 'pending' AND available_at <= ?) "
+                "OR (status = 'leased' AND lease_expires < ?) "
+                "ORDER BY id LIMIT 1",
+                (now, now),
+            ).fetchone()
+            if row is None:
+                return None
+
+            job_id, payload, attempts, completed_steps = row
+            token = uuid.uuid4().hex
+            conn.execute(
+                "UPDATE jobs SET status = 'leased', attempts = attempts + 1, "
+                "lease_token = ?, lease_owner = ?, lease_expires = ?, updated_at = ? "
+                "WHERE id = ?",
+                (token, worker_id, now + self.visibility_timeout, now, job_id),
+            )
+            return Job(
+                job_id,
+                json.loads(payload),
+                attempts + 1,
+                token,
+                set(json.loads(completed_steps)),
+            )
+
+    def extend_lease(self, job: Job) -> None:
+        """Renew the lease of a job that is still being worked on.
+
+        Raises:
+            LeaseLostError: If the lease expired and was taken over.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            self._update_owned(
+                conn,
+                job,
+                "lease_expires = ?, updated_at = ?",
+                (now + self.visibility_timeout, now),
+            )
+
+    def record_step(self, job: Job, step: str) -> None:
+        """Remember a finished step, so retries of the job can skip it.
+
+        Raises:
+            LeaseLostError: If the lease expired and was taken over.
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT completed_steps FROM jobs WHERE id = ?", (job.id,)
+            ).fetchone()
+            steps = set(json.loads(row[0])) if row is not None else set()
+            steps.add(step)
+            self._update_owned(
+                conn,
+                job,
+                "completed_steps = ?, updated_at = ?",
+                (json.dumps(sorted(steps)), time.time()),
+            )
+        job.completed_steps = steps
+
+    def complete(self, job: Job) -> None:
+        """Mark a leased job as done.
+
+        Raises:
+            LeaseLostError: If the lease expired and was taken over.
+        """
+        with self._transaction() as conn:
+            self._update_owned(
+                conn,
+                job,
+                "status = 'done', lease_token = NULL, lease_expires = NULL, "
+                "updated_at = ?",
+                (time.time(),),
+            )
+
+    def fail(self, job: Job, error: str) -> None:
+        """Record a failed attempt, retrying later or dead-lettering the job.
+
+        Raises:
+            LeaseLostError: If the lease expired and was taken over.
+        """
+        now = time.time()
+        status = "dead" if job.attempts >= self.max_attempts else "pending"
+        with self._transaction() as conn:
+            self._update_owned(
+                conn,
+                job,
+                "status = ?, available_at = ?, last_error = ?, lease_token = NULL, "
+                "lease_expires = NULL, updated_at = ?",
+                (status, now + self.retry_delay, error, now),
+            )
+
+    def stats(self) -> dict[str, int]:
+        """Count jobs per status."""
+        with self._reader() as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+            ).fetchall()
+        return dict(rows)
+
+    def dead_letters(self) -> list[dict[str, Any]]:
+        """List dead-lettered jobs with their last error."""
+        with self._reader() as conn:
+            rows = conn.execute(
+                "SELECT id, payload, attempts, last_error FROM jobs "
+                "WHERE status = 'dead' ORDER BY id"
+            ).fetchall()
+        return [
+            {
+                "id": job_id,
+                "payload": json.loads(payload),
+                "attempts": attempts,
+                "last_error": last_error,
+            }
+            for job_id, payload, attempts, last_error in rows
+        ]
+
+    def requeue_dead(self) -> int:
+        """Move all dead-lettered jobs back to pending with fresh attempts.
+
+        Returns:
+            Number of requeued jobs.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'pending', attempts = 0, "
+                "available_at = ?, updated_at = ? WHERE status = 'dead'",
+                (now, now),
+            )
+            return cursor.rowcount
+
+    @staticmethod
+    def _update_owned(
+        conn: sqlite3.Connection, job: Job, assignments: str, params: tuple
+    ) -> None:
+        """Update a job row only if the caller still holds its lease."""
+        cursor = conn.execute(
+            f"UPDATE jobs SET {assignments} "
+            "WHERE id = ? AND status = 'leased' AND lease_token = ?",
+            (*params, job.id, job.lease_token),
+        )
+        if cursor.rowcount != 1:
+            raise LeaseLostError(f"Lease on job {job.id} is no longer held")
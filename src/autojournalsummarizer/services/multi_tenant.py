@@ -0,0 +1,454 @@
+"""Multi-tenant workflow: one arXiv harvest fanned out to several teams."""
+
+import logging
+import time
+from tempfile import TemporaryDirectory
+
+from ..config import Settings, TenantProfile
+from ..logging_config import log_with_context
+from ..models import PaperRecord, PaperSummary
+from .deadline import DeadlineReachedError, RunDeadline
+from .factory import ServiceFactory
+from .utils import update_log
+from .workflow import RetryableError, WorkflowService, retry_on_failure
+
+
+class TenantContext:
+    """A tenant profile together with its derived settings and services."""
+
+    def __init__(
+        self, profile: TenantProfile, settings: Settings, logger: logging.Logger
+    ) -> None:
+        """Initialize TenantContext.
+
+        Args:
+            profile: Tenant profile.
+            settings: Base application settings.
+            logger: Logger instance.
+        """
+        self.name = profile.name
+        self.settings = profile.apply(settings)
+        self.factory = ServiceFactory(self.settings, logger)
+
+    def destinations(self) -> dict[str, tuple[str | None, ...]]:
+        """Identify the external destinations of this tenant.
+
+        Tenants that share a destination (e.g. the same Drive folder) receive
+        a single delivery per paper.
+        """
+        return {
+            "discord": (self.settings.discord_webhook_url,),
+            "gdrive": (
+                str(self.settings.google_auth_settings_file),
+                self.settings.google_folder_name,
+            ),
+            "zotero": (
+                self.settings.zotero_library_id,
+                self.settings.zotero_collection_name,
+            ),
+        }
+
+
+class MultiTenantWorkflowService(WorkflowService):
+    """Workflow that filters one harvest per tenant and shares the heavy work.
+
+    Papers are retrieved once, filtered against every tenant's keywords, and
+    each selected paper is downloaded, extracted and summarized once. The
+    result is then delivered to the Discord, Google Drive and Zotero
+    destinations of every tenant that selected it.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        service_factory: ServiceFactory,
+        logger: logging.Logger,
+        tenants: list[TenantProfile],
+    ) -> None:
+        """Initialize MultiTenantWorkflowService.
+
+        Args:
+            settings: Application settings.
+            service_factory: Factory for shared service instances.
+            logger: Logger instance.
+            tenants: Tenant profiles to fan out to.
+        """
+        super().__init__(settings, service_factory, logger)
+        self.tenants = [TenantContext(profile, settings, logger) for profile in tenants]
+
+    def run_production_workflow(self, num_papers: int, model: str | None) -> None:
+        """Run the production workflow for all tenants.
+
+        Args:
+            num_papers: Maximum number of papers to process per tenant.
+            model: OpenAI model for every stage, or None to route per stage.
+        """
+        try:
+            log_with_context(
+                self.logger,
+                logging.INFO,
+                "Starting multi-tenant production workflow",
+                num_papers=num_papers,
+                model=model,
+                tenants=[tenant.name for tenant in self.tenants],
+            )
+            self._deadline = RunDeadline.from_settings(self.settings)
+
+            self._ensure_setup()
+            feed_check = self._check_feed()
+            if self._no_new_announcements(feed_check):
+                self._acknowledge_feed(feed_check)
+                return
+            papers = self._retrieve_papers()
+
+            if not papers:
+                self._handle_no_papers()
+                self._acknowledge_feed(feed_check)
+                return
+
+            if self._budget_exhausted():
+                # Filtering costs tokens too; the feed stays unacknowledged
+                self._log_budget_stop(len(papers))
+                return
+
+            selections = {
+                tenant.name: self._filter_papers_for_tenant(
+                    tenant, papers, num_papers, model
+                )
+                for tenant in self.tenants
+            }
+            for tenant in self.tenants:
+                self._send_tenant_summary_notification(
+                    tenant, papers, selections[tenant.name]
+                )
+            if self._process_fan_out(papers, selections, model):
+                self._acknowledge_feed(feed_check)
+            self._log_usage_report()
+
+            log_with_context(
+                self.logger,
+                logging.INFO,
+                "Multi-tenant production workflow completed successfully",
+                total_papers=len(papers),
+                unique_interesting_papers=len(self._unique_selected_ids(selections)),
+            )
+
+        except Exception as e:
+            log_with_context(
+                self.logger,
+                logging.ERROR,
+                "Multi-tenant production workflow failed",
+                error=str(e),
+            )
+            raise
+        finally:
+            self._log_download_stats()
+            self._flush_search_index()
+            self._write_profile_report()
+
+    def run_test_workflow(self, num_papers: int, model: str | None) -> None:
+        """Run the test workflow for all tenants (no notifications/uploads).
+
+        Args:
+            num_papers: Maximum number of papers to process per tenant.
+            model: OpenAI model for every stage, or None to route per stage.
+        """
+        try:
+            log_with_context(
+                self.logger,
+                logging.INFO,
+                "Starting multi-tenant test workflow",
+                num_papers=num_papers,
+                model=model,
+                tenants=[tenant.name for tenant in self.tenants],
+            )
+            self._deadline = RunDeadline.from_settings(self.settings)
+
+            self._ensure_setup()
+            papers = self._retrieve_papers()
+
+            if not papers:
+                self.logger.info("No papers found for testing")
+                return
+
+            selections = {
+                tenant.name: self._filter_papers_for_tenant(
+                    tenant, papers, num_papers, model
+                )
+                for tenant in self.tenants
+            }
+
+            # Process only the first selected paper in test mode
+            selected_ids = self._unique_selected_ids(selections)
+            for paper in papers:
+                if paper.entry_id in selected_ids:
+                    recipients = self._recipients(paper, selections)
+                    print("Tenants:", [tenant.name for tenant in recipients])
+                    self._process_single_paper_for_test(paper, model)
+                    break
+            self._log_usage_report()
+
+            log_with_context(
+                self.logger,
+                logging.INFO,
+                "Multi-tenant test workflow completed successfully",
+                total_papers=len(papers),
+                unique_interesting_papers=len(selected_ids),
+            )
+
+        except Exception as e:
+            log_with_context(
+                self.logger,
+                logging.ERROR,
+                "Multi-tenant test workflow failed",
+                error=str(e),
+            )
+            raise
+        finally:
+            self._flush_search_index()
+            self._write_profile_report()
+
+    def _handle_no_papers(self) -> None:
+        """Notify every tenant that no new papers were found."""
+        self.logger.info("No new papers found")
+        for tenant in self._unique_by_destination("discord").values():
+            try:
+                discord_service = tenant.factory.get_discord_service()
+                self._run_stage(
+                    "discord",
+                    discord_service.send_message,
+                    "本日の新着論文はありません。",
+                )
+            except Exception as e:
+                log_with_context(
+                    self.logger,
+                    logging.WARNING,
+                    "Failed to send no-papers notification",
+                    tenant=tenant.name,
+                    error=str(e),
+                )
+
+    @retry_on_failure(max_retries=2, delay=1.0)
+    def _filter_papers_for_tenant(
+        self,
+        tenant: TenantContext,
+        papers: list[PaperRecord],
+        num_papers: int,
+        model: str | None,
+    ) -> list[PaperRecord]:
+        """Filter papers against a tenant's keywords using OpenAI."""
+        try:
+            openai_service = tenant.factory.get_openai_service()
+            interesting_papers = self._run_stage(
+                "filter",
+                openai_service.filter_interesting_papers,
+                papers,
+                num_papers,
+                model,
+            )
+
+            log_with_context(
+                self.logger,
+                logging.INFO,
+                "Papers filtered successfully",
+                tenant=tenant.name,
+                total=len(papers),
+                interesting=len(interesting_papers),
+            )
+
+            return interesting_papers
+
+        except Exception as e:
+            log_with_context(
+                self.logger,
+                logging.WARNING,
+                "Failed to filter papers",
+                tenant=tenant.name,
+                error=str(e),
+            )
+            raise RetryableError(f"Paper filtering failed: {e}") from e
+
+    def _send_tenant_summary_notification(
+        self,
+        tenant: TenantContext,
+        papers: list[PaperRecord],
+        interesting_papers: list[PaperRecord],
+    ) -> None:
+        """Send a tenant's summary notification to its Discord."""
+        try:
+            discord_service = tenant.factory.get_discord_service()
+            message = (
+                f"新着論文：{len(papers)}本\n"
+                f"関心度の高い論文：{len(interesting_papers)}本"
+            )
+            self._run_stage("discord", discord_service.send_message, message)
+
+        except Exception as e:
+            log_with_context(
+                self.logger,
+                logging.WARNING,
+                "Failed to send summary notification",
+                tenant=tenant.name,
+                error=str(e),
+            )
+            # Don't raise - this is not critical
+
+    def _process_fan_out(
+        self,
+        all_papers: list[PaperRecord],
+        selections: dict[str, list[PaperRecord]],
+        model: str | None,
+    ) -> bool:
+        """Process each selected paper once and deliver it to its tenants.
+
+        Papers are not deferred by the daily budget (deferred papers carry no
+        tenant selection). Once the budget is used up the run stops like at
+        the deadline, and the watermark stays before the first paper that was
+        not reached, so the next run filters it again. A paper cut short by
+        the deadline counts as not reached.
+
+        Returns:
+            False if the run deadline or the daily budget stopped it before
+            every paper was reached.
+        """
+        for position, paper in enumerate(all_papers):
+            recipients = self._recipients(paper, selections)
+            if recipients:
+                if not self._deadline.allows_new_paper():
+                    self._log_deadline_stop(len(all_papers) - position)
+                    return False
+                if self._budget_exhausted():
+                    self._log_budget_stop(len(all_papers) - position)
+                    return False
+                started = time.monotonic()
+                try:
+                    self._process_shared_paper(paper, recipients, model)
+                except DeadlineReachedError:
+                    self._log_deadline_stop(len(all_papers) - position)
+                    return False
+                except Exception as e:
+                    log_with_context(
+                        self.logger,
+                        logging.ERROR,
+                        "Failed to process paper",
+                        paper_title=paper.title,
+                        error=str(e),
+                    )
+                    # Continue with next paper rather than failing entire workflow
+                self._deadline.record_paper(time.monotonic() - started)
+
+            update_log(self.settings, paper.published)
+        return True
+
+    def _has_deferred_papers(self) -> bool:
+        """Multi-tenant runs neither defer papers nor pick up deferred ones."""
+        return False
+
+    def _log_budget_stop(self, remaining_papers: int) -> None:
+        """Log that the budget leaves the rest of the papers for the next run."""
+        log_with_context(
+            self.logger,
+            logging.WARNING,
+            "Daily budget exhausted, remaining papers left for the next run",
+            remaining_papers=remaining_papers,
+            budget_usd=self.settings.daily_budget_usd,
+        )
+
+    def _process_shared_paper(
+        self, paper: PaperRecord, recipients: list[TenantContext], model: str | None
+    ) -> None:
+        """Download, extract and summarize a paper once, then fan it out."""
+        with TemporaryDirectory() as dirpath:
+            pdf_path = self._download_pdf(paper, dirpath)
+            text = self._extract_text(paper, pdf_path)
+
+            openai_service = self.factory.get_openai_service()
+            summary = self._run_stage(
+                "summarize", openai_service.summarize_paper, paper.title, text, model
+            )
+            self._index_paper(paper, text, summary)
+
+            delivered: set[tuple[str, tuple[str | None, ...]]] = set()
+            for tenant in recipients:
+                self._deliver_to_tenant(tenant, paper, pdf_path, summary, delivered)
+
+            log_with_context(
+                self.logger,
+                logging.INFO,
+                "Paper processed successfully",
+                paper_title=paper.title,
+                tenants=[tenant.name for tenant in recipients],
+            )
+
+    def _deliver_to_tenant(
+        self,
+        tenant: TenantContext,
+        paper: PaperRecord,
+        pdf_path: str,
+        summary: PaperSummary | None,
+        delivered: set[tuple[str, tuple[str | None, ...]]],
+    ) -> None:
+        """Deliver a processed paper to a tenant's destinations.
+
+        Each destination is delivered to at most once per paper, and a failure
+        in one tenant's destination does not affect the others.
+        """
+        destinations = tenant.destinations()
+
+        def deliver(kind: str, action: str) -> None:
+            key = (kind, destinations[kind])
+            if key in delivered:
+                return
+            try:
+                if kind == "discord":
+                    discord_service = tenant.factory.get_discord_service()
+                    message = discord_service.make_paper_message(
+                        paper=paper, summary=summary
+                    )
+                    self._run_stage("discord", discord_service.send_message, message)
+                elif kind == "gdrive":
+                    gdrive_service = tenant.factory.get_gdrive_service()
+                    self._run_stage("gdrive", gdrive_service.upload_pdf, pdf_path)
+                elif kind == "zotero":
+                    zotero_service = tenant.factory.get_zotero_service()
+                    self._run_stage(
+                        "zotero", zotero_service.register_paper, paper, pdf_path
+                    )
+                delivered.add(key)
+            except DeadlineReachedError:
+                raise
+            except Exception as e:
+                log_with_context(
+                    self.logger,
+                    logging.ERROR,
+                    f"Failed to {action}",
+                    tenant=tenant.name,
+                    paper_title=paper.title,
+                    error=str(e),
+                )
+
+        deliver("discord", "send paper message")
+        deliver("gdrive", "upload PDF to Google Drive")
+        deliver("zotero", "register paper in Zotero")
+
+    def _recipients(
+        self, paper: PaperRecord, selections: dict[str, list[PaperRecord]]
+    ) -> list[TenantContext]:
+        """Tenants that selected the given paper."""
+        return [
+            tenant
+            for tenant in self.tenants
+            if any(p.entry_id == paper.entry_id for p in selections[tenant.name])
+        ]
+
+    @staticmethod
+    def _unique_selected_ids(selections: dict[str, list[PaperRecord]]) -> set[str]:
+        """Entry IDs selected by at least one tenant."""
+        return {paper.entry_id for papers in selections.values() for paper in papers}
+
+    def _unique_by_destination(self, kind: str) -> dict[tuple, TenantContext]:
+        """First tenant for each distinct destination of the given kind."""
+        unique: dict[tuple, TenantContext] = {}
+        for tenant in self.tenants:
+            unique.setdefault(tenant.destinations()[kind], tenant)
+        return unique
@@ -1,10 +1,70 @@
 """OpenAI API service for paper filtering and summarization."""
 
-import arxiv  # type: ignore
-from openai import OpenAI
+import logging
+import re
+import time
+from typing import TypeVar
+
+from openai import (
+    AsyncOpenAI,
+    ContentFilterFinishReasonError,
+    LengthFinishReasonError,
+    OpenAI,
+)
+from pydantic import BaseModel, ValidationError
 
 from ..config import Settings
-from ..models import Papers, PaperSummary
+from ..logging_config import log_with_context
+from ..models import PaperRecord, Papers, PaperSummary
+from .cassette import get_cassette, interaction_key
+from .hedging import get_request_hedger
+from .usage import get_usage_tracker
+from .verdict_cache import VerdictCache, content_hash
+
+logger = logging.getLogger(__name__)
+
+ParsedT = TypeVar("ParsedT", bound=BaseModel)
+
+# Structured-output failures that a larger model is likely to avoid
+SUMMARY_PARSE_ERRORS = (
+    LengthFinishReasonError,
+    ContentFilterFinishReasonError,
+    ValidationError,
+)
+
+# Hiragana, katakana and CJK ideographs
+_JAPANESE_RE = re.compile(r"[\u3040-\u30ff\u4e00-\u9fff]")
+
+
+def summary_problems(summary: PaperSummary | None) -> list[str]:
+    """Check a parsed summary for signs of a low-quality answer.
+
+    Args:
+        summary: Parsed summary, or None if the model refused.
+
+    Returns:
+        Descriptions of the problems found; empty if the summary looks fine.
+    """
+    if summary is None:
+        return ["no parsed summary"]
+
+    problems = []
+    fields = {
+        "japanese_title": summary.japanese_title,
+        "summary": summary.summary,
+        "merit": summary.merit,
+        "method": summary.method,
+        "valid": summary.valid,
+        "discussion": summary.discussion,
+    }
+    empty = [name for name, value in fields.items() if not value.strip()]
+    if empty:
+        problems.append(f"empty fields: {', '.join(empty)}")
+    if not summary.keywords:
+        problems.append("no keywords")
+    if not _JAPANESE_RE.search(summary.summary):
+        problems.append("summary is not in Japanese")
+    return problems
 
 
 class OpenAIService:
@@ -14,24 +74,129 @@ class OpenAIService:
         """Initialize OpenAIService with settings."""
         self.settings = settings
 
-    def filter_interesting_papers(
-        self, papers: list[arxiv.Result], num_papers: int, model: str
-    ) -> list[arxiv.Result]:
-        """Filter papers based on user-defined keywords using OpenAI.
+    def create_async_client(self) -> AsyncOpenAI:
+        """Create an async OpenAI client.
 
-        Args:
-            papers: List of arXiv papers to filter.
-            num_papers: Maximum number of papers to return if filtering fails.
-            model: OpenAI model to use for filtering.
+        The async client is bound to the event loop it is used in, so callers
+        create one per run and pass it to the ``a``-prefixed methods.
+        """
+        cassette = get_cassette(self.settings)
+        if cassette is not None and cassette.replaying:
+            # Never used for requests; replayed runs need no API key
+            return AsyncOpenAI(api_key=self.settings.openai_api_key or "replay")
 
-        Returns:
-            List of interesting papers based on keyword matching.
+        self.settings.validate_required_env_vars("summarize")
+        return AsyncOpenAI(api_key=self.settings.openai_api_key)
+
+    def _parse(
+        self,
+        operation: str,
+        model: str,
+        prompt: str,
+        response_format: type[ParsedT],
+        paper: str | None = None,
+    ) -> ParsedT | None:
+        """Request a structured output, going through the cassette if enabled.
+
+        Token usage and latency of the call are recorded under ``operation``.
+        Slow calls are hedged with a duplicate request if hedging is enabled.
         """
-        if not (
+        cassette = get_cassette(self.settings)
+        key = interaction_key(model, prompt)
+        if cassette is not None and cassette.replaying:
+            return self._replay_parsed(key, response_format)
+
+        self.settings.validate_required_env_vars(operation)
+
+        def make_client() -> OpenAI:
+            return OpenAI(api_key=self.settings.openai_api_key)
+
+        def request(client: OpenAI) -> ParsedT | None:
+            started = time.monotonic()
+            completion = client.beta.chat.completions.parse(
+                model=model,
+                messages=[
+                    {"role": "user", "content": prompt},
+                ],
+                response_format=response_format,
+            )
+            get_usage_tracker(self.settings).record(
+                operation, model, completion.usage, time.monotonic() - started, paper
+            )
+            return completion.choices[0].message.parsed
+
+        hedger = get_request_hedger(self.settings)
+        if hedger is None:
+            parsed = request(make_client())
+        else:
+            parsed = hedger.hedge(operation, model, make_client, request)
+        self._record_parsed(key, parsed)
+        return parsed
+
+    async def _aparse(
+        self,
+        client: AsyncOpenAI,
+        operation: str,
+        model: str,
+        prompt: str,
+        response_format: type[ParsedT],
+        paper: str | None = None,
+    ) -> ParsedT | None:
+        """Async variant of :meth:`_parse`."""
+        cassette = get_cassette(self.settings)
+        key = interaction_key(model, prompt)
+        if cassette is not None and cassette.replaying:
+            return self._replay_parsed(key, response_format)
+
+        async def request() -> ParsedT | None:
+            started = time.monotonic()
+            completion = await client.beta.chat.completions.parse(
+                model=model,
+                messages=[
+                    {"role": "user", "content": prompt},
+                ],
+                response_format=response_format,
+            )
+            get_usage_tracker(self.settings).record(
+                operation, model, completion.usage, time.monotonic() - started, paper
+            )
+            return completion.choices[0].message.parsed
+
+        hedger = get_request_hedger(self.settings)
+        if hedger is None:
+            parsed = await request()
+        else:
+            parsed = await hedger.ahedge(operation, model, request)
+        self._record_parsed(key, parsed)
+        return parsed
+
+    def _replay_parsed(
+        self, key: str, response_format: type[ParsedT]
+    ) -> ParsedT | None:
+        """Serve a recorded structured output."""
+        cassette = get_cassette(self.settings)
+        assert cassette is not None
+        data = cassette.lookup("openai", key)
+        return None if data is None else response_format.model_validate(data)
+
+    def _record_parsed(self, key: str, parsed: BaseModel | None) -> None:
+        """Record a structured output when recording a cassette."""
+        cassette = get_cassette(self.settings)
+        if cassette is not None and cassette.recording:
+            data = None if parsed is None else parsed.model_dump(mode="json")
+            cassette.record("openai", key, data)
+
+    def _filter_configured(self) -> bool:
+        """Whether both the keywords file and the filter prompt exist."""
+        return (
             self.settings.keywords_file.exists()
             and self.settings.filter_prompt_file.exists()
-        ):
-            return papers
+        )
+
+    def _build_filter_prompt(self, papers: list[PaperRecord]) -> str | None:
+        """Build the filter prompt, or None if filtering is not configured."""
+        if not self._filter_configured():
+            return None
 
         prompt = self.settings.filter_prompt_file.read_text()
         keywords = self.settings.keywords_file.read_text().splitlines()
@@ -42,22 +207,17 @@ class OpenAIService:
 
         prompt = prompt.replace("{keywords}", keyword_sentence)
 
-        self.settings.validate_required_env_vars("filter")
-        client = OpenAI(api_key=self.settings.openai_api_key)
-
         titles_sentence = ""
         for idx, paper in enumerate(papers):
             titles_sentence += f"{idx}. {paper.title}\n"
 
-        completion = client.beta.chat.completions.parse(
-            model=model,
-            messages=[
-                {"role": "user", "content": prompt + titles_sentence},
-            ],
-            response_format=Papers,
-        )
+        return prompt + titles_sentence
 
-        response = completion.choices[0].message.parsed
+    @staticmethod
+    def _select_filtered_papers(
+        papers: list[PaperRecord], response: Papers | None, num_papers: int
+    ) -> list[PaperRecord]:
+        """Map a parsed filter response back onto the original papers."""
         print(response)
 
         if response is None:
@@ -71,32 +231,248 @@ class OpenAIService:
 
         return interesting_papers
 
-    def summarize_paper(self, title: str, text: str, model: str) -> PaperSummary | None:
+    def _verdict_key(self, model: str) -> tuple[str, str, str] | None:
+        """Cache key shared by all verdicts of this filter configuration."""
+        if not self.settings.filter_verdict_cache:
+            return None
+        return (
+            content_hash(self.settings.keywords_file.read_text()),
+            content_hash(self.settings.filter_prompt_file.read_text()),
+            model,
+        )
+
+    def _cached_verdicts(
+        self, papers: list[PaperRecord], model: str
+    ) -> tuple[dict[str, bool], list[PaperRecord]]:
+        """Split papers into cached verdicts and papers still to be judged."""
+        key = self._verdict_key(model)
+        if key is None:
+            return {}, papers
+
+        cached = VerdictCache(self.settings.verdict_db_file).get_many(
+            [paper.arxiv_id for paper in papers], *key
+        )
+        unseen = [paper for paper in papers if paper.arxiv_id not in cached]
+        if cached:
+            log_with_context(
+                logger,
+                logging.INFO,
+                "Filter verdicts reused",
+                reused=len(cached),
+                to_judge=len(unseen),
+            )
+        return cached, unseen
+
+    def _merge_verdicts(
+        self,
+        papers: list[PaperRecord],
+        cached: dict[str, bool],
+        unseen: list[PaperRecord],
+        response: Papers | None,
+        num_papers: int,
+    ) -> list[PaperRecord]:
+        """Combine cached and fresh verdicts in input order, up to num_papers.
+
+        The order and the cap are the same whether a verdict was cached or
+        judged in this call.
+        """
+        selected_ids = set()
+        if unseen:
+            selected = self._select_filtered_papers(unseen, response, num_papers)
+            selected_ids = {paper.arxiv_id for paper in selected}
+        return [
+            paper
+            for paper in papers
+            if cached.get(paper.arxiv_id) or paper.arxiv_id in selected_ids
+        ][:num_papers]
+
+    def _store_verdicts(
+        self,
+        unseen: list[PaperRecord],
+        response: Papers | None,
+        num_papers: int,
+        model: str,
+    ) -> None:
+        """Persist the verdicts of a successful filter response.
+
+        A response that reached the cap of ``num_papers`` may have left out
+        papers only for lack of room, so its negative verdicts are not kept.
+        """
+        key = self._verdict_key(model)
+        if key is None or response is None:
+            return
+
+        selected_idxs = {int(paper.idx) for paper in response.papers}
+        capped = len(selected_idxs) >= num_papers
+        verdicts = {
+            paper.arxiv_id: idx in selected_idxs
+            for idx, paper in enumerate(unseen)
+            if idx in selected_idxs or not capped
+        }
+        VerdictCache(self.settings.verdict_db_file).put_many(verdicts, *key)
+
+    def _build_summarize_prompt(self, title: str, text: str) -> str:
+        """Build the summarization prompt for a paper."""
+        summarize_prompt = self.settings.summarize_prompt_file.read_text()
+        return summarize_prompt + f"[タイトル]\n{title}\n[本文]\n{text}"
+
+    def filter_interesting_papers(
+        self, papers: list[PaperRecord], num_papers: int, model: str | None
+    ) -> list[PaperRecord]:
+        """Filter papers based on user-defined keywords using OpenAI.
+
+        Args:
+            papers: List of arXiv papers to filter.
+            num_papers: Maximum number of papers to return.
+            model: OpenAI model to use, or None for ``settings.filter_model``.
+
+        Returns:
+            List of interesting papers based on keyword matching.
+        """
+        if not self._filter_configured():
+            return papers
+
+        model = model or self.settings.filter_model
+        cached, unseen = self._cached_verdicts(papers, model)
+
+        response = None
+        if unseen:
+            prompt = self._build_filter_prompt(unseen)
+            assert prompt is not None
+            response = self._parse("filter", model, prompt, Papers)
+            self._store_verdicts(unseen, response, num_papers, model)
+
+        return self._merge_verdicts(papers, cached, unseen, response, num_papers)
+
+    async def afilter_interesting_papers(
+        self,
+        client: AsyncOpenAI,
+        papers: list[PaperRecord],
+        num_papers: int,
+        model: str | None,
+    ) -> list[PaperRecord]:
+        """Async variant of :meth:`filter_interesting_papers`.
+
+        Args:
+            client: Async OpenAI client.
+            papers: List of arXiv papers to filter.
+            num_papers: Maximum number of papers to return.
+            model: OpenAI model to use, or None for ``settings.filter_model``.
+
+        Returns:
+            List of interesting papers based on keyword matching.
+        """
+        if not self._filter_configured():
+            return papers
+
+        model = model or self.settings.filter_model
+        cached, unseen = self._cached_verdicts(papers, model)
+
+        response = None
+        if unseen:
+            prompt = self._build_filter_prompt(unseen)
+            assert prompt is not None
+            response = await self._aparse(client, "filter", model, prompt, Papers)
+            self._store_verdicts(unseen, response, num_papers, model)
+
+        return self._merge_verdicts(papers, cached, unseen, response, num_papers)
+
+    def summarize_paper(
+        self, title: str, text: str, model: str | None
+    ) -> PaperSummary | None:
         """Generate a structured summary of a research paper.
 
+        Models are tried in cascade order: the next model is used only when
+        the previous one fails to produce a parsable summary or the summary
+        fails :func:`summary_problems`. The last model's answer is returned
+        as is.
+
         Args:
             title: Paper title.
             text: Full text content of the paper.
-            model: OpenAI model to use for summarization.
+            model: OpenAI model to use, or None to cascade through
+                ``settings.summary_models``.
 
         Returns:
             Structured paper summary or None if summarization fails.
         """
-        summarize_prompt = self.settings.summarize_prompt_file.read_text()
+        prompt = self._build_summarize_prompt(title, text)
+        models = self._summary_models(model)
 
-        self.settings.validate_required_env_vars("summarize")
-        client = OpenAI(api_key=self.settings.openai_api_key)
-
-        response = client.beta.chat.completions.parse(
-            model=model,
-            messages=[
-                {
-                    "role": "user",
-                    "content": summarize_prompt
-                    + f"[タイトル]\n{title}\n[本文]\n{text}",
-                },
-            ],
-            response_format=PaperSummary,
-        )
+        for attempt, candidate in enumerate(models, start=1):
+            try:
+                summary = self._parse(
+                    "summarize", candidate, prompt, PaperSummary, paper=title
+                )
+            except SUMMARY_PARSE_ERRORS as e:
+                if attempt == len(models):
+                    raise
+                self._log_escalation(title, candidate, str(e))
+                continue
+
+            if self._accept_summary(title, candidate, summary, attempt == len(models)):
+                return summary
+
+        return None
+
+    async def asummarize_paper(
+        self, client: AsyncOpenAI, title: str, text: str, model: str | None
+    ) -> PaperSummary | None:
+        """Async variant of :meth:`summarize_paper`.
+
+        Args:
+            client: Async OpenAI client.
+            title: Paper title.
+            text: Full text content of the paper.
+            model: OpenAI model to use, or None to cascade through
+                ``settings.summary_models``.
+
+        Returns:
+            Structured paper summary or None if summarization fails.
+        """
+        prompt = self._build_summarize_prompt(title, text)
+        models = self._summary_models(model)
 
-        return response.choices[0].message.parsed
+        for attempt, candidate in enumerate(models, start=1):
+            try:
+                summary = await self._aparse(
+                    client, "summarize", candidate, prompt, PaperSummary, paper=title
+                )
+            except SUMMARY_PARSE_ERRORS as e:
+                if attempt == len(models):
+                    raise
+                self._log_escalation(title, candidate, str(e))
+                continue
+
+            if self._accept_summary(title, candidate, summary, attempt == len(models)):
+                return summary
+
+        return None
+
+    def _summary_models(self, model: str | None) -> list[str]:
+        """Models to try for summarization, cheapest first."""
+        if model is not None:
+            return [model]
+        if not self.settings.summary_models:
+            raise ValueError("SUMMARY_MODELS must list at least one model")
+        return list(self.settings.summary_models)
+
+    def _accept_summary(
+        self, title: str, model: str, summary: PaperSummary | None, last: bool
+    ) -> bool:
+        """Whether a summary is good enough to stop the cascade."""
+        problems = summary_problems(summary)
+        if not problems or last:
+            return True
+        self._log_escalation(title, model, "; ".join(problems))
+        return False
+
+    @staticmethod
+    def _log_escalation(title: str, model: str, reason: str) -> None:
+        """Log that a summary is retried with the next model."""
+        logger.info(
+            "Escalating summary to next model: paper=%s model=%s reason=%s",
+            title,
+            model,
+            reason,
+        )
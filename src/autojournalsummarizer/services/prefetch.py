@@ -0,0 +1,165 @@
+"""Speculative PDF prefetching while papers are being filtered."""
+
+import re
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+
+from ..models import PaperRecord
+from .downloads import DownloadManager
+
+# Parallel prefetch downloads; kept low to stay polite to arxiv.org
+_PREFETCH_WORKERS = 2
+
+# A keyword in the title counts this many times more than one in the abstract
+_TITLE_WEIGHT = 3
+
+
+def rank_prefetch_candidates(
+    papers: list[PaperRecord], keywords: list[str], limit: int
+) -> list[PaperRecord]:
+    """Papers most likely to pass the filter, ranked by keyword matches.
+
+    Keywords are matched as whole words, case-insensitively, against the
+    title and the abstract. Papers matching no keyword are not returned, so
+    nothing is downloaded for them speculatively.
+
+    Args:
+        papers: Retrieved papers.
+        keywords: Lines of the keywords file.
+        limit: Maximum number of candidates.
+
+    Returns:
+        Best candidates first; ties keep the retrieval order.
+    """
+    patterns = [
+        re.compile(rf"\b{re.escape(keyword.strip())}\b", re.IGNORECASE)
+        for keyword in keywords
+        if keyword.strip()
+    ]
+
+    scored: list[tuple[int, int, PaperRecord]] = []
+    for position, paper in enumerate(papers):
+        score = 0
+        for pattern in patterns:
+            if pattern.search(paper.title):
+                score += _TITLE_WEIGHT
+            elif pattern.search(paper.summary):
+                score += 1
+        if score:
+            scored.append((-score, position, paper))
+
+    scored.sort(key=lambda item: item[:2])
+    return [paper for _, _, paper in scored[:limit]]
+
+
+@dataclass
+class _Prefetch:
+    """A speculative download and the event that cancels it."""
+
+    future: Future[str]
+    cancel: threading.Event
+
+
+class PdfPrefetcher:
+    """Download likely candidates into a bounded staging area in the background.
+
+    Downloads are started as soon as papers are retrieved, while the LLM
+    filter is still running. Papers the filter selects are moved out of the
+    staging area when their turn comes; the others are cancelled or evicted.
+    """
+
+    def __init__(self, manager: DownloadManager, workers: int = _PREFETCH_WORKERS):
+        """Initialize PdfPrefetcher.
+
+        Args:
+            manager: Download manager the PDFs are fetched with.
+            workers: Number of parallel downloads.
+        """
+        self.manager = manager
+        self._staging = TemporaryDirectory(prefix="pdf-prefetch-")
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="pdf-prefetch"
+        )
+        self._prefetches: dict[str, _Prefetch] = {}
+        self._lock = threading.Lock()
+        self.started = 0
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+
+    def start(self, papers: list[PaperRecord]) -> None:
+        """Start downloading candidates; the staging area holds all of them."""
+        with self._lock:
+            for paper in papers:
+                if paper.short_id in self._prefetches:
+                    continue
+                cancel = threading.Event()
+                future = self._executor.submit(
+                    self.manager.download_pdf, paper, self._staging.name, cancel
+                )
+                self._prefetches[paper.short_id] = _Prefetch(future, cancel)
+                self.started += 1
+
+    def retain(self, papers: list[PaperRecord]) -> None:
+        """Cancel or evict every prefetch except the given papers."""
+        keep = {paper.short_id for paper in papers}
+        with self._lock:
+            for short_id in list(self._prefetches):
+                if short_id not in keep:
+                    self._evict(self._prefetches.pop(short_id))
+
+    def take(self, paper: PaperRecord, dirpath: str) -> str | None:
+        """Move a prefetched PDF into dirpath, waiting if it is in flight.
+
+        Returns:
+            Path of the PDF in dirpath, or None if it was not prefetched or
+            the prefetch failed.
+        """
+        with self._lock:
+            prefetch = self._prefetches.pop(paper.short_id, None)
+        if prefetch is None:
+            self.misses += 1
+            return None
+
+        try:
+            staged = prefetch.future.result()
+        except Exception:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return str(shutil.move(staged, Path(dirpath) / paper.pdf_filename))
+
+    def close(self) -> dict[str, Any]:
+        """Drop remaining prefetches and remove the staging area.
+
+        Returns:
+            Prefetch statistics, including the hit rate over all downloads
+            the workflow asked for.
+        """
+        self.retain([])
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._staging.cleanup()
+
+        requested = self.hits + self.misses
+        return {
+            "prefetched": self.started,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evicted": self.evicted,
+            "hit_rate": round(self.hits / requested, 3) if requested else None,
+        }
+
+    def _evict(self, prefetch: _Prefetch) -> None:
+        """Cancel a pending or running download, or delete its staged file."""
+        self.evicted += 1
+        prefetch.cancel.set()
+        if prefetch.future.cancel() or not prefetch.future.done():
+            return
+        if prefetch.future.exception() is None:
+            Path(prefetch.future.result()).unlink(missing_ok=True)
@@ -0,0 +1,189 @@
+"""Token-reducing cleanup of extracted paper text before summarization."""
+
+import re
+import unicodedata
+from collections import Counter
+from collections.abc import Callable
+
+from .utils import CHARS_PER_TOKEN
+
+TextPreprocessor = Callable[[str], str]
+
+PREPROCESSORS: dict[str, TextPreprocessor] = {}
+
+# Headings are matched on their own line, optionally numbered ("7 References",
+# "A. Appendix", "VI. REFERENCES")
+_NUMBERING = r"(?:[0-9]+|[A-Z]|[IVX]+)?\.?\s*"
+_REFERENCES_RE = re.compile(
+    rf"^\s*{_NUMBERING}(?:references|bibliography|literature cited|参考文献)\s*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+# An appendix heading may carry a letter and a title after a separator, but
+# not running text ("Appendix C shows ..." is a reference, not a heading)
+_APPENDIX_RE = re.compile(
+    rf"^\s*{_NUMBERING}(?:appendix|appendices|supplementary materials?"
+    r"|supplemental materials?)(?:\s+[A-Z0-9]{1,2})?(?:\s*[:.\-—]\s*.{0,60})?\s*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+_CAPTION_RE = re.compile(r"^\s*(?:figure|fig\.|table)\s*[0-9]+[.:]", re.IGNORECASE)
+_PAGE_NUMBER_RE = re.compile(r"^\s*(?:page\s*)?[0-9]{1,3}(?:\s*(?:of|/)\s*[0-9]+)?\s*$")
+_ARXIV_STAMP_RE = re.compile(r"^\s*arXiv:[0-9]{4}\.[0-9]{4,5}(?:v[0-9]+)?\b")
+
+# Sections this early in the text are more likely a table of contents or a
+# mention in the introduction than the real section
+_MIN_SECTION_POSITION = 0.3
+
+# Short lines repeated this often are running page headers or footers
+_MIN_HEADER_REPEATS = 3
+_MAX_HEADER_CHARS = 100
+
+# Math residue has operators and either no words, or only a few tokens that
+# are mostly operators; result table rows have numbers but few operators
+_MIN_GARBAGE_CHARS = 8
+_MAX_RESIDUE_TOKENS = 6
+_MIN_OPERATOR_RATIO = 0.2
+_WORD_RE = re.compile(r"[^\W\d_]{2,}")
+_ASCII_OPERATORS = set("^_\\")
+# Math symbols that also appear in result tables ("85.2 ± 0.3", "+1.2",
+# "<0.01")
+_TABLE_SYMBOLS = set("±+\u2212<>|~")
+
+
+def preprocessor(name: str) -> Callable[[TextPreprocessor], TextPreprocessor]:
+    """Register a text preprocessing step under a name usable in settings."""
+
+    def decorator(func: TextPreprocessor) -> TextPreprocessor:
+        PREPROCESSORS[name] = func
+        return func
+
+    return decorator
+
+
+def _late_headings(heading: re.Pattern[str], text: str) -> list[int]:
+    """Start offsets of headings in the later part of text."""
+    return [
+        match.start()
+        for match in heading.finditer(text)
+        if match.start() >= len(text) * _MIN_SECTION_POSITION
+    ]
+
+
+@preprocessor("page_artifacts")
+def drop_page_artifacts(text: str) -> str:
+    """Drop page numbers, arXiv stamps and repeated running headers."""
+    lines = text.splitlines()
+    counts = Counter(
+        line.strip() for line in lines if 0 < len(line.strip()) <= _MAX_HEADER_CHARS
+    )
+    return "\n".join(
+        line
+        for line in lines
+        if not (
+            _PAGE_NUMBER_RE.match(line)
+            or _ARXIV_STAMP_RE.match(line)
+            or counts.get(line.strip(), 0) >= _MIN_HEADER_REPEATS
+        )
+    )
+
+
+@preprocessor("dehyphenate")
+def dehyphenate(text: str) -> str:
+    """Join words hyphenated across line breaks ("summar-\\nization").
+
+    The hyphen is kept when the word is already a hyphenated compound
+    ("state-of-\\nthe-art").
+    """
+
+    def join(match: re.Match[str]) -> str:
+        head, tail = match.groups()
+        return f"{head}-{tail}" if "-" in head else head + tail
+
+    return re.sub(r"(\w[\w-]*[a-z])-\n\s*([a-z])", join, text)
+
+
+@preprocessor("references")
+def drop_references(text: str) -> str:
+    """Drop the references section, keeping any appendix after it."""
+    starts = _late_headings(_REFERENCES_RE, text)
+    if not starts:
+        return text
+    appendix = _APPENDIX_RE.search(text, starts[0] + 1)
+    end = appendix.start() if appendix is not None else len(text)
+    return text[: starts[0]] + text[end:]
+
+
+@preprocessor("appendix")
+def drop_appendix(text: str) -> str:
+    """Drop appendices and supplementary material at the end of the paper."""
+    starts = _late_headings(_APPENDIX_RE, text)
+    return text[: starts[0]] if starts else text
+
+
+@preprocessor("captions")
+def drop_captions(text: str) -> str:
+    """Drop figure and table caption lines."""
+    return "\n".join(line for line in text.splitlines() if not _CAPTION_RE.match(line))
+
+
+@preprocessor("math_residue")
+def drop_math_residue(text: str) -> str:
+    """Drop lines of broken math glyphs, keeping numeric table rows.
+
+    A line is residue if it has math operators and no words, or at most a
+    few tokens that are largely operators. Lines of numbers without
+    operators (result tables) and prose mentioning a formula are kept.
+    """
+
+    def is_operator(char: str) -> bool:
+        if char in _TABLE_SYMBOLS:
+            return False
+        return unicodedata.category(char) == "Sm" or char in _ASCII_OPERATORS
+
+    def is_residue(line: str) -> bool:
+        chars = [char for char in line if not char.isspace()]
+        if len(chars) < _MIN_GARBAGE_CHARS:
+            return False
+        operators = sum(is_operator(char) for char in chars)
+        if not operators:
+            return False
+        if not _WORD_RE.search(line):
+            return True
+        return (
+            len(line.split()) <= _MAX_RESIDUE_TOKENS
+            and operators / len(chars) >= _MIN_OPERATOR_RATIO
+        )
+
+    return "\n".join(line for line in text.splitlines() if not is_residue(line))
+
+
+@preprocessor("whitespace")
+def collapse_whitespace(text: str) -> str:
+    """Collapse runs of spaces and blank lines and strip each line."""
+    text = re.sub(r"[ \t\u00a0]+", " ", text)
+    text = "\n".join(line.strip() for line in text.splitlines())
+    return re.sub(r"\n{3,}", "\n\n", text).strip()
+
+
+def preprocess_text(text: str, steps: list[str]) -> tuple[str, dict[str, int]]:
+    """Run the named preprocessing steps in order.
+
+    Args:
+        text: Extracted paper text.
+        steps: Names of registered preprocessors.
+
+    Returns:
+        Cleaned text and the estimated tokens each step removed.
+
+    Raises:
+        ValueError: If a step name is not registered.
+    """
+    unknown = [step for step in steps if step not in PREPROCESSORS]
+    if unknown:
+        raise ValueError(f"Unknown text preprocessors: {', '.join(unknown)}")
+
+    removed: dict[str, int] = {}
+    for step in steps:
+        cleaned = PREPROCESSORS[step](text)
+        removed[step] = (len(text) - len(cleaned)) // CHARS_PER_TOKEN
+        text = cleaned
+    return text, removed
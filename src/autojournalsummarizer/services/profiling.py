@@ -0,0 +1,205 @@
+"""On-demand CPU and memory profiling of workflow stages."""
+
+import cProfile
+import io
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from ..config import Settings
+from .usage import get_usage_tracker
+
+# Frames kept per allocation; more frames make tracemalloc markedly slower
+_TRACEBACK_FRAMES = 5
+
+
+@dataclass
+class _StageStats:
+    """Measurements accumulated over every run of one stage."""
+
+    profile: cProfile.Profile = field(default_factory=cProfile.Profile)
+    calls: int = 0
+    wall_s: float = 0.0
+    peak_bytes: int = 0
+    allocations: dict[str, list[int]] = field(default_factory=dict)
+
+
+class StageProfiler:
+    """Collect a cProfile profile and tracemalloc statistics per stage.
+
+    Each stage gets a CPU profile accumulated over all of its runs, the
+    allocation sites that grew the most while it ran and its peak traced
+    memory. tracemalloc is process-wide, so allocations and peaks of stages
+    running concurrently in other threads are attributed to both stages.
+    Nested stages in the same thread are timed, but their CPU time is
+    attributed to the outer stage; the same holds for stages overlapping in
+    other threads on Python 3.12+, where only one profiler can be active.
+    """
+
+    def __init__(self, directory: Path, top_allocations: int = 25) -> None:
+        """Initialize StageProfiler.
+
+        Args:
+            directory: Run-scoped directory the reports are written to.
+            top_allocations: Number of allocation sites reported per stage.
+        """
+        self.directory = directory
+        self.top_allocations = top_allocations
+        self._stages: dict[str, _StageStats] = {}
+        self._lock = threading.Lock()
+        self._active = threading.local()
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(_TRACEBACK_FRAMES)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Profile the enclosed block as one run of a stage.
+
+        Args:
+            name: Stage name, used for the report file names.
+        """
+        with self._lock:
+            stats = self._stages.setdefault(name, _StageStats())
+
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        profiling = self._enable(name, stats.profile)
+        try:
+            yield
+        finally:
+            if profiling:
+                stats.profile.disable()
+                self._active.stage = None
+            wall_s = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            self._record(stats, wall_s, peak, after.compare_to(before, "lineno"))
+
+    def _enable(self, name: str, profile: cProfile.Profile) -> bool:
+        """Start CPU profiling unless another stage is profiling this thread."""
+        if getattr(self._active, "stage", None) is not None:
+            return False
+        try:
+            profile.enable()
+        except ValueError:
+            # Python 3.12+ allows only one active profiler per process
+            return False
+        self._active.stage = name
+        return True
+
+    def _record(
+        self,
+        stats: _StageStats,
+        wall_s: float,
+        peak: int,
+        diffs: list[tracemalloc.StatisticDiff],
+    ) -> None:
+        """Add one stage run to its accumulated statistics."""
+        with self._lock:
+            stats.calls += 1
+            stats.wall_s += wall_s
+            stats.peak_bytes = max(stats.peak_bytes, peak)
+            for diff in diffs[: self.top_allocations]:
+                site = str(diff.traceback[0])
+                totals = stats.allocations.setdefault(site, [0, 0])
+                totals[0] += diff.size_diff
+                totals[1] += diff.count_diff
+
+    def write_report(self) -> Path:
+        """Write per-stage profiles and a summary into the run directory.
+
+        For each stage ``<stage>.prof`` holds the raw CPU profile (readable
+        with ``pstats`` or snakeviz) and ``<stage>.txt`` the top functions by
+        cumulative time and the top allocation sites. ``summary.json`` lists
+        calls, wall time, peak memory and net allocations per stage.
+
+        Returns:
+            The report directory.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        summary: dict[str, dict[str, Any]] = {}
+        with self._lock:
+            for name, stats in self._stages.items():
+                stats.profile.dump_stats(self.directory / f"{name}.prof")
+                (self.directory / f"{name}.txt").write_text(
+                    self._format_stage(name, stats)
+                )
+                summary[name] = {
+                    "calls": stats.calls,
+                    "wall_s": round(stats.wall_s, 3),
+                    "peak_mib": round(stats.peak_bytes / 2**20, 2),
+                    "net_allocated_mib": round(
+                        sum(size for size, _ in stats.allocations.values()) / 2**20,
+                        2,
+                    ),
+                }
+
+        (self.directory / "summary.json").write_text(json.dumps(summary, indent=2))
+        return self.directory
+
+    def _format_stage(self, name: str, stats: _StageStats) -> str:
+        """Human-readable CPU and allocation report of a stage."""
+        out = io.StringIO()
+        out.write(
+            f"Stage: {name}\nCalls: {stats.calls}\n"
+            f"Wall time: {stats.wall_s:.3f}s\n"
+            f"Peak traced memory: {stats.peak_bytes / 2**20:.2f} MiB\n\n"
+        )
+
+        out.write("Top allocation sites (net size, count)\n")
+        sites = sorted(
+            stats.allocations.items(), key=lambda item: abs(item[1][0]), reverse=True
+        )
+        for site, (size, count) in sites[: self.top_allocations]:
+            out.write(f"{size / 1024:>12.1f} KiB {count:>8} {site}\n")
+        out.write("\n")
+
+        try:
+            profile_stats = pstats.Stats(stats.profile, stream=out)
+        except TypeError:
+            # The stage only ran while another stage was being profiled
+            out.write("No CPU profile collected\n")
+        else:
+            profile_stats.sort_stats("cumulative").print_stats(30)
+        return out.getvalue()
+
+
+_profilers_lock = threading.Lock()
+_profilers: dict[Path, StageProfiler] = {}
+
+
+def get_stage_profiler(settings: Settings) -> StageProfiler | None:
+    """Process-wide stage profiler, or None unless profiling is enabled.
+
+    Reports go to ``<profiles_dir>/<timestamp>_<run ID>``, using the run ID
+    of the usage tracker so profiles can be matched with token usage.
+    """
+    if not settings.profile:
+        return None
+
+    key = settings.profiles_dir.resolve()
+    with _profilers_lock:
+        if key not in _profilers:
+            run_id = get_usage_tracker(settings).run_id
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            _profilers[key] = StageProfiler(
+                settings.profiles_dir / f"{timestamp}_{run_id}",
+                settings.profile_top_allocations,
+            )
+        return _profilers[key]
+
+
+def reset_stage_profiler(settings: Settings) -> None:
+    """Drop the process-wide profiler, so the next run reports separately."""
+    with _profilers_lock:
+        _profilers.pop(settings.profiles_dir.resolve(), None)
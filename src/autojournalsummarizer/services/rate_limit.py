@@ -0,0 +1,39 @@
+"""Thread-safe request rate limiting."""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Enforce a minimum interval between requests across threads.
+
+    Each ``acquire`` reserves the next free time slot under a lock and then
+    sleeps outside of it, so concurrent callers are spaced out evenly instead
+    of bursting.
+    """
+
+    def __init__(self, min_interval: float) -> None:
+        """Initialize RateLimiter.
+
+        Args:
+            min_interval: Minimum number of seconds between two requests.
+        """
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> float:
+        """Block until the caller may send a request.
+
+        Returns:
+            Number of seconds the caller waited.
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
+        return wait
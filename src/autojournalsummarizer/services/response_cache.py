@@ -0,0 +1,163 @@
+"""Persistent on-disk cache for HTTP responses."""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+def normalize_url(url: str) -> str:
+    """Canonicalize a URL so equivalent queries share a cache entry.
+
+    Query parameters are sorted and whitespace inside values is collapsed,
+    so reordering parameters or reformatting a search query does not miss.
+    """
+    parts = urlsplit(url)
+    params = sorted(
+        (key, " ".join(value.split()))
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+    )
+    return urlunsplit(
+        (parts.scheme, parts.netloc.lower(), parts.path, urlencode(params), "")
+    )
+
+
+class CachedResponse:
+    """A cached response body with its validators."""
+
+    def __init__(
+        self,
+        url: str,
+        body: str,
+        fetched_at: float,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Initialize CachedResponse.
+
+        Args:
+            url: Normalized request URL.
+            body: Response body.
+            fetched_at: Unix time the body was last fetched or revalidated.
+            etag: ``ETag`` header of the response, if any.
+            last_modified: ``Last-Modified`` header of the response, if any.
+        """
+        self.url = url
+        self.body = body
+        self.fetched_at = fetched_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Whether the entry can be served without contacting the server."""
+        return time.time() - self.fetched_at < ttl
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers for revalidating a stale entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Directory of JSON files, one per normalized request URL.
+
+    Stale entries are kept so that they can be revalidated with a conditional
+    request, until they are older than the maximum age: most queries end at
+    a time bucket and are never repeated, so their entries are deleted when
+    the cache is opened. Writes go through a temporary file and an atomic
+    rename, so concurrent readers never see partial entries.
+    """
+
+    def __init__(
+        self, directory: Path, ttl: float, max_age: float | None = None
+    ) -> None:
+        """Initialize ResponseCache and prune entries past the maximum age.
+
+        Args:
+            directory: Directory holding cache entries.
+            ttl: Seconds an entry is served without revalidation.
+            max_age: Seconds after the last fetch or revalidation an entry is
+                kept, or None to keep entries forever.
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.prune()
+
+    def prune(self) -> int:
+        """Delete entries not fetched or revalidated within the maximum age.
+
+        Returns:
+            Number of deleted files.
+        """
+        if self.max_age is None or not self.directory.is_dir():
+            return 0
+        cutoff = time.time() - self.max_age
+        pruned = 0
+        for path in self.directory.iterdir():
+            if path.suffix not in (".json", ".tmp"):
+                continue
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    pruned += 1
+            except FileNotFoundError:
+                # Pruned or replaced concurrently
+                continue
+        return pruned
+
+    def _path(self, url: str) -> Path:
+        digest = hashlib.sha256(normalize_url(url).encode()).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, url: str) -> CachedResponse | None:
+        """Look up an entry, fresh or stale.
+
+        Args:
+            url: Request URL.
+
+        Returns:
+            Cached response, or None if the URL was never cached.
+        """
+        path = self._path(url)
+        try:
+            data = json.loads(path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return CachedResponse(**data)
+
+    def put(
+        self,
+        url: str,
+        body: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a response body.
+
+        Args:
+            url: Request URL.
+            body: Response body.
+            etag: ``ETag`` header of the response, if any.
+            last_modified: ``Last-Modified`` header of the response, if any.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(url)
+        entry = {
+            "url": normalize_url(url),
+            "body": body,
+            "fetched_at": time.time(),
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        tmp_path = path.with_suffix(f".{time.monotonic_ns()}.tmp")
+        tmp_path.write_text(json.dumps(entry))
+        tmp_path.replace(path)
@@ -0,0 +1,245 @@
+"""Local full-text search index over processed papers."""
+
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..config import Settings
+from ..models import PaperRecord, PaperSummary
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    id INTEGER PRIMARY KEY,
+    arxiv_id TEXT NOT NULL UNIQUE,
+    published TEXT NOT NULL,
+    pdf_url TEXT NOT NULL,
+    indexed_at REAL NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+    title, authors, japanese_title, summary, details, keywords, body,
+    tokenize = '{tokenizer}'
+);
+"""
+
+# The trigram tokenizer (SQLite 3.34+) matches substrings, which is what
+# makes unsegmented Japanese text searchable
+_TOKENIZERS = ("trigram", "unicode61 remove_diacritics 2")
+
+# bm25 weights of the papers_fts columns, in declaration order
+_COLUMN_WEIGHTS = (10.0, 2.0, 10.0, 5.0, 3.0, 8.0, 1.0)
+
+# Terms shorter than a trigram cannot use the index and are matched with LIKE
+_MIN_MATCH_CHARS = 3
+
+_FLUSH_BATCH_SIZE = 20
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """A paper matching a search query."""
+
+    arxiv_id: str
+    title: str
+    japanese_title: str
+    published: str
+    pdf_url: str
+    snippet: str
+    score: float
+
+
+class SearchIndex:
+    """SQLite FTS5 index of paper metadata, summaries and extracted text.
+
+    Papers are buffered as they are processed and written in batches, each
+    batch in a single transaction. Re-indexing a paper replaces its entry, so
+    the index is updated incrementally by every run.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """Initialize SearchIndex.
+
+        Args:
+            db_path: Path to the SQLite database file.
+        """
+        self.db_path = db_path
+        self._pending: list[tuple[PaperRecord, str, PaperSummary | None]] = []
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            for tokenizer in _TOKENIZERS:
+                try:
+                    conn.executescript(_SCHEMA.format(tokenizer=tokenizer))
+                    break
+                except sqlite3.OperationalError:
+                    if tokenizer == _TOKENIZERS[-1]:
+                        raise
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def add(self, paper: PaperRecord, text: str, summary: PaperSummary | None) -> None:
+        """Queue a processed paper, flushing once a batch is full.
+
+        Args:
+            paper: Paper metadata.
+            text: Extracted paper text.
+            summary: Generated summary, if any.
+        """
+        with self._lock:
+            self._pending.append((paper, text, summary))
+            full = len(self._pending) >= _FLUSH_BATCH_SIZE
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write queued papers to the index.
+
+        Returns:
+            Number of papers written.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return 0
+
+        now = time.time()
+        with self._connect() as conn:
+            for paper, text, summary in pending:
+                row = conn.execute(
+                    "SELECT id FROM papers WHERE arxiv_id = ?", (paper.arxiv_id,)
+                ).fetchone()
+                if row is None:
+                    rowid = conn.execute(
+                        "INSERT INTO papers (arxiv_id, published, pdf_url, "
+                        "indexed_at) VALUES (?, ?, ?, ?)",
+                        (
+                            paper.arxiv_id,
+                            paper.published.isoformat(),
+                            paper.pdf_url,
+                            now,
+                        ),
+                    ).lastrowid
+                else:
+                    (rowid,) = row
+                    conn.execute(
+                        "UPDATE papers SET published = ?, pdf_url = ?, "
+                        "indexed_at = ? WHERE id = ?",
+                        (paper.published.isoformat(), paper.pdf_url, now, rowid),
+                    )
+                    conn.execute("DELETE FROM papers_fts WHERE rowid = ?", (rowid,))
+                conn.execute(
+                    "INSERT INTO papers_fts (rowid, title, authors, japanese_title, "
+                    "summary, details, keywords, body) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (rowid, *_fts_columns(paper, text, summary)),
+                )
+        return len(pending)
+
+    def search(self, query: str, limit: int = 10) -> list[SearchHit]:
+        """Find papers matching all terms of a query, best matches first.
+
+        Args:
+            query: Whitespace-separated search terms.
+            limit: Maximum number of results.
+
+        Returns:
+            Matching papers ranked by BM25, or newest first when every term
+            is too short for the index.
+        """
+        terms = query.split()
+        if not terms:
+            return []
+
+        long_terms = [term for term in terms if len(term) >= _MIN_MATCH_CHARS]
+        short_terms = [term for term in terms if len(term) < _MIN_MATCH_CHARS]
+
+        clauses: list[str] = []
+        params: list[str | int] = []
+        if long_terms:
+            clauses.append("papers_fts MATCH ?")
+            params.append(" ".join(_quote(term) for term in long_terms))
+        for term in short_terms:
+            clauses.append(
+                "(papers_fts.title || ' ' || papers_fts.japanese_title || ' ' || "
+                "papers_fts.keywords || ' ' || papers_fts.summary) LIKE ?"
+            )
+            params.append(f"%{term}%")
+
+        if long_terms:
+            weights = ", ".join(str(weight) for weight in _COLUMN_WEIGHTS)
+            score = f"bm25(papers_fts, {weights})"
+            snippet = "snippet(papers_fts, -1, '[', ']', '…', 12)"
+        else:
+            score = "0.0"
+            snippet = "substr(papers_fts.summary, 1, 80)"
+
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT papers.arxiv_id, papers_fts.title, papers_fts.japanese_title, "
+                f"papers.published, papers.pdf_url, {snippet}, {score} AS score "
+                "FROM papers_fts JOIN papers ON papers.id = papers_fts.rowid "
+                f"WHERE {' AND '.join(clauses)} "
+                "ORDER BY score, papers.published DESC LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+        return [SearchHit(*row) for row in rows]
+
+    def count(self) -> int:
+        """Number of indexed papers."""
+        with self._connect() as conn:
+            (count,) = conn.execute("SELECT COUNT(*) FROM papers").fetchone()
+        return int(count)
+
+
+def _quote(term: str) -> str:
+    """Quote a term so FTS5 query syntax in user input is matched literally."""
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _fts_columns(
+    paper: PaperRecord, text: str, summary: PaperSummary | None
+) -> tuple[str, ...]:
+    """Values of the papers_fts columns for a paper."""
+    if summary is None:
+        return (paper.title, ", ".join(paper.authors), "", paper.summary, "", "", text)
+    return (
+        paper.title,
+        ", ".join(paper.authors),
+        summary.japanese_title,
+        summary.summary,
+        "\n".join((summary.merit, summary.method, summary.valid, summary.discussion)),
+        "\n".join(
+            f"{keyword.keyword}: {keyword.explanation}" for keyword in summary.keywords
+        ),
+        text,
+    )
+
+
+_indexes_lock = threading.Lock()
+_indexes: dict[Path, SearchIndex] = {}
+
+
+def get_search_index(settings: Settings) -> SearchIndex | None:
+    """Process-wide search index, or None if indexing is disabled."""
+    if not settings.search_index:
+        return None
+
+    key = settings.search_index_file.resolve()
+    with _indexes_lock:
+        if key not in _indexes:
+            _indexes[key] = SearchIndex(settings.search_index_file)
+        return _indexes[key]
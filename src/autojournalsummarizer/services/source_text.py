@@ -0,0 +1,304 @@
+"""Paper text extraction from arXiv LaTeX sources and HTML renderings."""
+
+import gzip
+import io
+import re
+import tarfile
+from typing import IO, cast
+
+import requests
+from bs4 import BeautifulSoup
+
+from ..config import Settings
+from ..models import PaperRecord
+from .cassette import get_cassette, interaction_key
+from .utils import CHARS_PER_TOKEN
+
+ARXIV_EPRINT_URL = "https://arxiv.org/e-print/{paper_id}"
+ARXIV_HTML_URL = "https://arxiv.org/html/{paper_id}"
+
+# .tex members larger than this are almost certainly generated data, not prose
+MAX_TEX_MEMBER_BYTES = 5 * 1024 * 1024
+
+# Environments whose content is noise for summarization
+_DROPPED_ENVIRONMENTS = (
+    "figure",
+    "figure*",
+    "table",
+    "table*",
+    "equation",
+    "equation*",
+    "align",
+    "align*",
+    "eqnarray",
+    "eqnarray*",
+    "gather",
+    "gather*",
+    "multline",
+    "multline*",
+    "thebibliography",
+    "tikzpicture",
+    "algorithm",
+    "algorithmic",
+)
+
+_COMMENT_RE = re.compile(r"(?<!\\)%.*")
+_INCLUDE_RE = re.compile(r"\\(?:input|include|subfile)\{([^}]+)\}")
+_SECTION_RE = re.compile(
+    r"\\(?:part|chapter|section|subsection|subsubsection|paragraph)\*?"
+    r"(?:\[[^\]]*\])?\{([^}]*)\}"
+)
+_DROPPED_COMMAND_RE = re.compile(
+    r"\\(?:cite[pt]?|citeauthor|citeyear|ref|eqref|autoref|cref|Cref|label|"
+    r"bibliography|bibliographystyle|url|footnote|includegraphics)\*?"
+    r"(?:\[[^\]]*\])*\{[^}]*\}"
+)
+_UNWRAP_COMMAND_RE = re.compile(r"\\[a-zA-Z]+\*?(?:\[[^\]]*\])?\{([^{}]*)\}")
+_BARE_COMMAND_RE = re.compile(r"\\[a-zA-Z]+\*?|\\.")
+_DISPLAY_MATH_RE = re.compile(r"\\\[.*?\\\]|\$\$.*?\$\$", re.DOTALL)
+
+
+def latex_to_text(source: str) -> str:
+    """Convert LaTeX source into plain body text.
+
+    This is deliberately a lightweight, regex-based conversion: it keeps
+    section titles and prose, and drops the preamble, comments, display math,
+    floats, citations and the bibliography.
+
+    Args:
+        source: LaTeX document source with includes already resolved.
+
+    Returns:
+        Plain text of the document body.
+    """
+    text = _COMMENT_RE.sub("", source)
+
+    begin = text.find("\\begin{document}")
+    if begin != -1:
+        text = text[begin + len("\\begin{document}") :]
+    end = text.find("\\end{document}")
+    if end != -1:
+        text = text[:end]
+
+    for environment in _DROPPED_ENVIRONMENTS:
+        name = re.escape(environment)
+        text = re.sub(
+            rf"\\begin\{{{name}\}}.*?\\end\{{{name}\}}", "", text, flags=re.DOTALL
+        )
+    text = _DISPLAY_MATH_RE.sub("", text)
+
+    text = _SECTION_RE.sub(lambda m: f"\n\n{m.group(1)}\n", text)
+    text = _DROPPED_COMMAND_RE.sub("", text)
+    text = re.sub(r"\\(?:begin|end)\{[^}]*\}", "", text)
+
+    # Unwrap formatting commands from the inside out, e.g. \emph{\textbf{x}}
+    previous = None
+    while previous != text:
+        previous = text
+        text = _UNWRAP_COMMAND_RE.sub(r"\1", text)
+
+    text = _BARE_COMMAND_RE.sub("", text)
+    text = text.replace("~", " ").replace("{", "").replace("}", "")
+    text = re.sub(r"[ \t]+", " ", text)
+    text = re.sub(r"\n\s*\n\s*", "\n\n", text)
+    return text.strip()
+
+
+def _resolve_includes(
+    name: str, files: dict[str, str], seen: set[str] | None = None
+) -> str:
+    """Inline \\input/\\include directives recursively."""
+    seen = seen if seen is not None else set()
+    seen.add(name)
+    source = _COMMENT_RE.sub("", files[name])
+
+    def replace(match: re.Match[str]) -> str:
+        target = match.group(1).strip()
+        if not target.endswith(".tex"):
+            target += ".tex"
+        target = target.lstrip("./")
+        if target not in files or target in seen:
+            return ""
+        return _resolve_includes(target, files, seen)
+
+    return _INCLUDE_RE.sub(replace, source)
+
+
+def _find_main_tex(files: dict[str, str]) -> str | None:
+    """Pick the root document among collected .tex files."""
+    candidates = [name for name, src in files.items() if "\\documentclass" in src]
+    if not candidates:
+        return None
+    # Prefer a file with a document body, then the shortest path (top level)
+    candidates.sort(key=lambda n: ("\\begin{document}" not in files[n], n.count("/")))
+    return candidates[0]
+
+
+def extract_text_from_source_archive(
+    fileobj: IO[bytes], max_chars: int | None = None
+) -> str | None:
+    """Extract body text from an arXiv e-print source archive.
+
+    The archive is read as a stream, so it can be fed directly from an HTTP
+    response without being written to disk. arXiv serves either a gzipped
+    tarball or a single gzipped .tex file; both are supported.
+
+    Args:
+        fileobj: Binary stream of the (gzip-compressed) e-print.
+        max_chars: Maximum number of characters to return.
+
+    Returns:
+        Extracted text, or None if the archive contains no LaTeX document.
+    """
+    decompressed = io.BufferedReader(gzip.GzipFile(fileobj=fileobj))
+    try:
+        header = decompressed.peek(512)[:512]
+    except OSError:
+        # Not gzip-compressed, e.g. a PDF-only submission
+        return None
+
+    files: dict[str, str] = {}
+    if header[257:262] == b"ustar":
+        with tarfile.open(fileobj=decompressed, mode="r|") as archive:
+            for member in archive:
+                if not member.isfile() or not member.name.endswith(".tex"):
+                    continue
+                if member.size > MAX_TEX_MEMBER_BYTES:
+                    continue
+                extracted = archive.extractfile(member)
+                if extracted is None:
+                    continue
+                name = member.name.lstrip("./")
+                files[name] = extracted.read().decode("utf-8", errors="replace")
+    else:
+        source = decompressed.read(MAX_TEX_MEMBER_BYTES)
+        files["main.tex"] = source.decode("utf-8", errors="replace")
+
+    main_tex = _find_main_tex(files)
+    if main_tex is None:
+        return None
+
+    text = latex_to_text(_resolve_includes(main_tex, files))
+    if not text:
+        return None
+    return text[:max_chars] if max_chars is not None else text
+
+
+def html_to_text(html: str, max_chars: int | None = None) -> str | None:
+    """Extract body text from an arXiv HTML (LaTeXML) rendering.
+
+    Args:
+        html: HTML document.
+        max_chars: Maximum number of characters to return.
+
+    Returns:
+        Extracted text, or None if the page has no article body.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    article = soup.find("article") or soup.body
+    if article is None:
+        return None
+
+    for selector in (
+        "script",
+        "style",
+        "nav",
+        "header",
+        "footer",
+        "figure",
+        "table",
+        "math",
+        ".ltx_bibliography",
+        ".ltx_page_footer",
+        ".ltx_authors",
+    ):
+        for element in article.select(selector):
+            element.decompose()
+
+    text = article.get_text(separator=" ")
+    text = re.sub(r"[ \t]+", " ", text)
+    text = re.sub(r"\n\s*\n\s*", "\n\n", text).strip()
+    if not text:
+        return None
+    return text[:max_chars] if max_chars is not None else text
+
+
+class ArxivSourceService:
+    """Service for extracting paper text from arXiv sources instead of PDFs."""
+
+    def __init__(self, settings: Settings) -> None:
+        """Initialize ArxivSourceService with settings."""
+        self.settings = settings
+
+    @property
+    def max_chars(self) -> int | None:
+        """Character budget derived from the extraction limits in settings."""
+        budgets = []
+        if self.settings.pdf_max_chars is not None:
+            budgets.append(self.settings.pdf_max_chars)
+        if self.settings.pdf_max_tokens is not None:
+            budgets.append(self.settings.pdf_max_tokens * CHARS_PER_TOKEN)
+        return min(budgets) if budgets else None
+
+    def fetch_text(self, paper: PaperRecord) -> str | None:
+        """Fetch paper text from the configured non-PDF source.
+
+        Args:
+            paper: Paper record.
+
+        Returns:
+            Extracted text, or None if the source is unavailable and the caller
+            should fall back to the PDF.
+        """
+        paper_id = paper.short_id
+        cassette = get_cassette(self.settings)
+        key = interaction_key(self.settings.text_source, paper_id)
+        if cassette is not None and cassette.replaying:
+            return cast(str | None, cassette.lookup("source", key))
+
+        text = None
+        if self.settings.text_source == "latex":
+            text = self.fetch_latex_text(paper_id)
+        elif self.settings.text_source == "html":
+            text = self.fetch_html_text(paper_id)
+
+        if cassette is not None and cassette.recording:
+            cassette.record("source", key, text)
+        return text
+
+    def fetch_latex_text(self, paper_id: str) -> str | None:
+        """Stream the e-print source of a paper and extract its text.
+
+        Args:
+            paper_id: arXiv short ID (with or without version).
+
+        Returns:
+            Extracted text, or None if no LaTeX source is available.
+        """
+        url = ARXIV_EPRINT_URL.format(paper_id=paper_id)
+        with requests.get(
+            url, stream=True, timeout=self.settings.source_timeout
+        ) as response:
+            if response.status_code != 200:
+                return None
+            if "pdf" in response.headers.get("Content-Type", ""):
+                return None
+            response.raw.decode_content = False
+            return extract_text_from_source_archive(
+                cast(IO[bytes], response.raw), max_chars=self.max_chars
+            )
+
+    def fetch_html_text(self, paper_id: str) -> str | None:
+        """Fetch the HTML rendering of a paper and extract its text.
+
+        Args:
+            paper_id: arXiv short ID (with or without version).
+
+        Returns:
+            Extracted text, or None if no HTML rendering is available.
+        """
+        url = ARXIV_HTML_URL.format(paper_id=paper_id)
+        response = requests.get(url, timeout=self.settings.source_timeout)
+        if response.status_code != 200:
+            return None
+        return html_to_text(response.text, max_chars=self.max_chars)
@@ -0,0 +1,315 @@
+"""OpenAI token and cost accounting with a daily budget."""
+
+import json
+import math
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from ..config import Settings
+from ..models import PaperRecord
+
+# USD per million (input, output) tokens; matched by longest model-name prefix
+MODEL_PRICES: dict[str, tuple[float, float]] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+    "o3-mini": (1.10, 4.40),
+    "o4-mini": (1.10, 4.40),
+}
+
+# Calls needed before latency percentiles are trusted
+MIN_LATENCY_SAMPLES = 10
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS openai_usage (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    day TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    stage TEXT NOT NULL,
+    model TEXT NOT NULL,
+    paper TEXT,
+    prompt_tokens INTEGER NOT NULL,
+    completion_tokens INTEGER NOT NULL,
+    cost_usd REAL NOT NULL,
+    latency_s REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS openai_usage_day ON openai_usage (day);
+CREATE INDEX IF NOT EXISTS openai_usage_run ON openai_usage (run_id);
+"""
+
+
+def estimate_cost(
+    model: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+    prices: dict[str, tuple[float, float]] | None = None,
+) -> float:
+    """Estimate the USD cost of a completion.
+
+    Args:
+        model: Model name, possibly with a date suffix.
+        prompt_tokens: Input tokens.
+        completion_tokens: Output tokens.
+        prices: Price table overriding ``MODEL_PRICES`` entries.
+
+    Returns:
+        Estimated cost, or 0.0 for models without a known price.
+    """
+    table = {**MODEL_PRICES, **(prices or {})}
+    matches = [name for name in table if model.startswith(name)]
+    if not matches:
+        return 0.0
+    input_price, output_price = table[max(matches, key=len)]
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1e6
+
+
+def _today() -> str:
+    return datetime.now(tz=timezone.utc).date().isoformat()
+
+
+class UsageTracker:
+    """Persistent per-call log of OpenAI token usage, cost and latency.
+
+    Every completion is stored with its run, stage (``filter``/``summarize``),
+    model and paper, so usage can be aggregated per run, per day or per paper.
+    Days are UTC days.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        prices: dict[str, tuple[float, float]] | None = None,
+        run_id: str | None = None,
+    ) -> None:
+        """Initialize UsageTracker.
+
+        Args:
+            db_path: Path to the SQLite database file.
+            prices: Price table overriding ``MODEL_PRICES`` entries.
+            run_id: Identifier of the current run; generated if omitted.
+        """
+        self.db_path = db_path
+        self.prices = prices
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def record(
+        self,
+        stage: str,
+        model: str,
+        usage: Any,
+        latency: float,
+        paper: str | None = None,
+    ) -> float:
+        """Record the usage of one completion.
+
+        Args:
+            stage: Pipeline stage that made the call.
+            model: Model name.
+            usage: ``usage`` field of the completion (may be None).
+            latency: Wall-clock duration of the call in seconds.
+            paper: Title of the paper the call was made for, if any.
+
+        Returns:
+            Estimated cost of the call in USD.
+        """
+        prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+        completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+        cost = estimate_cost(model, prompt_tokens, completion_tokens, self.prices)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO openai_usage (run_id, day, created_at, stage, model, "
+                "paper, prompt_tokens, completion_tokens, cost_usd, latency_s) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self.run_id,
+                    _today(),
+                    time.time(),
+                    stage,
+                    model,
+                    paper,
+                    prompt_tokens,
+                    completion_tokens,
+                    cost,
+                    latency,
+                ),
+            )
+        return cost
+
+    def spent_today(self) -> float:
+        """Total estimated cost of today's calls in USD."""
+        with self._connect() as conn:
+            (spent,) = conn.execute(
+                "SELECT COALESCE(SUM(cost_usd), 0) FROM openai_usage WHERE day = ?",
+                (_today(),),
+            ).fetchone()
+        return float(spent)
+
+    def average_cost(
+        self, stage: str, model: str | None = None, window: int = 50
+    ) -> float:
+        """Average per-paper cost of a stage over the most recent papers.
+
+        Calls for the same paper in a run (e.g. a model cascade) are summed
+        before averaging.
+
+        Args:
+            stage: Pipeline stage.
+            model: Model name, or None to include all models.
+            window: Number of recent papers to average over.
+
+        Returns:
+            Average cost in USD, or 0.0 without history.
+        """
+        with self._connect() as conn:
+            (average,) = conn.execute(
+                "SELECT COALESCE(AVG(cost), 0) FROM (SELECT SUM(cost_usd) AS cost "
+                "FROM openai_usage WHERE stage = ? AND (? IS NULL OR model = ?) "
+                "GROUP BY run_id, paper ORDER BY MAX(id) DESC LIMIT ?)",
+                (stage, model, model, window),
+            ).fetchone()
+        return float(average)
+
+    def latency_percentile(
+        self, stage: str, model: str, percentile: float, window: int = 200
+    ) -> float | None:
+        """Latency percentile of the most recent calls of a stage and model.
+
+        Args:
+            stage: Pipeline stage.
+            model: Model name.
+            percentile: Percentile between 0 and 100.
+            window: Number of recent calls to consider.
+
+        Returns:
+            Latency in seconds (nearest rank), or None with fewer than
+            ``MIN_LATENCY_SAMPLES`` calls.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT latency_s FROM openai_usage WHERE stage = ? AND model = ? "
+                "ORDER BY id DESC LIMIT ?",
+                (stage, model, window),
+            ).fetchall()
+        if len(rows) < MIN_LATENCY_SAMPLES:
+            return None
+        latencies = sorted(latency for (latency,) in rows)
+        rank = math.ceil(percentile / 100 * len(latencies))
+        return float(latencies[min(max(rank, 1), len(latencies)) - 1])
+
+    def run_summary(self) -> list[dict[str, Any]]:
+        """Usage of the current run aggregated per stage and model."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT stage, model, COUNT(*), SUM(prompt_tokens), "
+                "SUM(completion_tokens), ROUND(SUM(cost_usd), 4), "
+                "ROUND(SUM(latency_s), 2) FROM openai_usage WHERE run_id = ? "
+                "GROUP BY stage, model ORDER BY stage, model",
+                (self.run_id,),
+            ).fetchall()
+        keys = (
+            "stage",
+            "model",
+            "calls",
+            "prompt_tokens",
+            "completion_tokens",
+            "cost_usd",
+            "latency_s",
+        )
+        return [dict(zip(keys, row, strict=True)) for row in rows]
+
+    def paper_report(self) -> list[dict[str, Any]]:
+        """Tokens, cost and latency per paper in the current run."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT paper, SUM(prompt_tokens), SUM(completion_tokens), "
+                "ROUND(SUM(cost_usd), 4), ROUND(SUM(latency_s), 2) "
+                "FROM openai_usage WHERE run_id = ? AND paper IS NOT NULL "
+                "GROUP BY paper ORDER BY MIN(id)",
+                (self.run_id,),
+            ).fetchall()
+        keys = ("paper", "prompt_tokens", "completion_tokens", "cost_usd", "latency_s")
+        return [dict(zip(keys, row, strict=True)) for row in rows]
+
+
+class DeferredPapers:
+    """Interesting papers postponed to a later run by the budget."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize DeferredPapers.
+
+        Args:
+            path: Path to the JSON file holding deferred papers.
+        """
+        self.path = path
+
+    def load(self) -> list[PaperRecord]:
+        """Deferred papers, highest priority first."""
+        if not self.path.exists():
+            return []
+        return [
+            PaperRecord.from_dict(data) for data in json.loads(self.path.read_text())
+        ]
+
+    def add(self, paper: PaperRecord) -> None:
+        """Append a paper unless it is already deferred."""
+        papers = self.load()
+        if all(p.short_id != paper.short_id for p in papers):
+            self.save([*papers, paper])
+
+    def save(self, papers: list[PaperRecord]) -> None:
+        """Replace the deferred papers."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps([paper.to_dict() for paper in papers], ensure_ascii=False)
+        )
+        tmp_path.replace(self.path)
+
+
+_trackers_lock = threading.Lock()
+_trackers: dict[Path, UsageTracker] = {}
+
+
+def get_usage_tracker(settings: Settings) -> UsageTracker:
+    """Process-wide usage tracker, so one run shares one run ID."""
+    key = settings.usage_db_file.resolve()
+    with _trackers_lock:
+        if key not in _trackers:
+            prices = {
+                model: (float(price[0]), float(price[1]))
+                for model, price in settings.openai_prices.items()
+            }
+            _trackers[key] = UsageTracker(settings.usage_db_file, prices)
+        return _trackers[key]
+
+
+def reset_usage_tracker(settings: Settings) -> None:
+    """Drop the process-wide tracker, so the next run gets a new run ID."""
+    with _trackers_lock:
+        _trackers.pop(settings.usage_db_file.resolve(), None)
@@ -1,26 +1,234 @@
 """Utility functions for file operations and data management."""
 
+import os
+from collections.abc import Iterator
 from datetime import datetime
+from pathlib import Path
 
+import httpx
 from pypdf import PdfReader
 
 from ..config import Settings
+from ..models import PaperRecord
 
+# Rough average for English scientific prose; used to turn a token budget into
+# a character budget without depending on a tokenizer.
+CHARS_PER_TOKEN = 4
 
-def extract_text_from_pdf(pdf_path: str) -> str:
+
+class PdfLimitError(ValueError):
+    """Raised when a PDF cannot be read because it exceeds a hard limit."""
+
+    pass
+
+
+class PdfTextStream:
+    """Page-by-page text extraction from a PDF with hard resource limits.
+
+    Iterating over the stream yields the text of each page in order. Iteration
+    stops early once the page, character or token budget is exhausted, and
+    ``limit_reached`` reports which cap was hit (``None`` if the whole document
+    was read).
+
+    Memory stays flat in the length of the document: pypdf caches every
+    object it parses in the reader, so the cache is released after each page.
+    Objects shared between pages, such as fonts, are parsed again for each
+    page that uses them.
+    """
+
+    def __init__(
+        self,
+        pdf_path: str,
+        max_pages: int | None = None,
+        max_chars: int | None = None,
+        max_tokens: int | None = None,
+        max_file_bytes: int | None = None,
+    ) -> None:
+        """Initialize PdfTextStream.
+
+        Args:
+            pdf_path: Path to the PDF file.
+            max_pages: Maximum number of pages to read.
+            max_chars: Maximum number of characters to yield.
+            max_tokens: Maximum number of (estimated) tokens to yield.
+            max_file_bytes: Maximum input file size in bytes.
+        """
+        self.pdf_path = pdf_path
+        self.max_pages = max_pages
+        self.max_file_bytes = max_file_bytes
+
+        # Character and token budgets collapse into a single character budget;
+        # remember which one is tighter so it can be reported.
+        budgets = []
+        if max_chars is not None:
+            budgets.append((max_chars, "max_chars"))
+        if max_tokens is not None:
+            budgets.append((max_tokens * CHARS_PER_TOKEN, "max_tokens"))
+        self._char_budget: int | None = None
+        self._char_budget_name: str | None = None
+        if budgets:
+            self._char_budget, self._char_budget_name = min(budgets)
+
+        self.pages_read = 0
+        self.chars_read = 0
+        self.total_pages: int | None = None
+        self.limit_reached: str | None = None
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield the text of each page until the document or a budget ends."""
+        file_size = os.path.getsize(self.pdf_path)
+        if self.max_file_bytes is not None and file_size > self.max_file_bytes:
+            self.limit_reached = "max_file_bytes"
+            raise PdfLimitError(
+                f"PDF is {file_size} bytes, exceeding limit of {self.max_file_bytes}"
+            )
+
+        # Pass an open handle so pypdf reads objects as pages are parsed
+        with open(self.pdf_path, "rb") as fh:
+            reader = PdfReader(fh)
+            self.total_pages = len(reader.pages)
+
+            for page_number in range(self.total_pages):
+                if self.max_pages is not None and page_number >= self.max_pages:
+                    self.limit_reached = "max_pages"
+                    return
+
+                page_text = reader.pages[page_number].extract_text()
+                # Release the content streams and fonts parsed for this page
+                reader.resolved_objects.clear()
+                self.pages_read += 1
+
+                if self._char_budget is not None:
+                    remaining = self._char_budget - self.chars_read
+                    if len(page_text) >= remaining:
+                        page_text = page_text[:remaining]
+                        self.chars_read += len(page_text)
+                        self.limit_reached = self._char_budget_name
+                        yield page_text
+                        return
+
+                self.chars_read += len(page_text)
+                yield page_text
+
+
+def iter_pdf_text(
+    pdf_path: str,
+    max_pages: int | None = None,
+    max_chars: int | None = None,
+    max_tokens: int | None = None,
+    max_file_bytes: int | None = None,
+) -> PdfTextStream:
+    """Create a page-by-page text stream for a PDF file.
+
+    Args:
+        pdf_path: Path to the PDF file.
+        max_pages: Maximum number of pages to read.
+        max_chars: Maximum number of characters to yield.
+        max_tokens: Maximum number of (estimated) tokens to yield.
+        max_file_bytes: Maximum input file size in bytes.
+
+    Returns:
+        Iterable stream of page texts that records which limit was reached.
+    """
+    return PdfTextStream(
+        pdf_path,
+        max_pages=max_pages,
+        max_chars=max_chars,
+        max_tokens=max_tokens,
+        max_file_bytes=max_file_bytes,
+    )
+
+
+def iter_pdf_text_for_settings(pdf_path: str, settings: Settings) -> PdfTextStream:
+    """Create a PDF text stream bounded by the limits configured in settings.
+
+    Args:
+        pdf_path: Path to the PDF file.
+        settings: Application settings.
+
+    Returns:
+        Iterable stream of page texts.
+    """
+    return iter_pdf_text(
+        pdf_path,
+        max_pages=settings.pdf_max_pages,
+        max_chars=settings.pdf_max_chars,
+        max_tokens=settings.pdf_max_tokens,
+        max_file_bytes=settings.pdf_max_file_mb * 1024 * 1024,
+    )
+
+
+def extract_pdf_text_for_settings(
+    pdf_path: str, settings: Settings
+) -> tuple[str, PdfTextStream]:
+    """Extract PDF text within the limits configured in settings.
+
+    This is a module-level function so that it can be shipped to a process
+    pool for CPU-bound parsing.
+
+    Args:
+        pdf_path: Path to the PDF file.
+        settings: Application settings.
+
+    Returns:
+        Tuple of the extracted text and the exhausted stream, which reports
+        how many pages were read and which limit (if any) was reached.
+    """
+    stream = iter_pdf_text_for_settings(pdf_path, settings)
+    text = "".join(stream)
+    return text, stream
+
+
+def extract_text_from_pdf(
+    pdf_path: str,
+    max_pages: int | None = None,
+    max_chars: int | None = None,
+    max_tokens: int | None = None,
+    max_file_bytes: int | None = None,
+) -> str:
     """Extract text content from a PDF file.
 
     Args:
         pdf_path: Path to the PDF file.
+        max_pages: Maximum number of pages to read.
+        max_chars: Maximum number of characters to extract.
+        max_tokens: Maximum number of (estimated) tokens to extract.
+        max_file_bytes: Maximum input file size in bytes.
 
     Returns:
         Extracted text content as a string.
     """
-    reader = PdfReader(pdf_path)
-    text = ""
-    for page in reader.pages:
-        text += page.extract_text()
-    return text
+    return "".join(
+        iter_pdf_text(
+            pdf_path,
+            max_pages=max_pages,
+            max_chars=max_chars,
+            max_tokens=max_tokens,
+            max_file_bytes=max_file_bytes,
+        )
+    )
+
+
+async def adownload_pdf(
+    client: httpx.AsyncClient, paper: PaperRecord, dirpath: str
+) -> str:
+    """Download a paper's PDF without blocking the event loop.
+
+    Args:
+        client: Async HTTP client.
+        paper: Paper record.
+        dirpath: Directory to write the PDF into.
+
+    Returns:
+        Path to the downloaded PDF, named like ``arxiv.Result.download_pdf``.
+    """
+    path = Path(dirpath) / paper.pdf_filename
+    async with client.stream("GET", paper.pdf_url, follow_redirects=True) as response:
+        response.raise_for_status()
+        with path.open("wb") as fh:
+            async for chunk in response.aiter_bytes():
+                fh.write(chunk)
+    return str(path)
 
 
 def get_last_published_datetime(settings: Settings) -> datetime | None:
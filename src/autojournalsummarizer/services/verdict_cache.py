@@ -0,0 +1,116 @@
+"""Persistent cache of LLM filter verdicts."""
+
+import hashlib
+import sqlite3
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS filter_verdicts (
+    arxiv_id TEXT NOT NULL,
+    keywords_hash TEXT NOT NULL,
+    prompt_hash TEXT NOT NULL,
+    model TEXT NOT NULL,
+    interesting INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (arxiv_id, keywords_hash, prompt_hash, model)
+);
+"""
+
+# SQLite's default limit on host parameters is 999
+_BATCH_SIZE = 500
+
+
+def content_hash(text: str) -> str:
+    """Short digest identifying a keywords list or prompt version."""
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+class VerdictCache:
+    """Filter verdicts keyed by paper, keywords, filter prompt and model.
+
+    A verdict is only reused when the keywords, the prompt template and the
+    model are unchanged, so editing any of them re-judges papers.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """Initialize VerdictCache.
+
+        Args:
+            db_path: Path to the SQLite database file.
+        """
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get_many(
+        self, arxiv_ids: list[str], keywords_hash: str, prompt_hash: str, model: str
+    ) -> dict[str, bool]:
+        """Look up cached verdicts.
+
+        Args:
+            arxiv_ids: Versionless arXiv IDs.
+            keywords_hash: Hash of the keywords list.
+            prompt_hash: Hash of the filter prompt template.
+            model: Filter model.
+
+        Returns:
+            Mapping of arXiv ID to verdict for the IDs that are cached.
+        """
+        verdicts: dict[str, bool] = {}
+        with self._connect() as conn:
+            for start in range(0, len(arxiv_ids), _BATCH_SIZE):
+                batch = arxiv_ids[start : start + _BATCH_SIZE]
+                placeholders = ", ".join("?" * len(batch))
+                rows = conn.execute(
+                    "SELECT arxiv_id, interesting FROM filter_verdicts "
+                    f"WHERE arxiv_id IN ({placeholders}) AND keywords_hash = ? "
+                    "AND prompt_hash = ? AND model = ?",
+                    (*batch, keywords_hash, prompt_hash, model),
+                ).fetchall()
+                verdicts.update(
+                    (arxiv_id, bool(interesting)) for arxiv_id, interesting in rows
+                )
+        return verdicts
+
+    def put_many(
+        self,
+        verdicts: dict[str, bool],
+        keywords_hash: str,
+        prompt_hash: str,
+        model: str,
+    ) -> None:
+        """Store verdicts, replacing earlier ones for the same key.
+
+        Args:
+            verdicts: Mapping of versionless arXiv ID to verdict.
+            keywords_hash: Hash of the keywords list.
+            prompt_hash: Hash of the filter prompt template.
+            model: Filter model.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO filter_verdicts (arxiv_id, keywords_hash, "
+                "prompt_hash, model, interesting, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (arxiv_id, keywords_hash, prompt_hash, model, int(verdict), now)
+                    for arxiv_id, verdict in verdicts.items()
+                ],
+            )
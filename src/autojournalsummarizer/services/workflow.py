@@ -1,22 +1,41 @@
 """Workflow orchestration service for paper processing pipeline."""
 
+import asyncio
 import logging
 import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
 from datetime import timedelta
+from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Any
+from typing import Any, TypeVar
 
-import arxiv  # type: ignore
+import requests
 
 from ..config import Settings
 from ..logging_config import log_with_context
+from ..models import PaperRecord, PaperSummary
 from ..services.utils import (
-    extract_text_from_pdf,
+    CHARS_PER_TOKEN,
+    PdfTextStream,
+    extract_pdf_text_for_settings,
     get_last_published_datetime,
     update_log,
 )
+from .cassette import get_cassette
+from .deadline import DeadlineReachedError, RunDeadline, StageTimeoutError
+from .downloads import get_download_manager
 from .factory import ServiceFactory
+from .feed import FeedCheck, FeedWatcher
+from .hedging import get_request_hedger
+from .prefetch import PdfPrefetcher, rank_prefetch_candidates
+from .preprocess import preprocess_text
+from .profiling import get_stage_profiler
+from .search_index import get_search_index
+from .usage import DeferredPapers, get_usage_tracker
+
+T = TypeVar("T")
 
 
 class WorkflowError(Exception):
@@ -37,6 +56,12 @@ class NonRetryableError(WorkflowError):
     pass
 
 
+class BudgetExhaustedError(WorkflowError):
+    """Raised when today's OpenAI budget is used up."""
+
+    pass
+
+
 def retry_on_failure(max_retries: int = 3, delay: float = 1.0) -> Callable:
     """Decorator for retrying operations with exponential backoff.
 
@@ -73,6 +98,47 @@ def retry_on_failure(max_retries: int = 3, delay: float = 1.0) -> Callable:
     return decorator
 
 
+def async_retry_on_failure(max_retries: int = 3, delay: float = 1.0) -> Callable:
+    """Decorator for retrying coroutines with exponential backoff.
+
+    Async counterpart of :func:`retry_on_failure` that waits with
+    ``asyncio.sleep`` so other tasks keep running during the backoff.
+
+    Args:
+        max_retries: Maximum number of retry attempts.
+        delay: Initial delay between retries in seconds.
+    """
+
+    def decorator(
+        func: Callable[..., Awaitable[Any]],
+    ) -> Callable[..., Awaitable[Any]]:
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            last_exception = None
+
+            for attempt in range(max_retries + 1):
+                try:
+                    return await func(*args, **kwargs)
+                except NonRetryableError:
+                    # Don't retry non-retryable errors
+                    raise
+                except Exception as e:
+                    last_exception = e
+                    if attempt == max_retries:
+                        break
+
+                    wait_time = delay * (2**attempt)  # Exponential backoff
+                    await asyncio.sleep(wait_time)
+
+            # All retries exhausted
+            raise RetryableError(
+                f"Failed after {max_retries} retries"
+            ) from last_exception
+
+        return wrapper
+
+    return decorator
+
+
 class WorkflowService:
     """Service for orchestrating the complete paper processing workflow."""
 
@@ -92,13 +158,16 @@ class WorkflowService:
         self.settings = settings
         self.factory = service_factory
         self.logger = logger
+        self._prefetcher: PdfPrefetcher | None = None
+        # Stage budgets apply to every call; runs also set a run deadline
+        self._deadline = RunDeadline(None, settings.stage_timeouts)
 
-    def run_production_workflow(self, num_papers: int, model: str) -> None:
+    def run_production_workflow(self, num_papers: int, model: str | None) -> None:
         """Run the complete production workflow.
 
         Args:
             num_papers: Maximum number of papers to process.
-            model: OpenAI model to use.
+            model: OpenAI model for every stage, or None to route per stage.
         """
         try:
             log_with_context(
@@ -108,17 +177,30 @@ class WorkflowService:
                 num_papers=num_papers,
                 model=model,
             )
+            self._deadline = RunDeadline.from_settings(self.settings)
 
             self._ensure_setup()
+            feed_check = self._check_feed()
+            if self._no_new_announcements(feed_check):
+                self._acknowledge_feed(feed_check)
+                return
             papers = self._retrieve_papers()
 
             if not papers:
                 self._handle_no_papers()
+                # Papers deferred by an earlier run are still due
+                if self._process_interesting_papers([], [], model):
+                    self._acknowledge_feed(feed_check)
                 return
 
+            self._start_prefetch(papers, num_papers)
             interesting_papers = self._filter_papers(papers, num_papers, model)
+            if self._prefetcher is not None:
+                self._prefetcher.retain(interesting_papers)
             self._send_summary_notification(papers, interesting_papers)
-            self._process_interesting_papers(papers, interesting_papers, model)
+            if self._process_interesting_papers(papers, interesting_papers, model):
+                self._acknowledge_feed(feed_check)
+            self._log_usage_report()
 
             log_with_context(
                 self.logger,
@@ -133,13 +215,18 @@ class WorkflowService:
                 self.logger, logging.ERROR, "Production workflow failed", error=str(e)
             )
             raise
+        finally:
+            self._stop_prefetch()
+            self._log_download_stats()
+            self._flush_search_index()
+            self._write_profile_report()
 
-    def run_test_workflow(self, num_papers: int, model: str) -> None:
+    def run_test_workflow(self, num_papers: int, model: str | None) -> None:
         """Run the test workflow (no external notifications/uploads).
 
         Args:
             num_papers: Maximum number of papers to process.
-            model: OpenAI model to use.
+            model: OpenAI model for every stage, or None to route per stage.
         """
         try:
             log_with_context(
@@ -149,6 +236,7 @@ class WorkflowService:
                 num_papers=num_papers,
                 model=model,
             )
+            self._deadline = RunDeadline.from_settings(self.settings)
 
             self._ensure_setup()
             papers = self._retrieve_papers()
@@ -162,6 +250,7 @@ class WorkflowService:
             # Process only the first interesting paper in test mode
             if interesting_papers:
                 self._process_single_paper_for_test(interesting_papers[0], model)
+            self._log_usage_report()
 
             log_with_context(
                 self.logger,
@@ -176,6 +265,9 @@ class WorkflowService:
                 self.logger, logging.ERROR, "Test workflow failed", error=str(e)
             )
             raise
+        finally:
+            self._flush_search_index()
+            self._write_profile_report()
 
     def _ensure_setup(self) -> None:
         """Ensure directories and files are properly set up."""
@@ -186,8 +278,58 @@ class WorkflowService:
         except Exception as e:
             raise NonRetryableError(f"Setup failed: {e}") from e
 
+    def _check_feed(self) -> FeedCheck | None:
+        """Poll the announcement feed before the arXiv API query.
+
+        Returns:
+            The feed check, or None if the precheck is disabled or cannot
+            rule out new papers (first run, cassette, unreachable feed).
+        """
+        if not self.settings.arxiv_feed_precheck:
+            return None
+        if get_cassette(self.settings) is not None:
+            return None
+        last_date_file = self.settings.last_date_file
+        if not last_date_file.exists() or not last_date_file.read_text().strip():
+            return None
+
+        try:
+            feed_check = FeedWatcher(self.settings).check()
+        except requests.RequestException as e:
+            log_with_context(
+                self.logger, logging.WARNING, "Feed precheck failed", error=str(e)
+            )
+            return None
+
+        log_with_context(
+            self.logger,
+            logging.INFO,
+            "Feed checked",
+            changed=feed_check.changed,
+            new_ids=len(feed_check.new_ids),
+        )
+        return feed_check
+
+    def _no_new_announcements(self, feed_check: FeedCheck | None) -> bool:
+        """Whether the run can stop: nothing announced and nothing deferred."""
+        if feed_check is None or feed_check.new_ids:
+            return False
+        if self._has_deferred_papers():
+            return False
+        self.logger.info("No new announcements; skipping the arXiv query")
+        return True
+
+    def _has_deferred_papers(self) -> bool:
+        """Whether earlier runs left papers for this one."""
+        return bool(DeferredPapers(self.settings.deferred_papers_file).load())
+
+    def _acknowledge_feed(self, feed_check: FeedCheck | None) -> None:
+        """Mark the polled feed as processed after a successful run."""
+        if feed_check is not None:
+            FeedWatcher(self.settings).acknowledge(feed_check)
+
     @retry_on_failure(max_retries=3, delay=2.0)
-    def _retrieve_papers(self) -> list[arxiv.Result]:
+    def _retrieve_papers(self) -> list[PaperRecord]:
         """Retrieve recent papers from arXiv with retry logic."""
         try:
             arxiv_service = self.factory.get_arxiv_service()
@@ -197,7 +339,9 @@ class WorkflowService:
             if last_published is not None:
                 start_datetime = last_published + timedelta(minutes=1)
 
-            papers = arxiv_service.retrieve_recent_papers(start_datetime=start_datetime)
+            papers = self._run_stage(
+                "retrieve", arxiv_service.retrieve_recent_papers, start_datetime
+            )
 
             log_with_context(
                 self.logger,
@@ -218,17 +362,23 @@ class WorkflowService:
         """Handle the case when no new papers are found."""
         self.logger.info("No new papers found")
         discord_service = self.factory.get_discord_service()
-        discord_service.send_message("本日の新着論文はありません。")
+        self._run_stage(
+            "discord", discord_service.send_message, "本日の新着論文はありません。"
+        )
 
     @retry_on_failure(max_retries=2, delay=1.0)
     def _filter_papers(
-        self, papers: list[arxiv.Result], num_papers: int, model: str
-    ) -> list[arxiv.Result]:
+        self, papers: list[PaperRecord], num_papers: int, model: str | None
+    ) -> list[PaperRecord]:
         """Filter papers based on keywords using OpenAI."""
         try:
             openai_service = self.factory.get_openai_service()
-            interesting_papers = openai_service.filter_interesting_papers(
-                papers, num_papers, model
+            interesting_papers = self._run_stage(
+                "filter",
+                openai_service.filter_interesting_papers,
+                papers,
+                num_papers,
+                model,
             )
 
             log_with_context(
@@ -247,8 +397,47 @@ class WorkflowService:
             )
             raise RetryableError(f"Paper filtering failed: {e}") from e
 
+    def _start_prefetch(self, papers: list[PaperRecord], num_papers: int) -> None:
+        """Start downloading the likeliest candidates while the filter runs."""
+        limit = min(self.settings.pdf_prefetch_papers, num_papers)
+        cassette = get_cassette(self.settings)
+        if (
+            limit <= 0
+            or not self.settings.keywords_file.exists()
+            or (cassette is not None and cassette.replaying)
+        ):
+            return
+
+        keywords = self.settings.keywords_file.read_text().splitlines()
+        candidates = rank_prefetch_candidates(papers, keywords, limit)
+        if not candidates:
+            return
+
+        self._prefetcher = PdfPrefetcher(get_download_manager(self.settings))
+        self._prefetcher.start(candidates)
+        log_with_context(
+            self.logger,
+            logging.INFO,
+            "PDF prefetch started",
+            candidates=[paper.short_id for paper in candidates],
+        )
+
+    def _stop_prefetch(self) -> None:
+        """Discard unused prefetches and log the hit rate."""
+        if self._prefetcher is None:
+            return
+        stats = self._prefetcher.close()
+        self._prefetcher = None
+        log_with_context(self.logger, logging.INFO, "PDF prefetch finished", **stats)
+
+    def _log_download_stats(self) -> None:
+        """Log bytes transferred and throughput of the run's PDF downloads."""
+        stats = get_download_manager(self.settings).stats()
+        if stats["downloads"] or stats["failures"]:
+            log_with_context(self.logger, logging.INFO, "PDF downloads", **stats)
+
     def _send_summary_notification(
-        self, papers: list[arxiv.Result], interesting_papers: list[arxiv.Result]
+        self, papers: list[PaperRecord], interesting_papers: list[PaperRecord]
     ) -> None:
         """Send summary notification to Discord."""
         try:
@@ -257,7 +446,7 @@ class WorkflowService:
                 f"新着論文：{len(papers)}本\n"
                 f"関心度の高い論文：{len(interesting_papers)}本"
             )
-            discord_service.send_message(message)
+            self._run_stage("discord", discord_service.send_message, message)
 
             self.logger.info("Summary notification sent successfully")
 
@@ -272,59 +461,208 @@ class WorkflowService:
 
     def _process_interesting_papers(
         self,
-        all_papers: list[arxiv.Result],
-        interesting_papers: list[arxiv.Result],
-        model: str,
+        all_papers: list[PaperRecord],
+        interesting_papers: list[PaperRecord],
+        model: str | None,
+    ) -> bool:
+        """Process all interesting papers, including those deferred earlier.
+
+        Once the run deadline gets close, no new paper is started: deferred
+        papers go back to the backlog, and the watermark stays before the
+        first paper that was not reached, so the next run picks it up again.
+        A paper cut short by the deadline counts as not reached.
+
+        Returns:
+            False if the deadline stopped the run before every new paper was
+            reached; the feed must then not be acknowledged.
+        """
+        backlog, selected_ids = self._plan_budget(interesting_papers, model)
+
+        for paper in backlog:
+            if not self._process_selected_paper(paper, model):
+                self._defer_paper(paper, "Run deadline close")
+
+        for position, paper in enumerate(all_papers):
+            if paper.short_id in selected_ids and not self._process_selected_paper(
+                paper, model
+            ):
+                self._log_deadline_stop(len(all_papers) - position)
+                return False
+
+            update_log(self.settings, paper.published)
+        return True
+
+    def _log_deadline_stop(self, remaining_papers: int) -> None:
+        """Log that the rest of the papers are left for the next run."""
+        log_with_context(
+            self.logger,
+            logging.WARNING,
+            "Run deadline close, remaining papers left for the next run",
+            remaining_papers=remaining_papers,
+            remaining_s=round(self._deadline.remaining() or 0.0, 1),
+        )
+
+    def _process_selected_paper(self, paper: PaperRecord, model: str | None) -> bool:
+        """Process a paper, deferring it if today's budget is used up.
+
+        Returns:
+            False if the run deadline did not leave time to start the paper
+            or cut it short; the caller leaves it for the next run.
+        """
+        if not self._deadline.allows_new_paper():
+            return False
+        if self._budget_exhausted():
+            self._defer_paper(paper)
+            return True
+
+        started = time.monotonic()
+        try:
+            self._process_single_paper(paper, model)
+        except DeadlineReachedError:
+            return False
+        except Exception as e:
+            log_with_context(
+                self.logger,
+                logging.ERROR,
+                "Failed to process paper",
+                paper_title=paper.title,
+                error=str(e),
+            )
+            # Continue with next paper rather than failing entire workflow
+        self._deadline.record_paper(time.monotonic() - started)
+        return True
+
+    def _plan_budget(
+        self, interesting_papers: list[PaperRecord], model: str | None
+    ) -> tuple[list[PaperRecord], set[str]]:
+        """Decide which papers fit today's OpenAI budget.
+
+        Papers deferred by earlier runs come first, followed by the new
+        interesting papers in the order the filter returned them. Papers are
+        admitted while the estimated summarization cost (the recent average
+        for the model) fits the remaining budget; the rest are deferred to
+        the next run.
+
+        Returns:
+            Deferred papers to process now, and the short IDs of every paper
+            to process in this run.
+        """
+        store = DeferredPapers(self.settings.deferred_papers_file)
+        backlog = store.load()
+        candidates = list(
+            {p.short_id: p for p in backlog + interesting_papers}.values()
+        )
+
+        budget = self.settings.daily_budget_usd
+        selected, deferred = candidates, []
+        if budget is not None:
+            tracker = get_usage_tracker(self.settings)
+            remaining = budget - tracker.spent_today()
+            estimate = tracker.average_cost("summarize", model)
+            selected = []
+            for paper in candidates:
+                if remaining > 0 and estimate <= remaining:
+                    selected.append(paper)
+                    remaining -= estimate
+                else:
+                    deferred.append(paper)
+
+            log_with_context(
+                self.logger,
+                logging.INFO,
+                "Budget plan",
+                budget_usd=budget,
+                spent_today_usd=round(tracker.spent_today(), 4),
+                estimated_paper_cost_usd=round(estimate, 4),
+                selected=len(selected),
+                deferred=len(deferred),
+            )
+
+        store.save(deferred)
+        selected_ids = {p.short_id for p in selected}
+        return [p for p in backlog if p.short_id in selected_ids], selected_ids
+
+    def _budget_exhausted(self) -> bool:
+        """Whether today's OpenAI spending has reached the daily budget."""
+        budget = self.settings.daily_budget_usd
+        if budget is None:
+            return False
+        return get_usage_tracker(self.settings).spent_today() >= budget
+
+    def _check_budget(self) -> None:
+        """Stop a run whose work cannot be deferred once the budget is used up.
+
+        Raises:
+            BudgetExhaustedError: If today's OpenAI budget is used up.
+        """
+        if self._budget_exhausted():
+            raise BudgetExhaustedError(
+                f"Daily budget of {self.settings.daily_budget_usd} USD exhausted"
+            )
+
+    def _defer_paper(
+        self, paper: PaperRecord, reason: str = "Daily budget exhausted"
     ) -> None:
-        """Process all interesting papers."""
-        interesting_titles = {p.title for p in interesting_papers}
+        """Postpone a paper to the next run."""
+        DeferredPapers(self.settings.deferred_papers_file).add(paper)
+        log_with_context(
+            self.logger,
+            logging.WARNING,
+            f"{reason}, paper deferred to next run",
+            paper_title=paper.title,
+        )
+
+    def _log_usage_report(self) -> None:
+        """Log token usage of the run per stage and model, and per paper."""
+        tracker = get_usage_tracker(self.settings)
+        for row in tracker.run_summary():
+            log_with_context(
+                self.logger, logging.INFO, "OpenAI usage", run_id=tracker.run_id, **row
+            )
 
-        for paper in all_papers:
-            if paper.title not in interesting_titles:
-                update_log(self.settings, paper.published)
-                continue
+        hedger = get_request_hedger(self.settings)
+        if hedger is not None and hedger.stats()["hedged"]:
+            log_with_context(
+                self.logger, logging.INFO, "Hedged OpenAI requests", **hedger.stats()
+            )
 
-            try:
-                self._process_single_paper(paper, model)
-            except Exception as e:
-                log_with_context(
-                    self.logger,
-                    logging.ERROR,
-                    "Failed to process paper",
-                    paper_title=paper.title,
-                    error=str(e),
-                )
-                # Continue with next paper rather than failing entire workflow
-                update_log(self.settings, paper.published)
+        for row in tracker.paper_report():
+            log_with_context(
+                self.logger,
+                logging.INFO,
+                "OpenAI usage per paper",
+                run_id=tracker.run_id,
+                **row,
+            )
+
+    def _process_single_paper(self, paper: PaperRecord, model: str | None) -> None:
+        """Process a single paper through the complete pipeline.
 
-    def _process_single_paper(self, paper: arxiv.Result, model: str) -> None:
-        """Process a single paper through the complete pipeline."""
+        The PDF is downloaded first. After that the summary branch (text
+        extraction, summarization, Discord post) runs alongside the Google
+        Drive upload and the Zotero registration, which only need the PDF.
+        A failing branch does not stop the others.
+        """
         with TemporaryDirectory() as dirpath:
             try:
-                # Download and extract text
-                pdf_path = paper.download_pdf(dirpath=dirpath)
-                text = extract_text_from_pdf(pdf_path)
+                pdf_path = self._download_pdf(paper, dirpath)
 
-                # Generate summary
-                openai_service = self.factory.get_openai_service()
-                summary = openai_service.summarize_paper(paper.title, text, model)
-
-                # Create and send message
-                discord_service = self.factory.get_discord_service()
-                message = discord_service.make_paper_message(
-                    paper=paper, summary=summary
-                )
-                discord_service.send_message(message)
-
-                # Upload to external services
                 gdrive_service = self.factory.get_gdrive_service()
-                gdrive_service.upload_pdf(pdf_path)
-
                 zotero_service = self.factory.get_zotero_service()
-                zotero_service.register_paper(paper, pdf_path)
-
-                # Update log
-                update_log(self.settings, paper.published)
+                self._run_paper_branches(
+                    paper,
+                    {
+                        "summary": lambda: self._summarize_and_notify(
+                            paper, pdf_path, model
+                        ),
+                        "gdrive": lambda: self._run_stage(
+                            "gdrive", gdrive_service.upload_pdf, pdf_path
+                        ),
+                        "zotero": lambda: self._run_stage(
+                            "zotero", zotero_service.register_paper, paper, pdf_path
+                        ),
+                    },
+                )
 
                 log_with_context(
                     self.logger,
@@ -343,17 +681,350 @@ class WorkflowService:
                 )
                 raise
 
-    def _process_single_paper_for_test(self, paper: arxiv.Result, model: str) -> None:
+    def _summarize_and_notify(
+        self, paper: PaperRecord, pdf_path: str, model: str | None
+    ) -> None:
+        """Summary branch: extract text, summarize and post to Discord."""
+        text = self._extract_text(paper, pdf_path)
+
+        openai_service = self.factory.get_openai_service()
+        summary = self._run_stage(
+            "summarize", openai_service.summarize_paper, paper.title, text, model
+        )
+        self._index_paper(paper, text, summary)
+
+        discord_service = self.factory.get_discord_service()
+        message = discord_service.make_paper_message(paper=paper, summary=summary)
+        self._run_stage("discord", discord_service.send_message, message)
+
+    def _index_paper(
+        self, paper: PaperRecord, text: str, summary: PaperSummary | None
+    ) -> None:
+        """Queue a processed paper for the full-text search index."""
+        index = get_search_index(self.settings)
+        if index is None:
+            return
+        try:
+            index.add(paper, text, summary)
+        except Exception as e:
+            log_with_context(
+                self.logger,
+                logging.WARNING,
+                "Failed to index paper",
+                paper_title=paper.title,
+                error=str(e),
+            )
+
+    def _flush_search_index(self) -> None:
+        """Write papers still queued for the search index."""
+        index = get_search_index(self.settings)
+        if index is None:
+            return
+        try:
+            indexed = index.flush()
+        except Exception as e:
+            log_with_context(
+                self.logger,
+                logging.WARNING,
+                "Failed to update search index",
+                error=str(e),
+            )
+            return
+        if indexed:
+            log_with_context(
+                self.logger, logging.INFO, "Search index updated", papers=indexed
+            )
+
+    def _run_stage(self, name: str, func: Callable[..., T], *args: Any) -> T:
+        """Call func as the named stage within its time budget.
+
+        The call is profiled if profiling is enabled.
+
+        Raises:
+            StageTimeoutError: If the stage runs over its budget or the run
+                deadline.
+        """
+
+        def profiled() -> T:
+            with self._profile_stage(name):
+                return func(*args)
+
+        return self._deadline.call(name, profiled)
+
+    def _profile_stage(self, name: str) -> AbstractContextManager[None]:
+        """Context profiling the enclosed stage when profiling is enabled."""
+        profiler = get_stage_profiler(self.settings)
+        if profiler is None:
+            return nullcontext()
+        return profiler.stage(name)
+
+    def _write_profile_report(self) -> None:
+        """Write the stage profiles of the run, if profiling is enabled."""
+        profiler = get_stage_profiler(self.settings)
+        if profiler is None:
+            return
+        try:
+            directory = profiler.write_report()
+        except Exception as e:
+            log_with_context(
+                self.logger,
+                logging.WARNING,
+                "Failed to write stage profiles",
+                error=str(e),
+            )
+            return
+        log_with_context(
+            self.logger,
+            logging.INFO,
+            "Stage profiles written",
+            directory=str(directory),
+        )
+
+    def _run_paper_branches(
+        self, paper: PaperRecord, branches: dict[str, Callable[[], Any]]
+    ) -> None:
+        """Run independent stages of a paper in parallel threads.
+
+        Args:
+            paper: Paper the branches belong to.
+            branches: Branch name to a callable running the branch.
+
+        Raises:
+            WorkflowError: If any branch failed, after all branches finished.
+        """
+
+        def timed(branch: Callable[[], Any]) -> float:
+            start = time.perf_counter()
+            branch()
+            return time.perf_counter() - start
+
+        with ThreadPoolExecutor(
+            max_workers=len(branches), thread_name_prefix="paper-branch"
+        ) as executor:
+            futures = {
+                name: executor.submit(timed, branch)
+                for name, branch in branches.items()
+            }
+
+        outcomes: dict[str, float | BaseException] = {}
+        for name, future in futures.items():
+            error = future.exception()
+            outcomes[name] = error if error is not None else future.result()
+        self._check_paper_branches(paper, outcomes)
+
+    def _check_paper_branches(
+        self, paper: PaperRecord, outcomes: dict[str, float | BaseException]
+    ) -> None:
+        """Log branch durations and failures, raising if any branch failed.
+
+        Args:
+            paper: Paper the branches belong to.
+            outcomes: Branch name to its duration in seconds or its exception.
+
+        Raises:
+            WorkflowError: If any branch failed.
+        """
+        failures: dict[str, BaseException] = {}
+        durations: dict[str, float] = {}
+        for name, outcome in outcomes.items():
+            if isinstance(outcome, BaseException):
+                failures[name] = outcome
+                log_with_context(
+                    self.logger,
+                    logging.WARNING,
+                    "Paper branch failed",
+                    paper_title=paper.title,
+                    branch=name,
+                    error=str(outcome),
+                )
+            else:
+                durations[f"{name}_s"] = round(outcome, 2)
+
+        log_with_context(
+            self.logger,
+            logging.INFO,
+            "Paper branches finished",
+            paper_title=paper.title,
+            failed=sorted(failures),
+            **durations,
+        )
+
+        cut = sorted(
+            name
+            for name, error in failures.items()
+            if isinstance(error, DeadlineReachedError)
+        )
+        if cut:
+            # Left for the next run like a paper that was not started
+            raise DeadlineReachedError(
+                f"Run deadline reached in branches: {', '.join(cut)}"
+            ) from failures[cut[0]]
+        if failures:
+            raise WorkflowError(
+                f"Branches failed: {', '.join(sorted(failures))}"
+            ) from next(iter(failures.values()))
+
+    def _download_pdf(self, paper: PaperRecord, dirpath: str) -> str:
+        """Download a paper's PDF, via the cassette or prefetcher if enabled."""
+        replayed = self._replay_pdf(paper, dirpath)
+        if replayed is not None:
+            return replayed
+
+        if self._prefetcher is not None:
+            prefetched = self._prefetcher.take(paper, dirpath)
+            if prefetched is not None:
+                self._record_pdf(paper, prefetched)
+                return prefetched
+
+        pdf_path = self._run_stage(
+            "download", get_download_manager(self.settings).download_pdf, paper, dirpath
+        )
+        self._record_pdf(paper, pdf_path)
+        return pdf_path
+
+    def _replay_pdf(self, paper: PaperRecord, dirpath: str) -> str | None:
+        """Write a recorded PDF into dirpath when replaying a cassette."""
+        cassette = get_cassette(self.settings)
+        if cassette is None or not cassette.replaying:
+            return None
+
+        path = Path(dirpath) / paper.pdf_filename
+        path.write_bytes(cassette.lookup_blob("pdf", paper.short_id))
+        return str(path)
+
+    def _record_pdf(self, paper: PaperRecord, pdf_path: str) -> None:
+        """Store a downloaded PDF when recording a cassette."""
+        cassette = get_cassette(self.settings)
+        if cassette is not None and cassette.recording:
+            cassette.record_blob("pdf", paper.short_id, Path(pdf_path).read_bytes())
+
+    def _extract_text(self, paper: PaperRecord, pdf_path: str) -> str:
+        """Extract paper text, preferring the configured arXiv source.
+
+        LaTeX/HTML sources are tried first when enabled; the PDF is parsed only
+        when the source is unavailable, fails or runs over its time budget.
+        """
+        if self.settings.text_source != "pdf":
+            try:
+                text = self._run_stage("source_text", self._extract_source_text, paper)
+            except DeadlineReachedError:
+                raise
+            except StageTimeoutError as e:
+                self._log_source_timeout(paper, e)
+                text = None
+            if text:
+                return self._preprocess_text(paper, text)
+
+        with self._profile_stage("extract"):
+            text, stream = extract_pdf_text_for_settings(pdf_path, self.settings)
+        self._log_pdf_truncation(paper, stream)
+        return self._preprocess_text(paper, text)
+
+    def _preprocess_text(self, paper: PaperRecord, text: str) -> str:
+        """Strip references, boilerplate and layout noise before summarizing."""
+        steps = self.settings.text_preprocessors
+        if not steps or not text:
+            return text
+
+        with self._profile_stage("preprocess"):
+            cleaned, removed = preprocess_text(text, steps)
+
+        tokens_before = len(text) // CHARS_PER_TOKEN
+        tokens_after = len(cleaned) // CHARS_PER_TOKEN
+        log_with_context(
+            self.logger,
+            logging.INFO,
+            "Paper text preprocessed",
+            paper_title=paper.title,
+            tokens_before=tokens_before,
+            tokens_after=tokens_after,
+            reduction_pct=round(100 * (1 - tokens_after / max(tokens_before, 1)), 1),
+            removed_tokens=removed,
+        )
+        return cleaned
+
+    def _log_source_timeout(self, paper: PaperRecord, error: StageTimeoutError) -> None:
+        """Log that the arXiv source timed out and the PDF is used instead."""
+        log_with_context(
+            self.logger,
+            logging.WARNING,
+            "arXiv source timed out, falling back to PDF",
+            paper_title=paper.title,
+            error=str(error),
+        )
+
+    def _extract_source_text(self, paper: PaperRecord) -> str | None:
+        """Fetch paper text from the configured arXiv source, if available."""
+        try:
+            source_service = self.factory.get_source_service()
+            text = source_service.fetch_text(paper)
+        except Exception as e:
+            log_with_context(
+                self.logger,
+                logging.WARNING,
+                "Failed to extract text from arXiv source, falling back to PDF",
+                paper_title=paper.title,
+                error=str(e),
+            )
+            return None
+
+        if not text:
+            self.logger.info("arXiv source unavailable, falling back to PDF")
+            return None
+
+        max_chars = source_service.max_chars
+        if max_chars is not None and len(text) >= max_chars:
+            log_with_context(
+                self.logger,
+                logging.WARNING,
+                "arXiv source text truncated",
+                paper_title=paper.title,
+                chars=len(text),
+            )
+
+        log_with_context(
+            self.logger,
+            logging.INFO,
+            "Paper text extracted from arXiv source",
+            paper_title=paper.title,
+            source=self.settings.text_source,
+            chars=len(text),
+        )
+        return text
+
+    def _log_pdf_truncation(self, paper: PaperRecord, stream: PdfTextStream) -> None:
+        """Log a warning if PDF extraction stopped at a configured limit."""
+        if stream.limit_reached is not None:
+            log_with_context(
+                self.logger,
+                logging.WARNING,
+                "PDF text extraction truncated",
+                paper_title=paper.title,
+                limit=stream.limit_reached,
+                pages_read=stream.pages_read,
+                total_pages=stream.total_pages,
+                chars=stream.chars_read,
+            )
+
+    def _process_single_paper_for_test(
+        self, paper: PaperRecord, model: str | None
+    ) -> None:
         """Process a single paper for testing (no external uploads)."""
         with TemporaryDirectory() as dirpath:
             try:
                 # Download and extract text
-                pdf_path = paper.download_pdf(dirpath=dirpath)
-                text = extract_text_from_pdf(pdf_path)
+                pdf_path = self._download_pdf(paper, dirpath)
+                text = self._extract_text(paper, pdf_path)
 
                 # Generate summary
                 openai_service = self.factory.get_openai_service()
-                summary = openai_service.summarize_paper(paper.title, text, model)
+                summary = self._run_stage(
+                    "summarize",
+                    openai_service.summarize_paper,
+                    paper.title,
+                    text,
+                    model,
+                )
 
                 # Create message (but don't send)
                 discord_service = self.factory.get_discord_service()
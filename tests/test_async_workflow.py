@@ -0,0 +1,155 @@
+"""Tests for the asynchronous workflow"""
+
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from autojournalsummarizer.config import Settings
+from autojournalsummarizer.models import PaperRecord
+from autojournalsummarizer.services import async_workflow as async_workflow_module
+from autojournalsummarizer.services.async_workflow import (
+    AsyncWorkflowService,
+    WatermarkTracker,
+)
+from autojournalsummarizer.services.deadline import RunDeadline
+
+
+def _papers(count: int) -> list[PaperRecord]:
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [
+        PaperRecord(
+            short_id=f"2401.0000{i}v1",
+            title=f"Paper {i}",
+            published=start + timedelta(hours=i),
+            authors=("A. Author",),
+            pdf_url=f"http://arxiv.org/pdf/2401.0000{i}v1",
+        )
+        for i in range(count)
+    ]
+
+
+def test_watermark_waits_for_earlier_papers():
+    papers = _papers(3)
+    tracker = WatermarkTracker(papers)
+
+    assert tracker.mark_done(1) is None
+    assert tracker.mark_done(2) is None
+    assert tracker.mark_done(0) == papers[2].published
+
+
+class ConcurrencyProbe:
+    """Records the peak number of concurrent calls per destination"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+
+    def enter(self, name: str) -> None:
+        with self._lock:
+            self.active[name] = self.active.get(name, 0) + 1
+            self.peak[name] = max(self.peak.get(name, 0), self.active[name])
+
+    def leave(self, name: str) -> None:
+        with self._lock:
+            self.active[name] -= 1
+
+    async def acall(self, name: str, seconds: float) -> str:
+        self.enter(name)
+        await asyncio.sleep(seconds)
+        self.leave(name)
+        return name
+
+    def call(self, name: str) -> None:
+        self.enter(name)
+        time.sleep(0.02)
+        self.leave(name)
+
+
+class FakeAsyncFactory:
+    def __init__(self, probe: ConcurrencyProbe, slow_title: str) -> None:
+        self.probe = probe
+        self.slow_title = slow_title
+
+    def get_openai_service(self) -> SimpleNamespace:
+        def asummarize_paper(client, title, text, model):
+            seconds = 0.3 if title == self.slow_title else 0.02
+            return self.probe.acall("openai", seconds)
+
+        return SimpleNamespace(asummarize_paper=asummarize_paper)
+
+    def get_discord_service(self) -> SimpleNamespace:
+        return SimpleNamespace(
+            make_paper_message=lambda paper, summary: "message",
+            asend_message=lambda http, message: self.probe.acall("discord", 0.01),
+        )
+
+    def get_gdrive_service(self) -> SimpleNamespace:
+        return SimpleNamespace(upload_pdf=lambda path: self.probe.call("gdrive"))
+
+    def get_zotero_service(self) -> SimpleNamespace:
+        return SimpleNamespace(
+            register_paper=lambda paper, path: self.probe.call("zotero")
+        )
+
+
+def test_engine_respects_limits_and_advances_the_watermark(tmp_path, monkeypatch):
+    settings = Settings(
+        base_dir=tmp_path,
+        search_index=False,
+        async_max_papers_in_flight=4,
+        async_openai_concurrency=2,
+        async_discord_concurrency=1,
+        async_upload_concurrency=1,
+    )
+    settings.ensure_directories()
+    papers = _papers(6)
+    probe = ConcurrencyProbe()
+    workflow = AsyncWorkflowService(
+        settings,
+        FakeAsyncFactory(probe, slow_title=papers[0].title),  # type: ignore[arg-type]
+        logging.getLogger("test"),
+    )
+    workflow._deadline = RunDeadline(None)
+    workflow._http = None  # type: ignore[assignment]
+    workflow._openai = None  # type: ignore[assignment]
+
+    async def download(paper, dirpath):
+        return await probe.acall("arxiv", 0.01)
+
+    async def extract(paper, path):
+        return "text"
+
+    monkeypatch.setattr(workflow, "_adownload_pdf", download)
+    monkeypatch.setattr(workflow, "_aextract_text", extract)
+    watermarks = []
+    monkeypatch.setattr(
+        async_workflow_module,
+        "update_log",
+        lambda settings, published: watermarks.append(published),
+    )
+    # Paper 3 was not selected and is passed without processing
+    selected = [paper for paper in papers if paper is not papers[3]]
+
+    async def run() -> bool:
+        workflow._semaphores = {
+            "papers": asyncio.Semaphore(settings.async_max_papers_in_flight),
+            "arxiv": asyncio.Semaphore(settings.async_download_concurrency),
+            "openai": asyncio.Semaphore(settings.async_openai_concurrency),
+            "discord": asyncio.Semaphore(settings.async_discord_concurrency),
+            "gdrive": asyncio.Semaphore(settings.async_upload_concurrency),
+            "zotero": asyncio.Semaphore(settings.async_upload_concurrency),
+        }
+        return await workflow._aprocess_interesting_papers(papers, selected, None)
+
+    assert asyncio.run(run()) is True
+
+    assert probe.peak["openai"] == 2
+    assert probe.peak["discord"] == 1
+    assert probe.peak["gdrive"] == 1
+    assert probe.peak["zotero"] == 1
+    # The slow first paper holds the watermark until every paper is done
+    assert watermarks == [papers[-1].published]
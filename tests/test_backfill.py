@@ -0,0 +1,106 @@
+"""Tests for historical backfill"""
+
+import logging
+import time
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from autojournalsummarizer.config import Settings
+from autojournalsummarizer.services.backfill import (
+    BackfillCheckpoint,
+    BackfillService,
+    split_windows,
+)
+from autojournalsummarizer.services.workflow import BudgetExhaustedError
+
+from .test_workflow import PAPER
+
+
+def test_split_windows_covers_range_with_short_last_window():
+    windows = split_windows(date(2024, 1, 1), date(2024, 1, 5), window_days=2)
+
+    assert windows[0][0] == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert windows[-1][1] == datetime(2024, 1, 6, tzinfo=timezone.utc)
+    assert [(end - start).days for start, end in windows] == [2, 2, 1]
+
+
+def test_split_windows_rejects_reversed_range():
+    with pytest.raises(ValueError):
+        split_windows(date(2024, 1, 5), date(2024, 1, 1), window_days=1)
+
+
+def test_checkpoint_round_trips(tmp_path):
+    path = tmp_path / "backfill" / "q1.json"
+    checkpoint = BackfillCheckpoint(path)
+    checkpoint.mark_paper("2401.00001v1")
+    checkpoint.mark_window("w1")
+
+    restored = BackfillCheckpoint(path)
+
+    assert restored.processed_ids == {"2401.00001v1"}
+    assert restored.completed_windows == {"w1"}
+
+
+def test_exhausted_budget_leaves_the_window_unfinished(tmp_path):
+    settings = Settings(base_dir=tmp_path, daily_budget_usd=0.0)
+    settings.ensure_directories()
+    service = BackfillService(settings, None, logging.getLogger("test"), "q1")  # type: ignore[arg-type]
+
+    # Raised before the (paid) filtering, so the window is retried on resume
+    with pytest.raises(BudgetExhaustedError):
+        service._process_window([PAPER], 5, None)
+
+    assert service.checkpoint.processed_ids == set()
+
+
+def _backfill(tmp_path, harvested, **overrides) -> BackfillService:
+    settings = Settings(base_dir=tmp_path, backfill_harvest_concurrency=1, **overrides)
+    settings.ensure_directories()
+
+    def harvest(start, end):
+        harvested.append(start)
+        time.sleep(0.05)
+        return [PAPER]
+
+    factory = SimpleNamespace(
+        get_arxiv_service=lambda: SimpleNamespace(retrieve_papers_in_window=harvest)
+    )
+    service = BackfillService(settings, factory, logging.getLogger("test"), "q1")  # type: ignore[arg-type]
+    service._ensure_setup = lambda: None  # type: ignore[method-assign]
+    service._filter_papers = lambda papers, n, model: papers  # type: ignore[method-assign]
+    return service
+
+
+def test_exhausted_budget_stops_the_backfill(tmp_path):
+    harvested: list[datetime] = []
+    service = _backfill(tmp_path, harvested, daily_budget_usd=0.0)
+
+    service.run_backfill(date(2024, 1, 1), date(2024, 1, 10), 5, None)
+
+    # The queued windows are cancelled instead of failing one by one
+    assert len(harvested) < 10
+    assert service.checkpoint.completed_windows == set()
+
+
+def test_failed_papers_are_retried_on_resume(tmp_path):
+    harvested: list[datetime] = []
+    service = _backfill(tmp_path, harvested)
+    attempts = []
+
+    def process(paper, model):
+        attempts.append(paper.short_id)
+        if len(attempts) == 1:
+            raise RuntimeError("summarize is down")
+
+    service._process_single_paper = process  # type: ignore[method-assign]
+
+    service.run_backfill(date(2024, 1, 1), date(2024, 1, 1), 5, None)
+    assert service.checkpoint.processed_ids == set()
+    assert service.checkpoint.completed_windows == set()
+
+    service.run_backfill(date(2024, 1, 1), date(2024, 1, 1), 5, None)
+    assert attempts == [PAPER.short_id, PAPER.short_id]
+    assert service.checkpoint.processed_ids == {PAPER.short_id}
+    assert len(service.checkpoint.completed_windows) == 1
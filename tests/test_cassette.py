@@ -0,0 +1,52 @@
+"""Tests for the record/replay cassette"""
+
+import pytest
+
+from autojournalsummarizer.config import Settings
+from autojournalsummarizer.models import Paper, Papers
+from autojournalsummarizer.services.cassette import (
+    Cassette,
+    CassetteMissError,
+    interaction_key,
+)
+from autojournalsummarizer.services.openai_service import OpenAIService
+
+
+def test_replay_serves_recorded_interactions(tmp_path):
+    recorder = Cassette(tmp_path, "record")
+    recorder.record("openai", "a", {"n": 1})
+    recorder.record("openai", "b", {"n": 2})
+    recorder.record_blob("pdf", "2401.00001", b"%PDF-1.4")
+    recorder.record("arxiv", "2024-01-01", "feed 1")
+    recorder.record("arxiv", "2024-01-02", "feed 2")
+    # Interactions are written once, not on every record
+    assert not (tmp_path / "interactions.json.gz").exists()
+    recorder.flush()
+
+    player = Cassette(tmp_path, "replay")
+    assert player.lookup("openai", "b") == {"n": 2}
+    # A changed request is a miss, not served another recorded output
+    with pytest.raises(CassetteMissError):
+        player.lookup("openai", "changed")
+    assert player.lookup("openai", "a") == {"n": 1}
+    assert player.lookup_blob("pdf", "2401.00001") == b"%PDF-1.4"
+    # Dated arXiv queries fall back to the recorded order
+    assert player.lookup("arxiv", "2024-02-01") == "feed 1"
+    assert player.lookup("arxiv", "2024-01-02") == "feed 2"
+    with pytest.raises(CassetteMissError):
+        player.lookup("arxiv", "2024-01-01")
+
+
+def test_openai_outputs_replay_without_api_key(tmp_path):
+    parsed = Papers(papers=[Paper(idx=0, title="T", reason="R")])
+    recorder = Cassette(tmp_path / "data" / "cassettes" / "run", "record")
+    recorder.record("openai", interaction_key("m", "p"), parsed.model_dump())
+    recorder.flush()
+
+    settings = Settings(
+        base_dir=tmp_path,
+        openai_api_key=None,
+        cassette_mode="replay",
+        cassette_name="run",
+    )
+    assert OpenAIService(settings)._parse("filter", "m", "p", Papers) == parsed
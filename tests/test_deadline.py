@@ -0,0 +1,142 @@
+"""Tests for the run deadline and per-stage time budgets"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from autojournalsummarizer.config import Settings
+from autojournalsummarizer.models import PaperRecord
+from autojournalsummarizer.services import workflow as workflow_module
+from autojournalsummarizer.services.deadline import (
+    DeadlineReachedError,
+    RunDeadline,
+    StageTimeoutError,
+)
+from autojournalsummarizer.services.usage import DeferredPapers
+from autojournalsummarizer.services.workflow import WorkflowService
+
+
+def _paper(day: int) -> PaperRecord:
+    return PaperRecord(
+        short_id=f"2401.0000{day}v1",
+        title=f"Paper {day}",
+        published=datetime(2024, 1, day, tzinfo=timezone.utc),
+        authors=("A. Author",),
+        pdf_url=f"http://arxiv.org/pdf/2401.0000{day}v1",
+    )
+
+
+def test_hung_calls_are_abandoned_at_their_budget():
+    deadline = RunDeadline(None, {"zotero": 0.1})
+    hung = threading.Event()
+
+    started = time.monotonic()
+    with pytest.raises(StageTimeoutError):
+        deadline.call("zotero", hung.wait, 10)
+    assert time.monotonic() - started < 1.0
+
+    # Stages without a budget run in the calling thread, unbounded
+    assert deadline.call("extract", threading.current_thread) is (
+        threading.current_thread()
+    )
+
+    expired = RunDeadline(0.0, {"zotero": 0.1})
+    with pytest.raises(DeadlineReachedError):
+        expired.call("zotero", lambda: None)
+
+    # A call cut by the run deadline rather than its stage budget
+    closing = RunDeadline(0.1, {"zotero": 10})
+    with pytest.raises(DeadlineReachedError):
+        closing.call("zotero", hung.wait, 10)
+    hung.set()
+
+
+def test_papers_are_not_started_close_to_the_deadline(tmp_path, monkeypatch):
+    settings = Settings(
+        base_dir=tmp_path, run_deadline_minutes=0.02, deadline_reserve_minutes=0
+    )
+    settings.ensure_directories()
+    DeferredPapers(settings.deferred_papers_file).save([_paper(1)])
+    workflow = WorkflowService(settings, None, logging.getLogger("test"))  # type: ignore[arg-type]
+    workflow._deadline = RunDeadline.from_settings(settings)
+    processed = []
+
+    def process(paper, model):
+        processed.append(paper.short_id)
+        time.sleep(0.35)
+
+    monkeypatch.setattr(workflow, "_process_single_paper", process)
+    papers = [_paper(2), _paper(3), _paper(4)]
+
+    # The 1.2s deadline leaves room for the deferred paper and two new ones
+    completed = workflow._process_interesting_papers(papers, papers, None)
+
+    # An early stop keeps the feed unacknowledged, so the next poll runs again
+    assert completed is False
+
+    assert processed == ["2401.00001v1", "2401.00002v1", "2401.00003v1"]
+    # The watermark stays before the paper that was not started
+    assert settings.last_date_file.read_text() == papers[1].published.isoformat()
+    assert DeferredPapers(settings.deferred_papers_file).load() == []
+
+
+def _cutting_workflow(tmp_path, monkeypatch, cut_ids):
+    settings = Settings(base_dir=tmp_path)
+    settings.ensure_directories()
+    workflow = WorkflowService(settings, None, logging.getLogger("test"))  # type: ignore[arg-type]
+    workflow._deadline = RunDeadline(0.3, {"zotero": 10})
+    hung = threading.Event()
+
+    def process(paper, model):
+        if paper.short_id in cut_ids:
+            workflow._deadline.call("zotero", hung.wait, 10)
+
+    monkeypatch.setattr(workflow, "_process_single_paper", process)
+    return workflow, hung
+
+
+def test_papers_cut_by_the_deadline_do_not_advance_the_watermark(tmp_path, monkeypatch):
+    workflow, hung = _cutting_workflow(tmp_path, monkeypatch, {"2401.00003v1"})
+    papers = [_paper(2), _paper(3), _paper(4)]
+
+    completed = workflow._process_interesting_papers(papers, papers, None)
+    hung.set()
+
+    assert completed is False
+    last_date = workflow.settings.last_date_file.read_text()
+    assert last_date == papers[0].published.isoformat()
+
+
+def test_backlog_papers_cut_by_the_deadline_are_deferred_again(tmp_path, monkeypatch):
+    workflow, hung = _cutting_workflow(tmp_path, monkeypatch, {"2401.00001v1"})
+    deferred = DeferredPapers(workflow.settings.deferred_papers_file)
+    deferred.save([_paper(1)])
+
+    workflow._process_interesting_papers([], [], None)
+    hung.set()
+
+    assert [paper.short_id for paper in deferred.load()] == ["2401.00001v1"]
+
+
+def test_source_text_timeout_falls_back_to_the_pdf(tmp_path, monkeypatch):
+    settings = Settings(
+        base_dir=tmp_path,
+        text_source="latex",
+        text_preprocessors=[],
+        stage_timeouts={"source_text": 0.1},
+    )
+    workflow = WorkflowService(settings, None, logging.getLogger("test"))  # type: ignore[arg-type]
+    hung = threading.Event()
+    monkeypatch.setattr(workflow, "_extract_source_text", lambda paper: hung.wait(10))
+    monkeypatch.setattr(workflow, "_log_pdf_truncation", lambda paper, stream: None)
+    monkeypatch.setattr(
+        workflow_module,
+        "extract_pdf_text_for_settings",
+        lambda path, settings: ("PDF text", None),
+    )
+
+    assert workflow._extract_text(_paper(1), "paper.pdf") == "PDF text"
+    hung.set()
@@ -0,0 +1,123 @@
+"""Tests for the coordinator/worker split over the job queue"""
+
+import logging
+import threading
+import time
+
+import pytest
+
+from autojournalsummarizer.config import Settings
+from autojournalsummarizer.services.distributed import WorkerService
+from autojournalsummarizer.services.job_queue import JobQueue
+
+from .test_workflow import PAPER, FakeFactory
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(
+        tmp_path / "queue.sqlite3",
+        visibility_timeout=0.3,
+        max_attempts=2,
+        retry_delay=0.0,
+    )
+
+
+def _worker(tmp_path, monkeypatch, queue, factory, worker_id="worker-a"):
+    settings = Settings(base_dir=tmp_path)
+    worker = WorkerService(
+        settings,
+        factory,  # type: ignore[arg-type]
+        logging.getLogger("test"),
+        queue,
+        worker_id=worker_id,
+    )
+    monkeypatch.setattr(worker, "_ensure_setup", lambda: None)
+    monkeypatch.setattr(worker, "_download_pdf", lambda paper, dirpath: "paper.pdf")
+    monkeypatch.setattr(worker, "_extract_text", lambda paper, path: "text")
+    return worker
+
+
+def _enqueue(queue):
+    queue.enqueue({"paper": PAPER.to_dict(), "model": None}, PAPER.short_id)
+
+
+def test_worker_claims_and_completes_jobs(tmp_path, monkeypatch, queue):
+    events: list[str] = []
+    _enqueue(queue)
+    worker = _worker(tmp_path, monkeypatch, queue, FakeFactory(events))
+
+    assert worker.run_worker(drain=True) == 1
+
+    assert sorted(events) == ["discord", "gdrive", "summarize", "zotero"]
+    assert queue.stats() == {"done": 1}
+
+
+def test_heartbeat_keeps_a_long_job_leased(tmp_path, monkeypatch, queue):
+    _enqueue(queue)
+    worker = _worker(tmp_path, monkeypatch, queue, FakeFactory([]))
+    stolen = []
+
+    def slow(paper, model):
+        # Runs for twice the visibility timeout
+        deadline = time.monotonic() + 0.6
+        while time.monotonic() < deadline:
+            stolen.append(queue.lease("worker-b"))
+            time.sleep(0.05)
+
+    monkeypatch.setattr(worker, "_process_single_paper", slow)
+
+    assert worker.run_worker(drain=True) == 1
+    assert not any(stolen)
+    assert queue.stats() == {"done": 1}
+
+
+def test_expired_lease_is_requeued_to_another_worker(tmp_path, monkeypatch, queue):
+    events: list[str] = []
+    _enqueue(queue)
+    # A worker that crashed after leasing never renews its lease
+    crashed = queue.lease("worker-a")
+    assert crashed is not None
+
+    time.sleep(0.4)
+    worker = _worker(tmp_path, monkeypatch, queue, FakeFactory(events), "worker-b")
+
+    assert worker.run_worker(drain=True) == 1
+    assert sorted(events) == ["discord", "gdrive", "summarize", "zotero"]
+    assert queue.stats() == {"done": 1}
+
+
+def test_retries_skip_finished_uploads_until_dead_lettered(
+    tmp_path, monkeypatch, queue
+):
+    events: list[str] = []
+    _enqueue(queue)
+    worker = _worker(tmp_path, monkeypatch, queue, FakeFactory(events, "gdrive"))
+
+    assert worker.run_worker(drain=True) == 2
+
+    # The Discord post and Zotero entry of the first attempt are not repeated
+    assert sorted(events) == ["discord", "summarize", "summarize", "zotero"]
+    assert queue.stats() == {"dead": 1}
+    assert queue.dead_letters()[0]["last_error"] == "Branches failed: gdrive"
+
+
+def test_read_only_queries_do_not_wait_for_the_write_lock(queue):
+    _enqueue(queue)
+    with queue._transaction():
+        started = time.monotonic()
+        results = []
+        reader = threading.Thread(target=lambda: results.append(queue.stats()))
+        reader.start()
+        reader.join(timeout=5)
+        assert results == [{"pending": 1}]
+        assert time.monotonic() - started < 1.0
+
+
+def test_jobs_stay_queued_while_the_budget_is_exhausted(tmp_path, monkeypatch, queue):
+    _enqueue(queue)
+    worker = _worker(tmp_path, monkeypatch, queue, FakeFactory([]))
+    worker.settings.daily_budget_usd = 0.0
+
+    assert worker.run_worker(drain=True) == 0
+    assert queue.stats() == {"pending": 1}
@@ -0,0 +1,128 @@
+"""Tests for the resumable PDF download manager against a local HTTP server"""
+
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from autojournalsummarizer.services.downloads import (
+    DownloadManager,
+    PdfValidationError,
+)
+
+from .conftest import build_pdf
+
+# Large enough that the stalled first half spans several download chunks
+PDF = build_pdf(["Fixture page " + "x" * 4000 for _ in range(100)])
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serves fixture PDFs with Range support and injected faults"""
+
+    stalled: set[str] = set()
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+    def do_GET(self) -> None:  # noqa: N802
+        with FixtureHandler.lock:
+            FixtureHandler.active += 1
+            FixtureHandler.max_active = max(
+                FixtureHandler.max_active, FixtureHandler.active
+            )
+        try:
+            self._serve()
+        finally:
+            with FixtureHandler.lock:
+                FixtureHandler.active -= 1
+
+    def _serve(self) -> None:
+        if self.path == "/page.html":
+            body = b"<html>Not found</html>"
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        start = 0
+        range_header = self.headers.get("Range")
+        if range_header:
+            start = int(range_header.removeprefix("bytes=").rstrip("-"))
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(PDF) - 1}/{len(PDF)}"
+            )
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(PDF) - start))
+        self.end_headers()
+
+        if self.path == "/stall.pdf" and self.path not in FixtureHandler.stalled:
+            # Send half of the file, then stop sending without closing
+            FixtureHandler.stalled.add(self.path)
+            self.wfile.write(PDF[: len(PDF) // 2])
+            self.wfile.flush()
+            time.sleep(1.0)
+            return
+        if self.path == "/slow.pdf":
+            time.sleep(0.2)
+        self.wfile.write(PDF[start:])
+
+
+@pytest.fixture
+def server() -> Iterator[str]:
+    FixtureHandler.stalled = set()
+    FixtureHandler.max_active = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_stalled_transfer_resumes_with_range(server, tmp_path):
+    manager = DownloadManager(stall_timeout=0.3, retry_delay=0.01)
+
+    path = manager.download(f"{server}/stall.pdf", tmp_path / "paper.pdf")
+
+    assert path.read_bytes() == PDF
+    assert not (tmp_path / "paper.pdf.part").exists()
+    stats = manager.stats()
+    assert stats["downloads"] == 1
+    assert stats["resumes"] == 1
+    assert stats["bytes"] == len(PDF)
+
+
+def test_non_pdf_responses_are_rejected(server, tmp_path):
+    manager = DownloadManager()
+
+    with pytest.raises(PdfValidationError):
+        manager.download(f"{server}/page.html", tmp_path / "paper.pdf")
+
+    assert list(tmp_path.iterdir()) == []
+    assert manager.stats()["failures"] == 1
+
+
+def test_downloads_respect_the_per_host_cap(server, tmp_path):
+    manager = DownloadManager(per_host=2)
+    threads = [
+        threading.Thread(
+            target=manager.download,
+            args=(f"{server}/slow.pdf", tmp_path / f"paper{i}.pdf"),
+        )
+        for i in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert FixtureHandler.max_active == 2
+    assert manager.stats()["downloads"] == 5
@@ -0,0 +1,101 @@
+"""Tests for the announcement feed precheck against a local HTTP server"""
+
+import logging
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from autojournalsummarizer.config import Settings
+from autojournalsummarizer.services.feed import FeedWatcher
+from autojournalsummarizer.services.workflow import WorkflowService
+
+ETAG = '"v1"'
+
+
+def _feed(*entries: tuple[str, str]) -> bytes:
+    items = "".join(
+        f"<entry><id>oai:arXiv.org:{arxiv_id}v1</id><title>{arxiv_id}</title>"
+        f"<arxiv:announce_type>{kind}</arxiv:announce_type></entry>"
+        for arxiv_id, kind in entries
+    )
+    return (
+        '<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom" '
+        'xmlns:arxiv="http://arxiv.org/schemas/atom">'
+        f"<title>cs.LG updates</title>{items}</feed>"
+    ).encode()
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    """Serves a feed with an ETag and answers revalidations with 304"""
+
+    body = b""
+    requests: list[str | None] = []
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+    def do_GET(self) -> None:  # noqa: N802
+        validator = self.headers.get("If-None-Match")
+        FeedHandler.requests.append(validator)
+        if validator == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(FeedHandler.body)))
+        self.end_headers()
+        self.wfile.write(FeedHandler.body)
+
+
+@pytest.fixture
+def settings(tmp_path) -> Iterator[Settings]:
+    FeedHandler.requests = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FeedHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield Settings(
+        base_dir=tmp_path,
+        arxiv_feed_url=f"http://127.0.0.1:{httpd.server_address[1]}/{{category}}",
+    )
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_feed_reports_unseen_ids_until_acknowledged(settings):
+    FeedHandler.body = _feed(("2401.00001", "new"), ("2312.00009", "replace"))
+    watcher = FeedWatcher(settings)
+
+    check = watcher.check()
+    assert check.new_ids == ["2401.00001"]
+    # Not acknowledged (the run failed), so the IDs are reported again
+    assert watcher.check().new_ids == ["2401.00001"]
+
+    watcher.acknowledge(check)
+    unchanged = watcher.check()
+    assert not unchanged.changed
+    assert unchanged.new_ids == []
+    assert FeedHandler.requests == [None, None, ETAG]
+
+
+def test_workflow_skips_the_api_query_without_announcements(settings):
+    FeedHandler.body = _feed(("2401.00001", "new"))
+    FeedWatcher(settings).acknowledge(FeedWatcher(settings).check())
+    settings.ensure_directories()
+    settings.last_date_file.write_text("2024-01-01T00:00:00+00:00")
+
+    def retrieve(start_datetime):
+        raise AssertionError("arXiv API queried")
+
+    factory = SimpleNamespace(
+        get_arxiv_service=lambda: SimpleNamespace(retrieve_recent_papers=retrieve)
+    )
+    workflow = WorkflowService(settings, factory, logging.getLogger("test"))  # type: ignore[arg-type]
+    workflow._ensure_setup = lambda: None  # type: ignore[method-assign]
+
+    workflow.run_production_workflow(5, None)
+
+    assert FeedHandler.requests[-1] == ETAG
@@ -0,0 +1,112 @@
+"""Tests for hedged OpenAI requests"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from autojournalsummarizer.services.hedging import RequestHedger
+from autojournalsummarizer.services.usage import UsageTracker
+
+USAGE = SimpleNamespace(prompt_tokens=1000, completion_tokens=100)
+
+
+def _tracker(tmp_path, latencies):
+    tracker = UsageTracker(tmp_path / "usage.sqlite3", prices={"m": (1.0, 1.0)})
+    for i, latency in enumerate(latencies):
+        tracker.record("summarize", "m", USAGE, latency, paper=f"p{i}")
+    return tracker
+
+
+class FakeClient:
+    def __init__(self, delay: float, answer: str | None):
+        self.delay = delay
+        self.answer = answer
+        self.closed = threading.Event()
+
+    def close(self) -> None:
+        self.closed.set()
+
+
+def test_slow_request_is_hedged_and_the_loser_cancelled(tmp_path):
+    hedger = RequestHedger(_tracker(tmp_path, [0.05] * 20), 90, max_extra_usd=1.0)
+    clients = iter([FakeClient(5.0, "slow"), FakeClient(0.01, "fast")])
+    made = []
+
+    def make_client():
+        made.append(next(clients))
+        return made[-1]
+
+    def request(client):
+        client.closed.wait(client.delay)
+        return client.answer
+
+    started = time.monotonic()
+    assert hedger.hedge("summarize", "m", make_client, request) == "fast"
+    assert time.monotonic() - started < 1.0
+    assert made[0].closed.is_set()
+
+    stats = hedger.stats()
+    assert stats["hedged"] == 1
+    assert stats["hedge_wins"] == 1
+    assert stats["hedge_win_rate"] == 1.0
+
+
+def test_hedging_needs_history_and_respects_the_spend_cap(tmp_path):
+    # Too few recorded calls to estimate a percentile
+    hedger = RequestHedger(_tracker(tmp_path, [0.01] * 3), 90, max_extra_usd=1.0)
+    assert hedger.hedge("summarize", "m", lambda: None, lambda _: "answer") == "answer"
+    assert hedger.stats()["hedged"] == 0
+
+    # Each past call cost 0.0011 USD, more than the cap allows
+    hedger = RequestHedger(_tracker(tmp_path, [0.01] * 20), 90, max_extra_usd=0.001)
+
+    async def slow():
+        await asyncio.sleep(0.1)
+        return "primary"
+
+    assert asyncio.run(hedger.ahedge("summarize", "m", slow)) == "primary"
+    assert hedger.stats()["hedged"] == 0
+
+
+def test_async_hedge_waits_for_a_valid_response(tmp_path):
+    hedger = RequestHedger(_tracker(tmp_path, [0.02] * 20), 50, max_extra_usd=1.0)
+    answers = iter([(0.2, "primary"), (0.0, None)])
+
+    async def request():
+        delay, answer = next(answers)
+        await asyncio.sleep(delay)
+        return answer
+
+    # The duplicate answers first but without a parsed response
+    assert asyncio.run(hedger.ahedge("summarize", "m", request)) == "primary"
+    assert hedger.stats()["primary_wins"] == 1
+
+
+def test_fast_primary_result_is_returned_without_hedging(tmp_path):
+    hedger = RequestHedger(_tracker(tmp_path, [0.5] * 20), 90, max_extra_usd=1.0)
+
+    assert hedger.hedge("summarize", "m", lambda: None, lambda _: "fast") == "fast"
+
+    async def fast():
+        return "fast"
+
+    assert asyncio.run(hedger.ahedge("summarize", "m", fast)) == "fast"
+    assert hedger.stats()["hedged"] == 0
+
+
+def test_fast_primary_error_is_raised(tmp_path):
+    hedger = RequestHedger(_tracker(tmp_path, [0.5] * 20), 90, max_extra_usd=1.0)
+
+    def fail(_):
+        raise ValueError("bad request")
+
+    async def afail():
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        hedger.hedge("summarize", "m", lambda: None, fail)
+    with pytest.raises(ValueError):
+        asyncio.run(hedger.ahedge("summarize", "m", afail))
@@ -0,0 +1,60 @@
+"""Tests for the lease-based job queue"""
+
+import time
+
+import pytest
+
+from autojournalsummarizer.services.job_queue import JobQueue, LeaseLostError
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(
+        tmp_path / "queue.sqlite3",
+        visibility_timeout=0.2,
+        max_attempts=2,
+        retry_delay=0.0,
+    )
+
+
+def test_enqueue_deduplicates_by_key(queue):
+    assert queue.enqueue({"n": 1}, dedupe_key="2401.00001")
+    assert not queue.enqueue({"n": 2}, dedupe_key="2401.00001")
+    assert queue.stats() == {"pending": 1}
+
+
+def test_leased_job_is_invisible_until_completed(queue):
+    queue.enqueue({"n": 1})
+
+    job = queue.lease("worker-a")
+    assert job is not None
+    assert job.payload == {"n": 1}
+    assert queue.lease("worker-b") is None
+
+    queue.complete(job)
+    assert queue.stats() == {"done": 1}
+
+
+def test_expired_lease_is_reclaimed(queue):
+    queue.enqueue({"n": 1})
+    crashed = queue.lease("worker-a")
+
+    time.sleep(0.3)
+    reclaimed = queue.lease("worker-b")
+
+    assert reclaimed is not None
+    assert reclaimed.attempts == 2
+    with pytest.raises(LeaseLostError):
+        queue.complete(crashed)
+
+
+def test_job_is_dead_lettered_after_max_attempts(queue):
+    queue.enqueue({"n": 1})
+
+    queue.fail(queue.lease("worker-a"), "boom")
+    queue.fail(queue.lease("worker-a"), "boom again")
+
+    assert queue.lease("worker-a") is None
+    assert queue.stats() == {"dead": 1}
+    assert queue.dead_letters()[0]["last_error"] == "boom again"
+    assert queue.requeue_dead() == 1
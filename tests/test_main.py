@@ -1,6 +1,32 @@
 """Basic tests for the main module"""
 
+from autojournalsummarizer.config import Settings
+from autojournalsummarizer.main import reset_run_state
+from autojournalsummarizer.services import (
+    get_download_manager,
+    get_request_hedger,
+    get_usage_tracker,
+)
+
 
 def test_placeholder():
     """Placeholder test to ensure test framework works"""
     assert True
+
+
+def test_daemon_runs_get_fresh_per_run_services(tmp_path):
+    """Each daemon run has its own run ID, hedging cap and download stats"""
+    settings = Settings(base_dir=tmp_path, openai_hedge_percentile=90)
+    settings.ensure_directories()
+    tracker = get_usage_tracker(settings)
+    hedger = get_request_hedger(settings)
+    manager = get_download_manager(settings)
+    manager._count(downloads=1, bytes=10)
+
+    reset_run_state(settings)
+
+    assert get_usage_tracker(settings).run_id != tracker.run_id
+    assert get_request_hedger(settings) is not hedger
+    # The connection pool is kept, only the counters start over
+    assert get_download_manager(settings) is manager
+    assert manager.stats()["downloads"] == 0
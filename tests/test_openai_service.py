@@ -0,0 +1,155 @@
+"""Tests for filter verdict caching and summary model routing"""
+
+from datetime import datetime, timezone
+
+from autojournalsummarizer.config import Settings
+from autojournalsummarizer.models import (
+    Keyword,
+    Paper,
+    PaperRecord,
+    Papers,
+    PaperSummary,
+)
+from autojournalsummarizer.services.openai_service import (
+    OpenAIService,
+    summary_problems,
+)
+
+
+def _summary(text: str) -> PaperSummary:
+    return PaperSummary(
+        japanese_title="題名",
+        summary=text,
+        merit="利点",
+        method="手法",
+        valid="検証",
+        discussion="議論",
+        keywords=[Keyword(keyword="LLM", explanation="大規模言語モデル")],
+    )
+
+
+def _paper(i: int) -> PaperRecord:
+    return PaperRecord(
+        short_id=f"2401.0000{i}v1",
+        title=f"Paper {i}",
+        published=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        authors=("A. Author",),
+        pdf_url=f"http://arxiv.org/pdf/2401.0000{i}v1",
+    )
+
+
+def test_summary_problems_flags_bad_answers():
+    assert summary_problems(_summary("この論文は新しい手法を提案する。")) == []
+    assert summary_problems(_summary("This paper proposes a method.")) == [
+        "summary is not in Japanese"
+    ]
+    assert summary_problems(None) == ["no parsed summary"]
+
+
+def test_summary_escalates_only_when_checks_fail(tmp_path, monkeypatch):
+    settings = Settings(base_dir=tmp_path, summary_models=["small", "large"])
+    (tmp_path / "prompts").mkdir()
+    settings.summarize_prompt_file.write_text("要約してください\n")
+    service = OpenAIService(settings)
+
+    answers = {"small": _summary("English"), "large": _summary("日本語の要約")}
+    calls = []
+
+    def fake_parse(operation, model, prompt, response_format, paper=None):
+        calls.append(model)
+        return answers.get(model, answers["small"])
+
+    monkeypatch.setattr(service, "_parse", fake_parse)
+
+    assert service.summarize_paper("T", "text", None) == answers["large"]
+    assert calls == ["small", "large"]
+
+    calls.clear()
+    answers["small"] = _summary("簡単な論文")
+    assert service.summarize_paper("T", "text", None) == answers["small"]
+    assert calls == ["small"]
+
+    calls.clear()
+    service.summarize_paper("T", "text", "forced")
+    assert calls == ["forced"]
+
+
+def test_filter_only_sends_unjudged_papers(tmp_path, monkeypatch):
+    settings = Settings(base_dir=tmp_path)
+    settings.keywords_file.parent.mkdir()
+    settings.keywords_file.write_text("LLM\n")
+    settings.filter_prompt_file.parent.mkdir()
+    settings.filter_prompt_file.write_text("Pick papers about:\n{keywords}")
+    service = OpenAIService(settings)
+    papers = [_paper(i) for i in range(4)]
+    sent = []
+
+    def fake_parse(operation, model, prompt, response_format, paper=None):
+        sent.append(prompt)
+        titles = [line.split(". ", 1)[1] for line in prompt.splitlines()[2:]]
+        # Pick every paper with an even number in its title
+        return Papers(
+            papers=[
+                Paper(idx=i, title=title, reason="")
+                for i, title in enumerate(titles)
+                if int(title.split()[1]) % 2 == 0
+            ]
+        )
+
+    monkeypatch.setattr(service, "_parse", fake_parse)
+
+    assert service.filter_interesting_papers(papers[:2], 5, None) == [papers[0]]
+    assert service.filter_interesting_papers(papers, 5, None) == [
+        papers[0],
+        papers[2],
+    ]
+    assert "Paper 0" not in sent[1] and "Paper 3" in sent[1]
+
+    sent.clear()
+    assert service.filter_interesting_papers(papers, 5, None) == [
+        papers[0],
+        papers[2],
+    ]
+    assert sent == []
+
+
+def test_cached_verdicts_keep_input_order_and_the_cap(tmp_path, monkeypatch):
+    settings = Settings(base_dir=tmp_path)
+    settings.keywords_file.parent.mkdir()
+    settings.keywords_file.write_text("LLM\n")
+    settings.filter_prompt_file.parent.mkdir()
+    settings.filter_prompt_file.write_text("Pick papers about:\n{keywords}")
+    service = OpenAIService(settings)
+    papers = [_paper(i) for i in range(5)]
+    picks = {"Paper 3", "Paper 1", "Paper 4"}
+    judged = []
+
+    def fake_parse(operation, model, prompt, response_format, paper=None):
+        titles = [line.split(". ", 1)[1] for line in prompt.splitlines()[2:]]
+        judged.append(titles)
+        # Answers in its own ranking, not in input order
+        return Papers(
+            papers=[
+                Paper(idx=titles.index(title), title=title, reason="")
+                for title in sorted(picks, reverse=True)
+                if title in titles
+            ][:2]
+        )
+
+    monkeypatch.setattr(service, "_parse", fake_parse)
+
+    # The capped answer leaves out Paper 1 for lack of room
+    assert service.filter_interesting_papers(papers, 2, None) == [
+        papers[3],
+        papers[4],
+    ]
+    # Only positives were cached, so Paper 1 is judged again
+    assert service.filter_interesting_papers(papers, 5, None) == [
+        papers[1],
+        papers[3],
+        papers[4],
+    ]
+    assert judged[1] == ["Paper 0", "Paper 1", "Paper 2"]
+
+    # Cached positives are capped as well
+    assert service.filter_interesting_papers(papers, 1, None) == [papers[1]]
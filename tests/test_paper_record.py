@@ -0,0 +1,40 @@
+"""Tests for the compact paper record"""
+
+from datetime import datetime, timezone
+
+import arxiv  # type: ignore
+
+from autojournalsummarizer.models import PaperRecord
+
+
+def _result() -> arxiv.Result:
+    return arxiv.Result(
+        entry_id="http://arxiv.org/abs/2401.00001v2",
+        published=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        title="A Paper: With Punctuation",
+        authors=[arxiv.Result.Author("Ada Lovelace"), arxiv.Result.Author("Alan")],
+        summary="Abstract",
+        links=[
+            arxiv.Result.Link("http://arxiv.org/abs/2401.00001v2", rel="alternate"),
+            arxiv.Result.Link(
+                "http://arxiv.org/pdf/2401.00001v2", title="pdf", rel="related"
+            ),
+        ],
+    )
+
+
+def test_record_keeps_what_the_pipeline_reads():
+    result = _result()
+    record = PaperRecord.from_result(result)
+
+    assert record.short_id == result.get_short_id()
+    assert record.entry_id == result.entry_id
+    assert record.pdf_url == result.pdf_url
+    assert record.first_author == "Ada Lovelace"
+    assert record.pdf_filename == result._get_default_filename()
+    assert not hasattr(record, "__dict__")
+
+
+def test_record_round_trips_through_dict():
+    record = PaperRecord.from_result(_result())
+    assert PaperRecord.from_dict(record.to_dict()) == record
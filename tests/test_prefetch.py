@@ -0,0 +1,74 @@
+"""Tests for speculative PDF prefetching"""
+
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+from autojournalsummarizer.models import PaperRecord
+from autojournalsummarizer.services.downloads import DownloadCancelledError
+from autojournalsummarizer.services.prefetch import (
+    PdfPrefetcher,
+    rank_prefetch_candidates,
+)
+
+
+def _paper(i: int, title: str, summary: str = "") -> PaperRecord:
+    return PaperRecord(
+        short_id=f"2401.0000{i}v1",
+        title=title,
+        published=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        authors=("A. Author",),
+        pdf_url=f"http://arxiv.org/pdf/2401.0000{i}v1",
+        summary=summary,
+    )
+
+
+def test_candidates_rank_title_matches_first():
+    papers = [
+        _paper(0, "Graph Networks", "We use reinforcement learning."),
+        _paper(1, "Protein Folding"),
+        _paper(2, "Offline Reinforcement Learning"),
+        _paper(3, "LLMs as planners", "Reinforcement learning agents"),
+    ]
+    keywords = ["reinforcement learning", "LLMs", ""]
+
+    ranked = rank_prefetch_candidates(papers, keywords, limit=2)
+    assert ranked == [papers[3], papers[2]]
+    assert papers[1] not in rank_prefetch_candidates(papers, keywords, limit=5)
+
+
+def test_prefetcher_keeps_selected_and_cancels_the_rest(tmp_path):
+    release = threading.Event()
+
+    def fake_download(paper, dirpath, cancel):
+        if paper.short_id.endswith("2v1"):
+            # A slow download that only ends when cancelled
+            release.wait(timeout=5)
+            if cancel.is_set():
+                raise DownloadCancelledError(paper.short_id)
+        path = Path(dirpath) / paper.pdf_filename
+        path.write_bytes(b"%PDF-1.4")
+        return str(path)
+
+    papers = [_paper(i, f"Paper {i}") for i in range(4)]
+    manager = SimpleNamespace(download_pdf=fake_download)
+    prefetcher = PdfPrefetcher(manager, workers=3)  # type: ignore[arg-type]
+    staging = Path(prefetcher._staging.name)
+    prefetcher.start(papers[:3])
+
+    prefetcher.retain([papers[0], papers[3]])
+    release.set()
+    taken = prefetcher.take(papers[0], str(tmp_path))
+    assert taken is not None and Path(taken).read_bytes() == b"%PDF-1.4"
+    assert prefetcher.take(papers[3], str(tmp_path)) is None
+
+    stats = prefetcher.close()
+    assert stats == {
+        "prefetched": 3,
+        "hits": 1,
+        "misses": 1,
+        "evicted": 2,
+        "hit_rate": 0.5,
+    }
+    assert not staging.exists()
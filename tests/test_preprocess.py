@@ -0,0 +1,90 @@
+"""Tests for text preprocessing before summarization"""
+
+import pytest
+
+from autojournalsummarizer.services.preprocess import (
+    PREPROCESSORS,
+    collapse_whitespace,
+    dehyphenate,
+    drop_appendix,
+    drop_math_residue,
+    drop_references,
+    preprocess_text,
+)
+
+HEADER = "Published as a conference paper at ICLR 2024"
+
+PAPER = "\n".join(
+    [
+        "arXiv:2401.00001v1 [cs.LG] 1 Jan 2024",
+        HEADER,
+        "1 Introduction",
+        "We study the summar-",
+        "ization of papers.   Appendix C shows the proofs.",
+        "Figure 1: Overview of the method.",
+        "∑ ∫ (3) = 0.12 ± 0.4 [1, 2]",
+        "1",
+        HEADER,
+        "2 Method",
+        "Our method works well in practice.",
+        "2",
+        HEADER,
+        "3 Conclusion",
+        "It generalizes.",
+        "References",
+        "[1] A. Author. A paper. 2020.",
+        "[2] B. Author. Another paper. 2021.",
+        "A Additional Experiments",
+        "Appendix B: Proofs",
+        "The proof is straightforward.",
+    ]
+)
+
+
+def test_default_pipeline_keeps_only_the_body():
+    cleaned, removed = preprocess_text(PAPER, list(PREPROCESSORS))
+
+    assert cleaned == "\n".join(
+        [
+            "1 Introduction",
+            "We study the summarization of papers. Appendix C shows the proofs.",
+            "2 Method",
+            "Our method works well in practice.",
+            "3 Conclusion",
+            "It generalizes.",
+        ]
+    )
+    assert removed["references"] > 0
+    assert removed["page_artifacts"] > 0
+
+
+def test_references_before_an_appendix_are_cut_separately():
+    text = "Body\n" * 10 + "7 References\n[1] Cited.\nAppendix A\nExtra."
+    assert drop_references(text) == "Body\n" * 10 + "Appendix A\nExtra."
+    assert drop_appendix(drop_references(text)) == "Body\n" * 10
+
+
+def test_single_steps():
+    assert dehyphenate("summar-\nization and state-of-\nthe-art") == (
+        "summarization and state-of-the-art"
+    )
+    assert collapse_whitespace("  a \t b\n\n\n\nc  ") == "a b\n\nc"
+
+
+def test_unknown_steps_are_rejected():
+    with pytest.raises(ValueError, match="nope"):
+        preprocess_text("text", ["whitespace", "nope"])
+
+
+def test_results_tables_survive_math_residue():
+    table = "\n".join(
+        [
+            "Method Acc F1 BLEU",
+            "Baseline 81.2 ± 0.4 77.9 31.2",
+            "Ours 85.2 ± 0.3 80.1 (+2.2) 33.0",
+            "84.6 ± 0.2 90.1 ± 0.5 <0.01",
+        ]
+    )
+    residue = "\n".join(["∑ ∫ (3) = 0.12 ± 0.4 [1, 2]", "f(x) = ∑ x_i w_i + b"])
+
+    assert drop_math_residue(table + "\n" + residue) == table
@@ -0,0 +1,47 @@
+"""Tests for per-stage profiling"""
+
+import json
+import pstats
+import tracemalloc
+
+import pytest
+
+from autojournalsummarizer.config import Settings
+from autojournalsummarizer.services.profiling import StageProfiler, get_stage_profiler
+
+
+@pytest.fixture(autouse=True)
+def _stop_tracemalloc():
+    yield
+    tracemalloc.stop()
+
+
+def _build_prompt(n: int) -> list[str]:
+    return [f"line {i}" * 10 for i in range(n)]
+
+
+def test_profiler_writes_cpu_and_memory_reports(tmp_path):
+    profiler = StageProfiler(tmp_path / "run", top_allocations=5)
+
+    for _ in range(2):
+        with profiler.stage("summarize"):
+            kept = _build_prompt(20_000)
+            with profiler.stage("nested"):
+                pass
+    directory = profiler.write_report()
+
+    summary = json.loads((directory / "summary.json").read_text())
+    assert summary["summarize"]["calls"] == 2
+    assert summary["summarize"]["peak_mib"] > 1
+    assert summary["nested"]["calls"] == 2
+
+    stats = pstats.Stats(str(directory / "summarize.prof"))
+    assert any(func[2] == "_build_prompt" for func in stats.stats)  # type: ignore[attr-defined]
+    report = (directory / "summarize.txt").read_text()
+    assert "test_profiling.py" in report
+    assert "No CPU profile collected" in (directory / "nested.txt").read_text()
+    assert kept
+
+
+def test_profiler_is_off_by_default(tmp_path):
+    assert get_stage_profiler(Settings(base_dir=tmp_path)) is None
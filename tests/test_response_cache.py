@@ -0,0 +1,158 @@
+"""Tests for the arXiv response cache and polite client"""
+
+import os
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import arxiv  # type: ignore
+
+from autojournalsummarizer.config import Settings
+from autojournalsummarizer.services import arxiv as arxiv_module
+from autojournalsummarizer.services import response_cache as response_cache_module
+from autojournalsummarizer.services.arxiv import ArxivService, PoliteArxivClient
+from autojournalsummarizer.services.rate_limit import RateLimiter
+from autojournalsummarizer.services.response_cache import ResponseCache, normalize_url
+
+FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"
+      xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">
+  <opensearch:totalResults>1</opensearch:totalResults>
+  <entry>
+    <id>http://arxiv.org/abs/2401.00001v1</id>
+    <updated>2024-01-01T00:00:00Z</updated>
+    <published>2024-01-01T00:00:00Z</published>
+    <title>Cached Paper</title>
+    <summary>Abstract</summary>
+    <author><name>A. Author</name></author>
+    <link href="http://arxiv.org/abs/2401.00001v1" rel="alternate"/>
+    <link title="pdf" href="http://arxiv.org/pdf/2401.00001v1" rel="related"/>
+    <arxiv:primary_category xmlns:arxiv="http://arxiv.org/schemas/atom" term="cs.AI"/>
+    <category term="cs.AI"/>
+  </entry>
+</feed>
+"""
+
+
+class FakeResponse:
+    def __init__(self, status_code, text="", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+        self.urls = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(headers or {})
+        self.urls.append(url)
+        return self.responses.pop(0)
+
+
+def make_client(tmp_path, responses, ttl=3600.0):
+    client = PoliteArxivClient(
+        RateLimiter(0.0), cache=ResponseCache(tmp_path, ttl), num_retries=1
+    )
+    client._session = FakeSession(responses)
+    return client
+
+
+def test_normalize_url_ignores_param_order_and_whitespace():
+    assert normalize_url("http://x/q?b=2&a=cat:cs.AI  AND  x") == normalize_url(
+        "http://X/q?a=cat:cs.AI AND x&b=2"
+    )
+
+
+def test_fresh_entry_is_served_without_request(tmp_path):
+    client = make_client(tmp_path, [FakeResponse(200, FEED, {"ETag": '"v1"'})])
+    search = arxiv.Search(query="cat:cs.AI", max_results=5)
+
+    assert [p.title for p in client.results(search)] == ["Cached Paper"]
+    assert [p.title for p in client.results(search)] == ["Cached Paper"]
+    assert len(client._session.requests) == 1
+    assert client.cache.hits == 1
+
+
+def test_stale_entry_is_revalidated(tmp_path):
+    client = make_client(
+        tmp_path, [FakeResponse(200, FEED, {"ETag": '"v1"'}), FakeResponse(304)]
+    )
+    client.cache.ttl = 0.0
+    search = arxiv.Search(query="cat:cs.AI", max_results=5)
+
+    list(client.results(search))
+    assert [p.title for p in client.results(search)] == ["Cached Paper"]
+    assert client._session.requests[1]["If-None-Match"] == '"v1"'
+    assert client.cache.revalidations == 1
+
+
+def test_failed_request_is_retried(tmp_path):
+    client = make_client(tmp_path, [FakeResponse(503), FakeResponse(200, FEED)])
+    search = arxiv.Search(query="cat:cs.AI", max_results=5)
+
+    assert len(list(client.results(search))) == 1
+    assert len(client._session.requests) == 2
+
+
+def test_query_end_bucket_boundary_starts_a_fresh_query(tmp_path, monkeypatch):
+    clock = [datetime(2024, 1, 2, 10, 59, tzinfo=timezone.utc).timestamp()]
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.fromtimestamp(clock[0], tz=tz)
+
+    monkeypatch.setattr(arxiv_module, "datetime", FrozenDatetime)
+    monkeypatch.setattr(
+        response_cache_module,
+        "time",
+        SimpleNamespace(time=lambda: clock[0], monotonic_ns=time.monotonic_ns),
+    )
+    service = ArxivService(Settings(base_dir=tmp_path, arxiv_cache_ttl=3600.0))
+    service.client.rate_limiter = RateLimiter(0.0)
+    new_feed = FEED.replace("2401.00001", "2401.00002").replace("Cached", "New")
+    service.client._session = FakeSession(
+        [
+            FakeResponse(200, FEED, {"ETag": '"v1"'}),
+            FakeResponse(200, new_feed, {"ETag": '"v2"'}),
+            FakeResponse(304),
+        ]
+    )
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    session = service.client._session
+
+    assert [p.title for p in service.retrieve_recent_papers(start)] == ["Cached Paper"]
+    clock[0] += 30
+    assert [p.title for p in service.retrieve_recent_papers(start)] == ["Cached Paper"]
+    assert len(session.urls) == 1
+
+    # The old bucket's entry is stale, but the new bucket queries a new range:
+    # it is fetched in full instead of revalidated and answered with a 304
+    clock[0] += 3600
+    assert [p.title for p in service.retrieve_recent_papers(start)] == ["New Paper"]
+    assert "20240102110000" in session.urls[0]
+    assert "20240102120000" in session.urls[1]
+    assert "If-None-Match" not in session.requests[1]
+
+    # A stale entry of the current bucket is revalidated and served
+    service.cache.ttl = 0.0
+    assert [p.title for p in service.retrieve_recent_papers(start)] == ["New Paper"]
+    assert session.requests[2]["If-None-Match"] == '"v2"'
+
+
+def test_entries_past_the_max_age_are_pruned(tmp_path):
+    cache = ResponseCache(tmp_path, 0.0)
+    cache.put("http://x/old", "old")
+    cache.put("http://x/recent", "recent")
+    old_path = cache._path("http://x/old")
+    week_ago = time.time() - 7 * 86400
+    os.utime(old_path, (week_ago, week_ago))
+
+    reopened = ResponseCache(tmp_path, 0.0, max_age=86400)
+
+    assert reopened.get("http://x/old") is None
+    assert reopened.get("http://x/recent").body == "recent"
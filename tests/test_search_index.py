@@ -0,0 +1,62 @@
+"""Tests for the full-text search index"""
+
+from datetime import datetime, timezone
+
+from autojournalsummarizer.models import Keyword, PaperRecord, PaperSummary
+from autojournalsummarizer.services.search_index import SearchIndex
+
+
+def _paper(i: int, title: str) -> PaperRecord:
+    return PaperRecord(
+        short_id=f"2401.0000{i}v1",
+        title=title,
+        published=datetime(2024, 1, i, tzinfo=timezone.utc),
+        authors=("A. Author",),
+        pdf_url=f"http://arxiv.org/pdf/2401.0000{i}v1",
+    )
+
+
+def _summary(japanese_title: str, keyword: str) -> PaperSummary:
+    return PaperSummary(
+        japanese_title=japanese_title,
+        summary="本論文は新しい手法を提案する。",
+        merit="利点",
+        method="手法",
+        valid="検証",
+        discussion="議論",
+        keywords=[Keyword(keyword=keyword, explanation="説明")],
+    )
+
+
+def test_search_ranks_titles_above_body_mentions(tmp_path):
+    index = SearchIndex(tmp_path / "search.sqlite3")
+    index.add(
+        _paper(1, "Diffusion Policies for Robots"),
+        "We compare against transformers.",
+        _summary("ロボットのための拡散方策", "拡散モデル"),
+    )
+    index.add(
+        _paper(2, "Efficient Transformers"),
+        "Attention is all you need.",
+        _summary("効率的なトランスフォーマー", "注意機構"),
+    )
+    assert index.flush() == 2
+
+    hits = index.search("transformers")
+    assert [hit.arxiv_id for hit in hits] == ["2401.00002", "2401.00001"]
+    assert [hit.arxiv_id for hit in index.search("拡散方策")] == ["2401.00001"]
+    # Terms shorter than a trigram still match summaries
+    assert [hit.arxiv_id for hit in index.search("拡散 robots")] == ["2401.00001"]
+    assert index.search('"unbalanced') == []
+
+
+def test_reindexing_replaces_the_entry(tmp_path):
+    index = SearchIndex(tmp_path / "search.sqlite3")
+    index.add(_paper(1, "Old title"), "text", None)
+    index.flush()
+    index.add(_paper(1, "New title"), "text", _summary("新しい題名", "題名"))
+    index.flush()
+
+    assert index.count() == 1
+    assert index.search("Old title") == []
+    assert index.search("New title")[0].japanese_title == "新しい題名"
@@ -0,0 +1,117 @@
+"""Tests for arXiv LaTeX/HTML text extraction"""
+
+import gzip
+import io
+import tarfile
+from pathlib import Path
+
+from autojournalsummarizer.services.source_text import (
+    extract_text_from_source_archive,
+    html_to_text,
+    latex_to_text,
+)
+
+MAIN_TEX = r"""
+\documentclass{article}
+\usepackage{amsmath}
+\title{Secret Preamble Title}
+\begin{document}
+\maketitle
+\section{Introduction}
+We study \emph{efficient} transformers~\cite{vaswani2017}. % a comment
+\input{sections/method}
+\begin{figure}
+\caption{Figure caption noise}
+\end{figure}
+\bibliography{refs}
+\end{document}
+"""
+
+METHOD_TEX = r"""
+\section{Method}
+Our method uses \textbf{sparse attention} as shown in Eq.~\eqref{eq:attn}.
+\begin{equation}
+\label{eq:attn} a = \mathrm{softmax}(QK^T)
+\end{equation}
+"""
+
+
+def _make_tarball(path: Path, files: dict[str, str]) -> Path:
+    with tarfile.open(path, "w:gz") as archive:
+        for name, content in files.items():
+            data = content.encode()
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return path
+
+
+def test_latex_to_text_keeps_prose_and_drops_markup():
+    text = latex_to_text(MAIN_TEX)
+
+    assert "Introduction" in text
+    assert "We study efficient transformers" in text
+    assert "Secret Preamble Title" not in text
+    assert "Figure caption noise" not in text
+    assert "a comment" not in text
+    assert "\\" not in text
+
+
+def test_extract_text_from_tarball_resolves_inputs(tmp_path):
+    tarball = _make_tarball(
+        tmp_path / "source.tar.gz",
+        {
+            "main.tex": MAIN_TEX,
+            "sections/method.tex": METHOD_TEX,
+            "figures/plot.png": "not tex",
+        },
+    )
+
+    with tarball.open("rb") as fh:
+        text = extract_text_from_source_archive(fh)
+
+    assert text is not None
+    assert "Our method uses sparse attention" in text
+    assert text.index("Introduction") < text.index("Method")
+    assert "softmax" not in text
+
+
+def test_extract_text_from_single_gzipped_tex():
+    fileobj = io.BytesIO(gzip.compress(MAIN_TEX.encode()))
+
+    text = extract_text_from_source_archive(fileobj, max_chars=20)
+
+    assert text is not None
+    assert len(text) == 20
+
+
+def test_extract_text_returns_none_without_latex(tmp_path):
+    tarball = _make_tarball(tmp_path / "source.tar.gz", {"README": "nothing"})
+
+    with tarball.open("rb") as fh:
+        assert extract_text_from_source_archive(fh) is None
+
+
+def test_extract_text_returns_none_for_uncompressed_pdf():
+    assert extract_text_from_source_archive(io.BytesIO(b"%PDF-1.4\n")) is None
+
+
+def test_html_to_text_extracts_article_body():
+    html = """
+    <html><body>
+    <nav>Navigation</nav>
+    <article>
+      <h2>1 Introduction</h2>
+      <p>Body text with <math>x</math> inline math.</p>
+      <section class="ltx_bibliography">References list</section>
+    </article>
+    </body></html>
+    """
+
+    text = html_to_text(html)
+
+    assert text is not None
+    assert "Introduction" in text
+    assert "Body text with" in text
+    assert "Navigation" not in text
+    assert "References list" not in text
@@ -0,0 +1,113 @@
+"""Tests for multi-tenant profiles"""
+
+import json
+import logging
+import threading
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+import pytest
+
+from autojournalsummarizer.config import Settings, TenantProfile, load_tenants
+from autojournalsummarizer.services.multi_tenant import MultiTenantWorkflowService
+
+from .test_workflow import PAPER
+
+
+def test_tenant_profile_overrides_only_declared_fields(tmp_path):
+    settings = Settings(base_dir=tmp_path, discord_webhook_url="base-hook")
+    profile = TenantProfile(
+        name="vision",
+        keywords_file="settings/vision.txt",
+        google_folder_name="vision-papers",
+    )
+
+    tenant_settings = profile.apply(settings)
+
+    assert tenant_settings.keywords_file == tmp_path / "settings" / "vision.txt"
+    assert tenant_settings.google_folder_name == "vision-papers"
+    assert tenant_settings.discord_webhook_url == "base-hook"
+    assert settings.keywords_file == tmp_path / "settings" / "keywords.txt"
+
+
+def test_load_tenants_rejects_duplicate_names(tmp_path):
+    settings = Settings(base_dir=tmp_path)
+    settings.tenants_file.parent.mkdir(parents=True)
+    settings.tenants_file.write_text(json.dumps([{"name": "a"}, {"name": "a"}]))
+
+    with pytest.raises(ValueError):
+        load_tenants(settings)
+
+
+def test_hung_tenant_delivery_is_cut_off_by_its_stage_budget(tmp_path):
+    settings = Settings(base_dir=tmp_path, stage_timeouts={"zotero": 0.1})
+    workflow = MultiTenantWorkflowService(
+        settings, None, logging.getLogger("test"), [TenantProfile(name="a")]
+    )  # type: ignore[arg-type]
+    tenant = workflow.tenants[0]
+    hung = threading.Event()
+    sent = []
+    tenant.factory = SimpleNamespace(  # type: ignore[assignment]
+        get_discord_service=lambda: SimpleNamespace(
+            make_paper_message=lambda paper, summary: "message",
+            send_message=sent.append,
+        ),
+        get_gdrive_service=lambda: SimpleNamespace(upload_pdf=sent.append),
+        get_zotero_service=lambda: SimpleNamespace(
+            register_paper=lambda paper, path: hung.wait(10)
+        ),
+    )
+
+    started = time.monotonic()
+    delivered: set = set()
+    workflow._deliver_to_tenant(tenant, PAPER, "paper.pdf", None, delivered)
+    hung.set()
+
+    assert time.monotonic() - started < 1.0
+    assert sent == ["message", "paper.pdf"]
+    assert {kind for kind, _ in delivered} == {"discord", "gdrive"}
+
+
+def test_exhausted_budget_stops_the_fan_out_without_deferring(tmp_path):
+    settings = Settings(base_dir=tmp_path, daily_budget_usd=0.0)
+    settings.ensure_directories()
+    workflow = MultiTenantWorkflowService(
+        settings, None, logging.getLogger("test"), [TenantProfile(name="a")]
+    )  # type: ignore[arg-type]
+
+    completed = workflow._process_fan_out([PAPER], {"a": [PAPER]}, None)
+
+    # The paper is left after the watermark instead of in the deferral store
+    assert completed is False
+    assert not settings.last_date_file.exists()
+    assert not settings.deferred_papers_file.exists()
+
+
+def test_multi_tenant_run_writes_the_stage_profiles(tmp_path, monkeypatch):
+    settings = Settings(base_dir=tmp_path, profile=True)
+    settings.ensure_directories()
+    workflow = MultiTenantWorkflowService(
+        settings, None, logging.getLogger("test"), [TenantProfile(name="a")]
+    )  # type: ignore[arg-type]
+    monkeypatch.setattr(workflow, "_check_feed", lambda: None)
+    monkeypatch.setattr(workflow, "_retrieve_papers", lambda: [PAPER])
+    monkeypatch.setattr(workflow, "_filter_papers_for_tenant", lambda *args: [PAPER])
+    monkeypatch.setattr(
+        workflow, "_send_tenant_summary_notification", lambda *args: None
+    )
+    monkeypatch.setattr(workflow, "_download_pdf", lambda paper, dirpath: "paper.pdf")
+    monkeypatch.setattr(workflow, "_extract_text", lambda paper, path: "text")
+    monkeypatch.setattr(workflow, "_deliver_to_tenant", lambda *args: None)
+    workflow.factory = SimpleNamespace(  # type: ignore[assignment]
+        get_openai_service=lambda: SimpleNamespace(
+            summarize_paper=lambda title, text, model: None
+        )
+    )
+
+    workflow.run_production_workflow(5, None)
+    tracemalloc.stop()
+
+    (directory,) = settings.profiles_dir.iterdir()
+    summary = json.loads((directory / "summary.json").read_text())
+    assert summary["summarize"]["calls"] == 1
@@ -0,0 +1,80 @@
+"""Tests for token accounting and budget deferral"""
+
+import logging
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from autojournalsummarizer.config import Settings
+from autojournalsummarizer.models import PaperRecord
+from autojournalsummarizer.services.factory import ServiceFactory
+from autojournalsummarizer.services.usage import (
+    DeferredPapers,
+    UsageTracker,
+    estimate_cost,
+    get_usage_tracker,
+)
+from autojournalsummarizer.services.workflow import WorkflowService
+
+
+def _usage(prompt_tokens: int, completion_tokens: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        prompt_tokens=prompt_tokens, completion_tokens=completion_tokens
+    )
+
+
+def _paper(i: int) -> PaperRecord:
+    return PaperRecord(
+        short_id=f"2401.0000{i}v1",
+        title=f"Paper {i}",
+        published=datetime(2024, 1, 1, i, tzinfo=timezone.utc),
+        authors=("A. Author",),
+        pdf_url=f"http://arxiv.org/pdf/2401.0000{i}v1",
+    )
+
+
+def test_estimate_cost_matches_longest_prefix():
+    assert estimate_cost("gpt-4o-mini-2024-07-18", 1_000_000, 0) == 0.15
+    assert estimate_cost("gpt-4o-2024-08-06", 0, 1_000_000) == 10.0
+    assert estimate_cost("unknown", 1000, 1000) == 0.0
+
+
+def test_tracker_aggregates_per_stage_and_paper(tmp_path):
+    tracker = UsageTracker(tmp_path / "usage.sqlite3")
+    tracker.record("filter", "gpt-4o", _usage(1000, 100), 1.0)
+    tracker.record("summarize", "gpt-4o", _usage(20000, 800), 4.0, paper="P")
+    tracker.record("summarize", "gpt-4o", _usage(10000, 400), 2.0, paper="P")
+
+    summary = {row["stage"]: row for row in tracker.run_summary()}
+    assert summary["summarize"]["calls"] == 2
+    assert summary["summarize"]["prompt_tokens"] == 30000
+    assert tracker.paper_report() == [
+        {
+            "paper": "P",
+            "prompt_tokens": 30000,
+            "completion_tokens": 1200,
+            "cost_usd": 0.087,
+            "latency_s": 6.0,
+        }
+    ]
+    assert round(tracker.spent_today(), 4) == 0.0905
+
+
+def test_budget_defers_lower_priority_papers(tmp_path):
+    settings = Settings(base_dir=tmp_path, daily_budget_usd=0.25)
+    logger = logging.getLogger("test")
+    workflow = WorkflowService(settings, ServiceFactory(settings, logger), logger)
+    tracker = get_usage_tracker(settings)
+    # Each summary costs $0.10 on average
+    tracker.record("summarize", "gpt-4o", _usage(40000, 0), 1.0, paper="Old")
+
+    papers = [_paper(i) for i in range(4)]
+    backlog, selected_ids = workflow._plan_budget(papers, "gpt-4o")
+
+    assert backlog == []
+    assert selected_ids == {papers[0].short_id}
+    deferred = DeferredPapers(settings.deferred_papers_file).load()
+    assert deferred == papers[1:]
+
+    # Deferred papers come first in the next run
+    backlog, selected_ids = workflow._plan_budget([_paper(5)], "gpt-4o")
+    assert backlog == [papers[1]]
@@ -0,0 +1,79 @@
+"""Tests for service utility functions"""
+
+import pytest
+from pypdf import PdfReader
+
+from autojournalsummarizer.config import Settings
+from autojournalsummarizer.services import utils as utils_module
+from autojournalsummarizer.services.utils import (
+    PdfLimitError,
+    extract_pdf_text_for_settings,
+    extract_text_from_pdf,
+    iter_pdf_text,
+)
+
+
+def test_extract_text_reads_all_pages(make_pdf):
+    pdf_path = make_pdf(["first page", "second page"])
+
+    text = extract_text_from_pdf(str(pdf_path))
+
+    assert "first page" in text
+    assert "second page" in text
+
+
+def test_stream_stops_at_page_limit(make_pdf):
+    pdf_path = make_pdf(["one", "two", "three"])
+
+    stream = iter_pdf_text(str(pdf_path), max_pages=2)
+    pages = list(stream)
+
+    assert len(pages) == 2
+    assert stream.limit_reached == "max_pages"
+    assert stream.total_pages == 3
+
+
+def test_stream_truncates_at_tightest_budget(make_pdf):
+    pdf_path = make_pdf(["abcdefghij", "klmnopqrst"])
+
+    stream = iter_pdf_text(str(pdf_path), max_chars=100, max_tokens=3)
+    text = "".join(stream)
+
+    assert len(text) == 12
+    assert stream.limit_reached == "max_tokens"
+
+
+def test_stream_rejects_oversized_file(make_pdf):
+    pdf_path = make_pdf(["too big"])
+
+    stream = iter_pdf_text(str(pdf_path), max_file_bytes=10)
+
+    with pytest.raises(PdfLimitError):
+        list(stream)
+    assert stream.limit_reached == "max_file_bytes"
+
+
+def test_pdf_caps_are_off_by_default(make_pdf, tmp_path):
+    pdf_path = make_pdf(["one", "two", "three"])
+
+    text, stream = extract_pdf_text_for_settings(
+        str(pdf_path), Settings(base_dir=tmp_path)
+    )
+
+    assert "three" in text
+    assert stream.limit_reached is None
+
+
+def test_stream_releases_parsed_pages(make_pdf, monkeypatch):
+    pdf_path = make_pdf([f"page {i}" for i in range(8)])
+    readers = []
+
+    def reader(stream):
+        readers.append(PdfReader(stream))
+        return readers[-1]
+
+    monkeypatch.setattr(utils_module, "PdfReader", reader)
+    cached = [len(readers[0].resolved_objects) for _ in iter_pdf_text(str(pdf_path))]
+
+    assert len(cached) == 8
+    assert cached[-1] <= cached[0]
@@ -0,0 +1,96 @@
+"""Tests for the per-paper stage graph"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from autojournalsummarizer.config import Settings
+from autojournalsummarizer.models import PaperRecord
+from autojournalsummarizer.services.workflow import WorkflowError, WorkflowService
+
+PAPER = PaperRecord(
+    short_id="2401.00001v1",
+    title="Paper",
+    published=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    authors=("A. Author",),
+    pdf_url="http://arxiv.org/pdf/2401.00001v1",
+)
+
+
+class FakeFactory:
+    def __init__(self, events: list[str], fail: str | None = None) -> None:
+        self.events = events
+        self.fail = fail
+        self.uploads_started = threading.Event()
+
+    def _step(self, name: str, wait: bool = False) -> None:
+        if name in ("gdrive", "zotero"):
+            self.uploads_started.set()
+        if wait:
+            # The summary only finishes once an upload has started alongside it
+            assert self.uploads_started.wait(timeout=5)
+        time.sleep(0.01)
+        if name == self.fail:
+            raise RuntimeError(f"{name} is down")
+        self.events.append(name)
+
+    def get_openai_service(self) -> SimpleNamespace:
+        return SimpleNamespace(
+            summarize_paper=lambda title, text, model: self._step("summarize", True)
+        )
+
+    def get_discord_service(self) -> SimpleNamespace:
+        return SimpleNamespace(
+            make_paper_message=lambda paper, summary: "message",
+            send_message=lambda message: self._step("discord"),
+        )
+
+    def get_gdrive_service(self) -> SimpleNamespace:
+        return SimpleNamespace(upload_pdf=lambda path: self._step("gdrive"))
+
+    def get_zotero_service(self) -> SimpleNamespace:
+        return SimpleNamespace(register_paper=lambda paper, path: self._step("zotero"))
+
+
+def _workflow(tmp_path, monkeypatch, factory: FakeFactory) -> WorkflowService:
+    settings = Settings(base_dir=tmp_path)
+    workflow = WorkflowService(settings, factory, logging.getLogger("test"))  # type: ignore[arg-type]
+    monkeypatch.setattr(workflow, "_download_pdf", lambda paper, dirpath: "paper.pdf")
+    monkeypatch.setattr(workflow, "_extract_text", lambda paper, path: "text")
+    return workflow
+
+
+def test_uploads_run_alongside_summary(tmp_path, monkeypatch):
+    events: list[str] = []
+    workflow = _workflow(tmp_path, monkeypatch, FakeFactory(events))
+
+    workflow._process_single_paper(PAPER, None)
+
+    assert sorted(events) == ["discord", "gdrive", "summarize", "zotero"]
+    assert events.index("summarize") < events.index("discord")
+
+
+def test_failed_branch_does_not_stop_the_others(tmp_path, monkeypatch):
+    events: list[str] = []
+    workflow = _workflow(tmp_path, monkeypatch, FakeFactory(events, fail="gdrive"))
+
+    with pytest.raises(WorkflowError, match="gdrive"):
+        workflow._process_single_paper(PAPER, None)
+
+    assert sorted(events) == ["discord", "summarize", "zotero"]
+
+
+def test_pdf_truncation_is_logged(tmp_path, make_pdf, caplog):
+    settings = Settings(base_dir=tmp_path, pdf_max_pages=1, text_preprocessors=[])
+    workflow = WorkflowService(settings, None, logging.getLogger("test"))  # type: ignore[arg-type]
+    pdf_path = make_pdf(["one", "two"])
+
+    with caplog.at_level(logging.WARNING):
+        text = workflow._extract_text(PAPER, str(pdf_path))
+
+    assert "two" not in text
+    assert "PDF text extraction truncated" in caplog.text